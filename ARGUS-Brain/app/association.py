@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+import uuid
+from typing import Any
+
+_UNGATED = 1e12
+
+
+def _hungarian(cost: list[list[float]]) -> list[int]:
+    """Minimum-cost assignment for ``rows <= cols``; returns the column of each row.
+
+    Shortest augmenting path form of the Hungarian algorithm, O(rows^2 * cols).
+    """
+    rows, cols = len(cost), len(cost[0])
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (cols + 1)
+    owner = [0] * (cols + 1)  # owner[j] = 1-based row assigned to column j
+    way = [0] * (cols + 1)
+    for row in range(1, rows + 1):
+        owner[0] = row
+        j0 = 0
+        minv = [math.inf] * (cols + 1)
+        used = [False] * (cols + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            row_cost = cost[i0 - 1]
+            u_i0 = u[i0]
+            delta = math.inf
+            j1 = 0
+            for j in range(1, cols + 1):
+                if used[j]:
+                    continue
+                current = row_cost[j - 1] - u_i0 - v[j]
+                if current < minv[j]:
+                    minv[j] = current
+                    way[j] = j0
+                if minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in range(cols + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+    assignment = [-1] * rows
+    for j in range(1, cols + 1):
+        if owner[j]:
+            assignment[owner[j] - 1] = j - 1
+    return assignment
+
+
+class _SyntheticTrack:
+    __slots__ = ("track_id", "x", "y", "z", "vx", "vy", "vz", "last_ms")
+
+    def __init__(self, track_id: str, position: dict[str, float], velocity: dict[str, float], now_ms: int) -> None:
+        self.track_id = track_id
+        self.x, self.y, self.z = position["x"], position["y"], position["z"]
+        self.vx, self.vy, self.vz = velocity["x"], velocity["y"], velocity["z"]
+        self.last_ms = now_ms
+
+    def predict(self, now_ms: int) -> tuple[float, float, float]:
+        dt = (now_ms - self.last_ms) / 1000.0
+        return (self.x + self.vx * dt, self.y + self.vy * dt, self.z + self.vz * dt)
+
+    def correct(self, position: dict[str, float], velocity: dict[str, float], now_ms: int, smoothing: float) -> None:
+        dt = (now_ms - self.last_ms) / 1000.0
+        x, y, z = position["x"], position["y"], position["z"]
+        if velocity["x"] or velocity["y"] or velocity["z"]:
+            self.vx, self.vy, self.vz = velocity["x"], velocity["y"], velocity["z"]
+        elif dt > 0:
+            # No reported velocity: smooth the finite difference between associations.
+            keep = 1.0 - smoothing
+            self.vx = keep * self.vx + smoothing * (x - self.x) / dt
+            self.vy = keep * self.vy + smoothing * (y - self.y) / dt
+            self.vz = keep * self.vz + smoothing * (z - self.z) / dt
+        self.x, self.y, self.z = x, y, z
+        self.last_ms = now_ms
+
+
+class DetectionAssociator:
+    """Gives id-less detections stable synthetic track ids across frames.
+
+    Each source keeps its own synthetic tracks. Per frame, every track is predicted to the
+    frame time (constant velocity) and hashed into an x/y grid with ``gate_m`` cells, so each
+    detection only meets tracks in its 3x3 neighbourhood and only pairs within ``gate_m``
+    (3-D distance) become candidates. Candidates split into connected components; each is
+    solved optimally (Hungarian, minimum total distance with ``gate_m`` as the cost of
+    leaving a detection unmatched), falling back to greedy nearest-first for components
+    larger than ``exact_limit``. Work is O(n log n) for bounded local density instead of
+    O(n^2). Unmatched detections start new tracks; tracks unseen for ``coast_ms`` are dropped.
+    """
+
+    def __init__(
+        self,
+        gate_m: float = 75.0,
+        coast_ms: int = 2000,
+        max_tracks: int = 20000,
+        exact_limit: int = 48,
+        velocity_smoothing: float = 0.5,
+    ) -> None:
+        self.gate_m = max(float(gate_m), 1e-3)
+        self.coast_ms = coast_ms
+        self.max_tracks = max_tracks
+        self.exact_limit = exact_limit
+        self.velocity_smoothing = velocity_smoothing
+        self._sources: dict[str, dict[str, _SyntheticTrack]] = {}
+        self._prefix = uuid.uuid4().hex[:3].upper()
+        self._next_id = 0
+        self.matched = 0
+        self.created = 0
+        self.expired = 0
+        self.greedy_components = 0
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return f"TRK-{self._prefix}{self._next_id:05X}"
+
+    def associate(self, source_id: str, detections: list[dict[str, Any]], now_ms: int) -> None:
+        """Set ``id`` on each normalized detection (``position``/``velocity`` dicts) in place."""
+        tracks = self._sources.setdefault(source_id, {})
+        self._expire(tracks, now_ms)
+        if not detections:
+            return
+
+        track_list = list(tracks.values())
+        pairs = self._gated_pairs(track_list, detections, now_ms)
+        assignment = self._assign(pairs, len(detections))
+
+        for index, detection in enumerate(detections):
+            track_index = assignment.get(index)
+            if track_index is None:
+                track = _SyntheticTrack(self._new_id(), detection["position"], detection["velocity"], now_ms)
+                tracks[track.track_id] = track
+                self.created += 1
+            else:
+                track = track_list[track_index]
+                track.correct(detection["position"], detection["velocity"], now_ms, self.velocity_smoothing)
+                self.matched += 1
+            detection["id"] = track.track_id
+
+        while len(tracks) > self.max_tracks:
+            # Dict order is creation order: the oldest synthetic tracks go first.
+            del tracks[next(iter(tracks))]
+            self.expired += 1
+
+    def _expire(self, tracks: dict[str, _SyntheticTrack], now_ms: int) -> None:
+        cutoff = now_ms - self.coast_ms
+        for track_id in [track_id for track_id, track in tracks.items() if track.last_ms < cutoff]:
+            del tracks[track_id]
+            self.expired += 1
+
+    def _gated_pairs(
+        self,
+        tracks: list[_SyntheticTrack],
+        detections: list[dict[str, Any]],
+        now_ms: int,
+    ) -> list[tuple[float, int, int]]:
+        """``(distance, detection, track)`` for every pair inside the gate."""
+        gate = self.gate_m
+        grid: dict[tuple[int, int], list[tuple[int, float, float, float]]] = {}
+        for track_index, track in enumerate(tracks):
+            x, y, z = track.predict(now_ms)
+            grid.setdefault((math.floor(x / gate), math.floor(y / gate)), []).append((track_index, x, y, z))
+
+        pairs: list[tuple[float, int, int]] = []
+        if not grid:
+            return pairs
+        gate_sq = gate * gate
+        for detection_index, detection in enumerate(detections):
+            position = detection["position"]
+            x, y, z = position["x"], position["y"], position["z"]
+            cx, cy = math.floor(x / gate), math.floor(y / gate)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for track_index, tx, ty, tz in grid.get((cx + dx, cy + dy), ()):
+                        distance_sq = (tx - x) ** 2 + (ty - y) ** 2 + (tz - z) ** 2
+                        if distance_sq <= gate_sq:
+                            pairs.append((math.sqrt(distance_sq), detection_index, track_index))
+        return pairs
+
+    def _assign(self, pairs: list[tuple[float, int, int]], detection_count: int) -> dict[int, int]:
+        """Detection index -> track index for the optimal (or greedy) matching of ``pairs``."""
+        if not pairs:
+            return {}
+        # Union-find over detections (0..n-1) and tracks (n..) to split independent clusters.
+        parent: dict[int, int] = {}
+
+        def find(node: int) -> int:
+            root = node
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        for _, detection_index, track_index in pairs:
+            a, b = find(detection_index), find(detection_count + track_index)
+            if a != b:
+                parent[a] = b
+
+        components: dict[int, list[tuple[float, int, int]]] = {}
+        for pair in pairs:
+            components.setdefault(find(pair[1]), []).append(pair)
+
+        assignment: dict[int, int] = {}
+        for component in components.values():
+            if len(component) == 1:
+                _, detection_index, track_index = component[0]
+                assignment[detection_index] = track_index
+                continue
+            detection_ids = sorted({pair[1] for pair in component})
+            track_ids = sorted({pair[2] for pair in component})
+            if len(detection_ids) > self.exact_limit or len(track_ids) > self.exact_limit:
+                self.greedy_components += 1
+                assignment.update(self._greedy(component))
+            else:
+                assignment.update(self._optimal(component, detection_ids, track_ids))
+        return assignment
+
+    def _optimal(
+        self,
+        component: list[tuple[float, int, int]],
+        detection_ids: list[int],
+        track_ids: list[int],
+    ) -> dict[int, int]:
+        row_of = {detection_index: row for row, detection_index in enumerate(detection_ids)}
+        column_of = {track_index: column for column, track_index in enumerate(track_ids)}
+        rows, tracks = len(detection_ids), len(track_ids)
+        # Columns past the tracks are "unmatched" slots costing one gate each, so a pair is only
+        # worth matching when it beats leaving the detection unassigned.
+        cost = [[_UNGATED] * tracks + [self.gate_m] * rows for _ in range(rows)]
+        for distance, detection_index, track_index in component:
+            cost[row_of[detection_index]][column_of[track_index]] = distance
+        result: dict[int, int] = {}
+        for row, column in enumerate(_hungarian(cost)):
+            if 0 <= column < tracks and cost[row][column] < _UNGATED:
+                result[detection_ids[row]] = track_ids[column]
+        return result
+
+    @staticmethod
+    def _greedy(component: list[tuple[float, int, int]]) -> dict[int, int]:
+        result: dict[int, int] = {}
+        taken: set[int] = set()
+        for _, detection_index, track_index in sorted(component):
+            if detection_index in result or track_index in taken:
+                continue
+            result[detection_index] = track_index
+            taken.add(track_index)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tracks": sum(len(tracks) for tracks in self._sources.values()),
+            "gateM": self.gate_m,
+            "coastMs": self.coast_ms,
+            "matched": self.matched,
+            "created": self.created,
+            "expired": self.expired,
+            "greedyComponents": self.greedy_components,
+        }
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import time
+import traceback
+from typing import Any, Awaitable, Callable
+
+# Keep this module stdlib-only: it runs before FastAPI/httpx are imported.
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class StartupProfiler:
+    """Records wall-clock startup phases relative to process bootstrap."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.spawn_to_bootstrap_ms: float | None = None
+        spawned_at_ms = os.getenv("RADAR_SPAWNED_AT_MS")
+        if spawned_at_ms:
+            try:
+                self.spawn_to_bootstrap_ms = round(time.time() * 1000.0 - float(spawned_at_ms), 3)
+            except ValueError:
+                self.spawn_to_bootstrap_ms = None
+        self._last = self.started_at
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000.0, 3)
+        self._last = now
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000.0, 3)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "spawnToBootstrapMs": self.spawn_to_bootstrap_ms,
+            "phasesMs": dict(self.phases),
+            "sinceBootstrapMs": self.elapsed_ms(),
+        }
+
+    def report(self, label: str) -> None:
+        phases = " ".join(f"{name}={value:.1f}ms" for name, value in self.phases.items())
+        print(f"[startup] {label} after {self.elapsed_ms():.1f}ms: {phases}", flush=True)
+
+
+STARTUP = StartupProfiler()
+
+
+class LazyAppLoader:
+    """ASGI shim that starts listening before the real application module is imported.
+
+    While the target module (FastAPI app, httpx, models) is imported in a worker thread,
+    ``/healthz`` answers ``{"status": "warming"}`` and every other route returns 503.
+    If the import or startup fails, ``/healthz`` answers 503 with ``{"status": "failed"}``
+    so health checks never mistake a dead shim for a running service.
+    The target module must expose ``app``, ``on_startup`` and ``on_shutdown``.
+    """
+
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self._app: Callable[..., Awaitable[None]] | None = None
+        self._module: Any = None
+        self._load_task: asyncio.Task | None = None
+        self._load_error = ""
+
+    async def _load(self) -> None:
+        try:
+            module = await asyncio.to_thread(importlib.import_module, self.module_name)
+            STARTUP.mark("app_import")
+            await module.on_startup()
+        except Exception as error:
+            # Handled here rather than re-raised: nothing awaits this task until shutdown, so a
+            # re-raised error would only surface as "Task exception was never retrieved".
+            self._load_error = f"{type(error).__name__}: {error}"
+            print(f"[startup] failed to load {self.module_name}: {self._load_error}", flush=True)
+            traceback.print_exc()
+            return
+        self._module = module
+        self._app = module.app
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                STARTUP.mark("server_listen")
+                self._load_task = asyncio.create_task(self._load())
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._load_task is not None and not self._load_task.done():
+                    await self._load_task
+                if self._module is not None:
+                    await self._module.on_shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _respond(self, send: Send, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+        if status == 503:
+            headers.append((b"retry-after", b"1"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if self._app is not None:
+            await self._app(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope.get("path") == "/healthz":
+            await self._respond(
+                send,
+                503 if self._load_error else 200,
+                {
+                    "status": "failed" if self._load_error else "warming",
+                    "sourceConnected": False,
+                    "lastError": self._load_error,
+                    "startup": STARTUP.to_dict(),
+                },
+            )
+            return
+        detail = f"ARGUS-Brain failed to start: {self._load_error}" if self._load_error else "ARGUS-Brain is warming up"
+        await self._respond(send, 503, {"detail": detail})
+
+
+def serve(module_name: str, host: str, port: int) -> None:
+    import uvicorn
+
+    STARTUP.mark("uvicorn_import")
+    uvicorn.run(
+        LazyAppLoader(module_name),
+        host=host,
+        port=port,
+        reload=False,
+        log_level="info",
+        lifespan="on",
+        # The service exposes no websocket routes; skip importing the websocket stack.
+        ws="none",
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, replace
 
 
 def _to_int(value: str | None, fallback: int) -> int:
@@ -24,6 +25,62 @@ def _to_float(value: str | None, fallback: float) -> float:
     return parsed
 
 
+def _to_sources(value: str | None) -> list["SourceConfig"]:
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value)
+        if not isinstance(parsed, list):
+            raise ValueError("expected a JSON list")
+        return SourceConfig.list_from_dicts(parsed)
+    except ValueError as error:
+        # An empty list falls back to RADAR_ARGUS_SOURCE_URL, same as when the variable is unset.
+        print(f"[config] ignoring RADAR_ARGUS_SOURCES: {error}", flush=True)
+        return []
+
+
+@dataclass
+class SourceConfig:
+    source_id: str
+    url: str
+    auth_token: str = ""
+    timeout_ms: int = 1000
+
+    @classmethod
+    def from_dict(cls, raw: dict, index: int = 0) -> "SourceConfig":
+        url = str(raw.get("url") or "").strip()
+        if not url:
+            raise ValueError(f"source #{index} is missing url")
+        return cls(
+            source_id=str(raw.get("id") or f"source-{index + 1}").strip(),
+            url=url,
+            auth_token=str(raw.get("authToken") or ""),
+            timeout_ms=max(100, _to_int(str(raw.get("timeoutMs", 1000)), 1000)),
+        )
+
+    @classmethod
+    def list_from_dicts(cls, raw_sources: list) -> list["SourceConfig"]:
+        sources: list[SourceConfig] = []
+        seen: set[str] = set()
+        for index, raw in enumerate(raw_sources):
+            if not isinstance(raw, dict):
+                raise ValueError(f"source #{index} must be an object")
+            source = cls.from_dict(raw, index)
+            if source.source_id in seen:
+                raise ValueError(f"duplicate source id: {source.source_id}")
+            seen.add(source.source_id)
+            sources.append(source)
+        return sources
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.source_id,
+            "url": self.url,
+            "authToken": "***" if self.auth_token else "",
+            "timeoutMs": self.timeout_ms,
+        }
+
+
 @dataclass
 class ServiceConfig:
     host: str = "127.0.0.1"
@@ -36,6 +93,27 @@ class ServiceConfig:
     feature_window_ms: int = 2000
     model_path: str = ""
     active_model_id: str = "heuristic-default"
+    shard_workers: int = 0
+    argus_sources: list[SourceConfig] = field(default_factory=list)
+    dedup_radius_m: float = 25.0
+    source_stale_ms: int = 1500
+    poll_backoff_max_ms: int = 5000
+    snapshot_path: str = ""
+    snapshot_interval_ms: int = 5000
+    eye_features_enabled: bool = False
+    eye_feature_max_age_ms: int = 2000
+    eye_feature_cache_tracks: int = 4096
+    event_capacity: int = 10000
+    event_max_per_object: int = 200
+    event_rate_window_ms: int = 10000
+    event_rate_limit: int = 3
+    spatial_cell_m: float = 1000.0
+    association_gate_m: float = 75.0
+    association_coast_ms: int = 2000
+    overload_enabled: bool = True
+    overload_far_range_m: float = 20000.0
+    history_retention_ms: int = 1_800_000
+    history_max_mb: int = 64
 
     @classmethod
     def from_env(cls) -> "ServiceConfig":
@@ -52,8 +130,49 @@ class ServiceConfig:
             feature_window_ms=_to_int(os.getenv("RADAR_FEATURE_WINDOW_MS"), 2000),
             model_path=os.getenv("RADAR_MODEL_PATH", ""),
             active_model_id=os.getenv("RADAR_ACTIVE_MODEL_ID", "heuristic-default"),
+            shard_workers=max(0, _to_int(os.getenv("RADAR_SHARD_WORKERS"), 0)),
+            argus_sources=_to_sources(os.getenv("RADAR_ARGUS_SOURCES")),
+            dedup_radius_m=_to_float(os.getenv("RADAR_DEDUP_RADIUS_M"), 25.0),
+            source_stale_ms=_to_int(os.getenv("RADAR_SOURCE_STALE_MS"), 1500),
+            poll_backoff_max_ms=_to_int(os.getenv("RADAR_POLL_BACKOFF_MAX_MS"), 5000),
+            snapshot_path=os.getenv("RADAR_SNAPSHOT_PATH", ""),
+            snapshot_interval_ms=_to_int(os.getenv("RADAR_SNAPSHOT_INTERVAL_MS"), 5000),
+            eye_features_enabled=os.getenv("RADAR_EYE_FEATURES", "0").strip().lower() in {"1", "true", "yes", "on"},
+            eye_feature_max_age_ms=_to_int(os.getenv("RADAR_EYE_FEATURE_MAX_AGE_MS"), 2000),
+            eye_feature_cache_tracks=max(1, _to_int(os.getenv("RADAR_EYE_FEATURE_CACHE_TRACKS"), 4096)),
+            event_capacity=max(1, _to_int(os.getenv("RADAR_EVENT_CAPACITY"), 10000)),
+            event_max_per_object=max(1, _to_int(os.getenv("RADAR_EVENT_MAX_PER_OBJECT"), 200)),
+            event_rate_window_ms=max(0, _to_int(os.getenv("RADAR_EVENT_RATE_WINDOW_MS"), 10000)),
+            event_rate_limit=max(0, _to_int(os.getenv("RADAR_EVENT_RATE_LIMIT"), 3)),
+            spatial_cell_m=max(1.0, _to_float(os.getenv("RADAR_SPATIAL_CELL_M"), 1000.0)),
+            association_gate_m=max(1.0, _to_float(os.getenv("RADAR_ASSOCIATION_GATE_M"), 75.0)),
+            association_coast_ms=max(0, _to_int(os.getenv("RADAR_ASSOCIATION_COAST_MS"), 2000)),
+            overload_enabled=os.getenv("RADAR_OVERLOAD", "1").strip().lower() in {"1", "true", "yes", "on"},
+            overload_far_range_m=max(0.0, _to_float(os.getenv("RADAR_OVERLOAD_FAR_RANGE_M"), 20000.0)),
+            history_retention_ms=max(0, _to_int(os.getenv("RADAR_HISTORY_RETENTION_MS"), 1_800_000)),
+            history_max_mb=max(1, _to_int(os.getenv("RADAR_HISTORY_MAX_MB"), 64)),
         )
 
+    def resolved_sources(self) -> list[SourceConfig]:
+        if self.argus_sources:
+            return [
+                SourceConfig(
+                    source_id=source.source_id,
+                    url=source.url,
+                    auth_token=source.auth_token or self.argus_auth_token,
+                    timeout_ms=source.timeout_ms,
+                )
+                for source in self.argus_sources
+            ]
+        return [
+            SourceConfig(
+                source_id="primary",
+                url=self.argus_source_url,
+                auth_token=self.argus_auth_token,
+                timeout_ms=self.request_timeout_ms,
+            )
+        ]
+
     def to_dict(self) -> dict:
         return {
             "host": self.host,
@@ -66,9 +185,37 @@ class ServiceConfig:
             "featureWindowMs": self.feature_window_ms,
             "modelPath": self.model_path,
             "activeModelId": self.active_model_id,
+            "shardWorkers": self.shard_workers,
+            "argusSources": [source.to_dict() for source in self.argus_sources],
+            "dedupRadiusM": self.dedup_radius_m,
+            "sourceStaleMs": self.source_stale_ms,
+            "pollBackoffMaxMs": self.poll_backoff_max_ms,
+            "snapshotPath": self.snapshot_path,
+            "snapshotIntervalMs": self.snapshot_interval_ms,
+            "eyeFeaturesEnabled": self.eye_features_enabled,
+            "eyeFeatureMaxAgeMs": self.eye_feature_max_age_ms,
+            "eyeFeatureCacheTracks": self.eye_feature_cache_tracks,
+            "eventCapacity": self.event_capacity,
+            "eventMaxPerObject": self.event_max_per_object,
+            "eventRateWindowMs": self.event_rate_window_ms,
+            "eventRateLimit": self.event_rate_limit,
+            "spatialCellM": self.spatial_cell_m,
+            "associationGateM": self.association_gate_m,
+            "associationCoastMs": self.association_coast_ms,
+            "overloadEnabled": self.overload_enabled,
+            "overloadFarRangeM": self.overload_far_range_m,
+            "historyRetentionMs": self.history_retention_ms,
+            "historyMaxMb": self.history_max_mb,
         }
 
     def apply_patch(self, patch: dict) -> None:
+        # Patch a copy first so an invalid value leaves this config untouched.
+        patched = replace(self)
+        patched._assign_patch(patch)
+        for item in fields(self):
+            setattr(self, item.name, getattr(patched, item.name))
+
+    def _assign_patch(self, patch: dict) -> None:
         if "argusSourceUrl" in patch:
             self.argus_source_url = str(patch["argusSourceUrl"])
         if "argusAuthToken" in patch:
@@ -85,3 +232,29 @@ class ServiceConfig:
             self.model_path = str(patch["modelPath"] or "")
         if "activeModelId" in patch:
             self.active_model_id = str(patch["activeModelId"] or "heuristic-default")
+        if "argusSources" in patch:
+            self.argus_sources = SourceConfig.list_from_dicts(list(patch["argusSources"] or []))
+        if "dedupRadiusM" in patch:
+            self.dedup_radius_m = max(0.0, float(patch["dedupRadiusM"]))
+        if "sourceStaleMs" in patch:
+            self.source_stale_ms = max(0, int(patch["sourceStaleMs"]))
+        if "pollBackoffMaxMs" in patch:
+            self.poll_backoff_max_ms = max(self.poll_interval_ms, int(patch["pollBackoffMaxMs"]))
+        if "eyeFeaturesEnabled" in patch:
+            self.eye_features_enabled = bool(patch["eyeFeaturesEnabled"])
+        if "eyeFeatureMaxAgeMs" in patch:
+            self.eye_feature_max_age_ms = max(0, int(patch["eyeFeatureMaxAgeMs"]))
+        if "eventRateWindowMs" in patch:
+            self.event_rate_window_ms = max(0, int(patch["eventRateWindowMs"]))
+        if "eventRateLimit" in patch:
+            self.event_rate_limit = max(0, int(patch["eventRateLimit"]))
+        if "associationGateM" in patch:
+            self.association_gate_m = max(1.0, float(patch["associationGateM"]))
+        if "associationCoastMs" in patch:
+            self.association_coast_ms = max(0, int(patch["associationCoastMs"]))
+        if "overloadEnabled" in patch:
+            self.overload_enabled = bool(patch["overloadEnabled"])
+        if "overloadFarRangeM" in patch:
+            self.overload_far_range_m = max(0.0, float(patch["overloadFarRangeM"]))
+        if "historyRetentionMs" in patch:
+            self.history_retention_ms = max(0, int(patch["historyRetentionMs"]))
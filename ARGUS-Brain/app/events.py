@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import bisect
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+
+class _TimeIndex:
+    """Append-only (timestamp, seq) list with a moving head; bisectable, O(1) amortized pops."""
+
+    __slots__ = ("times", "seqs", "head")
+
+    def __init__(self) -> None:
+        self.times: list[int] = []
+        self.seqs: list[int] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def append(self, timestamp_ms: int, seq: int) -> None:
+        self.times.append(timestamp_ms)
+        self.seqs.append(seq)
+
+    def oldest_seq(self) -> int:
+        return self.seqs[self.head]
+
+    def pop_oldest(self) -> int:
+        seq = self.seqs[self.head]
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.seqs):
+            del self.times[: self.head]
+            del self.seqs[: self.head]
+            self.head = 0
+        return seq
+
+    def start_for_time(self, since_ms: int) -> int:
+        return bisect.bisect_left(self.times, since_ms, lo=self.head)
+
+    def start_after_seq(self, cursor: int) -> int:
+        return bisect.bisect_right(self.seqs, cursor, lo=self.head)
+
+
+class _IsoClock:
+    """``%Y-%m-%dT%H:%M:%SZ`` formatted once per second instead of once per event."""
+
+    def __init__(self) -> None:
+        self._second = -1
+        self._text = ""
+
+    def format(self, timestamp_ms: int) -> str:
+        second = timestamp_ms // 1000
+        if second != self._second:
+            self._second = second
+            self._text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        return self._text
+
+
+class EventStore:
+    """Bounded, indexed store of published events.
+
+    Events live in a ring of ``capacity`` entries (oldest evicted first) with secondary
+    time-ordered indexes per ``objectId`` and per ``type``. Each event gets a monotonically
+    increasing ``seq``; queries bisect into the narrowest matching index, so they cost
+    O(log n + k) instead of a scan. An object keeps at most ``max_per_object`` events.
+
+    Repeated events of one (objectId, type) are rate-limited: at most ``rate_limit``
+    per ``rate_window_ms``; the rest are counted as suppressed and not stored.
+
+    Upstream events carry their own ``event_id`` and sources resend them every frame; an id
+    seen among the last ``capacity`` upstream ids is counted as a duplicate and skipped.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        max_per_object: int = 200,
+        rate_window_ms: int = 10000,
+        rate_limit: int = 3,
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.max_per_object = max(1, max_per_object)
+        self.rate_window_ms = rate_window_ms
+        self.rate_limit = rate_limit
+        self._events: dict[int, dict[str, Any]] = {}
+        self._all = _TimeIndex()
+        self._by_object: dict[str, _TimeIndex] = {}
+        self._by_type: dict[str, _TimeIndex] = {}
+        self._recent: dict[tuple[str, str], deque[int]] = {}
+        self._upstream_ids: OrderedDict[str, None] = OrderedDict()
+        self._seq = 0
+        self._last_ms = 0
+        # Ids stay unique across restarts without a uuid per event.
+        self._id_prefix = f"evt-{int(time.time() * 1000) % 0xFFFFFFFF:08x}{os.getpid() % 0xFFFF:04x}"
+        self._clock = _IsoClock()
+        self.suppressed = 0
+        self.duplicates = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _rate_limited(self, object_id: str, event_type: str, now_ms: int) -> bool:
+        if not object_id or self.rate_limit <= 0:
+            return False
+        key = (object_id, event_type)
+        recent = self._recent.get(key)
+        if recent is None:
+            recent = self._recent[key] = deque()
+        cutoff = now_ms - self.rate_window_ms
+        while recent and recent[0] <= cutoff:
+            recent.popleft()
+        if len(recent) >= self.rate_limit:
+            return True
+        recent.append(now_ms)
+        if len(self._recent) > self.capacity:
+            self._prune_rate_limits(cutoff)
+        return False
+
+    def _prune_rate_limits(self, cutoff: int) -> None:
+        for key in [key for key, recent in self._recent.items() if not recent or recent[-1] <= cutoff]:
+            del self._recent[key]
+
+    def add(
+        self,
+        event_type: str,
+        message: str,
+        object_id: str = "",
+        object_class: str = "UNKNOWN",
+        timestamp_ms: int | None = None,
+        event_id: str = "",
+        timestamp: str = "",
+    ) -> dict[str, Any] | None:
+        """Store one event; returns it, or ``None`` when rate-limited or already stored."""
+        if event_id:
+            if event_id in self._upstream_ids:
+                self.duplicates += 1
+                return None
+            self._upstream_ids[event_id] = None
+            if len(self._upstream_ids) > self.capacity:
+                self._upstream_ids.popitem(last=False)
+        now_ms = int(time.time() * 1000) if timestamp_ms is None else timestamp_ms
+        # Indexes are bisected by time, so a wall-clock step backwards must not reorder them.
+        now_ms = max(now_ms, self._last_ms)
+        self._last_ms = now_ms
+        if self._rate_limited(object_id, event_type, now_ms):
+            self.suppressed += 1
+            return None
+
+        self._seq += 1
+        seq = self._seq
+        event = {
+            "id": event_id or f"{self._id_prefix}-{seq}",
+            "seq": seq,
+            "timestamp": timestamp or self._clock.format(now_ms),
+            "timestampMs": now_ms,
+            "type": event_type,
+            "message": message,
+            "objectId": object_id,
+            "objectClass": object_class,
+        }
+        self._events[seq] = event
+        self._all.append(now_ms, seq)
+        self._by_type.setdefault(event_type, _TimeIndex()).append(now_ms, seq)
+        if object_id:
+            index = self._by_object.setdefault(object_id, _TimeIndex())
+            index.append(now_ms, seq)
+            if len(index) > self.max_per_object:
+                self._forget(index.oldest_seq())
+
+        # The ring bound counts index entries (including forgotten ones), so memory is
+        # capped even when per-object eviction leaves holes.
+        while len(self._all) > self.capacity:
+            self._forget(self._all.oldest_seq())
+        return event
+
+    def _forget(self, seq: int) -> None:
+        # Index entries of a forgotten event are popped when they reach an index head and
+        # skipped on read until then.
+        event = self._events.pop(seq, None)
+        if event is not None:
+            self.evicted += 1
+            self._trim(self._by_type, event["type"])
+            if event["objectId"]:
+                self._trim(self._by_object, event["objectId"])
+        while len(self._all) and self._all.oldest_seq() not in self._events:
+            self._all.pop_oldest()
+
+    def _trim(self, indexes: dict[str, _TimeIndex], key: str) -> None:
+        index = indexes.get(key)
+        if index is None:
+            return
+        while len(index) and index.oldest_seq() not in self._events:
+            index.pop_oldest()
+        if not len(index):
+            del indexes[key]
+
+    def query(
+        self,
+        since_ms: int | None = None,
+        object_id: str | None = None,
+        event_type: str | None = None,
+        cursor: int | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Events in insertion order matching every given filter, at most ``limit``.
+
+        ``since_ms`` is an inclusive ``timestampMs`` bound; ``cursor`` returns events after
+        that ``seq`` (exact resume point for pollers).
+        """
+        candidates: list[_TimeIndex] = [self._all]
+        if object_id is not None:
+            candidates.append(self._by_object.get(object_id) or _TimeIndex())
+        if event_type is not None:
+            candidates.append(self._by_type.get(event_type) or _TimeIndex())
+        index = min(candidates, key=len)
+
+        start = index.head
+        if since_ms is not None:
+            start = max(start, index.start_for_time(since_ms))
+        if cursor is not None:
+            start = max(start, index.start_after_seq(cursor))
+
+        results: list[dict[str, Any]] = []
+        for position in range(start, len(index.seqs)):
+            event = self._events.get(index.seqs[position])
+            if event is None:
+                continue
+            if object_id is not None and event["objectId"] != object_id:
+                continue
+            if event_type is not None and event["type"] != event_type:
+                continue
+            results.append(event)
+            if len(results) >= limit:
+                break
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "stored": len(self._events),
+            "capacity": self.capacity,
+            "maxPerObject": self.max_per_object,
+            "objects": len(self._by_object),
+            "lastSeq": self._seq,
+            "evicted": self.evicted,
+            "suppressed": self.suppressed,
+            "duplicates": self.duplicates,
+            "rateWindowMs": self.rate_window_ms,
+            "rateLimit": self.rate_limit,
+        }
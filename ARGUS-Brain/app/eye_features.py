@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import Any, Mapping
+
+# Signal features produced by ARGUS-Eye (time-domain + STFT), in the order they are packed
+# into the v2 feature vector. Missing keys (e.g. spectral stage disabled) pack as 0.0.
+EYE_FEATURE_KEYS: tuple[str, ...] = (
+    "rms",
+    "peak_to_peak",
+    "zero_crossing_rate",
+    "spectral_centroid_hz",
+    "spectral_bandwidth_hz",
+    "spectral_entropy",
+    "band_energy_0",
+    "band_energy_1",
+    "band_energy_2",
+    "band_energy_3",
+    "dominant_freq_hz_1",
+    "dominant_power_ratio_1",
+    "modulation_freq_hz",
+    "modulation_depth",
+)
+
+KINEMATIC_FEATURE_NAMES: tuple[str, ...] = (
+    "speed",
+    "distance",
+    "confidence",
+    "avg_speed",
+    "speed_span",
+    "window_samples",
+)
+
+KINEMATIC_V1 = "kinematic-v1"
+KINEMATIC_EYE_V2 = "kinematic-eye-v2"
+
+# Layout id -> feature names. v1 is the original six-value vector and must never change.
+FEATURE_LAYOUTS: dict[str, tuple[str, ...]] = {
+    KINEMATIC_V1: KINEMATIC_FEATURE_NAMES,
+    KINEMATIC_EYE_V2: KINEMATIC_FEATURE_NAMES + ("eye_present", "eye_age_ms") + EYE_FEATURE_KEYS,
+}
+
+_MISSING_EYE_FEATURES: tuple[float, ...] = (0.0,) * len(EYE_FEATURE_KEYS)
+
+
+def _to_float(value: Any, fallback: float = 0.0) -> float:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return fallback
+    if math.isnan(parsed) or math.isinf(parsed):
+        return fallback
+    return parsed
+
+
+def resolve_feature_layout(predictor: Any, requested: str | None = None) -> str:
+    """Pick the feature layout a model was trained on.
+
+    An explicit ``requested`` layout wins; otherwise a predictor attribute
+    ``argus_feature_layout`` is honoured, then scikit-learn's ``n_features_in_`` is matched
+    against layout widths. Anything else stays on the legacy six-value layout.
+    """
+    if requested:
+        if requested not in FEATURE_LAYOUTS:
+            raise ValueError(f"unknown feature layout: {requested}")
+        return requested
+    declared = getattr(predictor, "argus_feature_layout", None)
+    if isinstance(declared, str) and declared in FEATURE_LAYOUTS:
+        return declared
+    width = getattr(predictor, "n_features_in_", None)
+    for layout, names in FEATURE_LAYOUTS.items():
+        if width == len(names):
+            return layout
+    return KINEMATIC_V1
+
+
+def eye_vector(eye_features: tuple[float, ...] | None, eye_timestamp_ms: int, now_ms: int) -> list[float]:
+    """``eye_present``, ``eye_age_ms`` and the packed Eye values for the v2 layout."""
+    if eye_features is None:
+        return [0.0, 0.0, *_MISSING_EYE_FEATURES]
+    return [1.0, float(max(0, now_ms - eye_timestamp_ms)), *eye_features]
+
+
+class EyeFeatureCache:
+    """Latest ARGUS-Eye features per track, packed once on arrival.
+
+    The Brain hot path only does a dict lookup and a staleness check; Eye features are never
+    recomputed here. Bounded to ``max_tracks`` (least recently updated evicted first).
+
+    Track ids are the published object ids, so with several sources they are the namespaced
+    ``source:id``. Non-numeric or non-finite values pack as 0.0, like a missing key.
+    """
+
+    def __init__(self, max_age_ms: int = 2000, max_tracks: int = 4096) -> None:
+        self.max_age_ms = max_age_ms
+        self.max_tracks = max_tracks
+        self._entries: OrderedDict[str, tuple[int, tuple[float, ...]]] = OrderedDict()
+        self.updates = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, track_id: str, features: Mapping[str, Any], timestamp_ms: int) -> None:
+        current = self._entries.get(track_id)
+        if current is not None and current[0] > timestamp_ms:
+            return
+        packed = tuple(_to_float(features.get(key)) for key in EYE_FEATURE_KEYS)
+        self._entries[track_id] = (int(timestamp_ms), packed)
+        self._entries.move_to_end(track_id)
+        self.updates += 1
+        while len(self._entries) > self.max_tracks:
+            self._entries.popitem(last=False)
+
+    def update_many(self, results: list[Mapping[str, Any]], default_timestamp_ms: int) -> int:
+        """Ingest ARGUS-Eye service results (``{"trackId", "timestampMs", "features"}``)."""
+        accepted = 0
+        for result in results:
+            track_id = str(result.get("trackId") or "")
+            features = result.get("features")
+            if not track_id or not isinstance(features, Mapping):
+                continue
+            try:
+                timestamp_ms = int(result.get("timestampMs") or default_timestamp_ms)
+            except (TypeError, ValueError, OverflowError):
+                continue
+            self.update(track_id, features, timestamp_ms)
+            accepted += 1
+        return accepted
+
+    def lookup(self, track_id: str, now_ms: int) -> tuple[int, tuple[float, ...]] | None:
+        entry = self._entries.get(track_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        if now_ms - entry[0] > self.max_age_ms:
+            self.stale += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def drop(self, track_id: str) -> None:
+        self._entries.pop(track_id, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tracks": len(self._entries),
+            "maxTracks": self.max_tracks,
+            "maxAgeMs": self.max_age_ms,
+            "updates": self.updates,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+        }
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import zlib
+from array import array
+from collections import deque
+from itertools import accumulate
+from typing import Any
+
+# Column order of a chunk, and the fixed-point scale each value is stored with.
+_COLUMNS = ("timestampMs", "x", "y", "z", "speed", "probability", "classCode")
+_SCALES = (1, 10, 10, 10, 100, 100, 1)  # ms, 0.1 m, 0.1 m, 0.1 m, 0.01 m/s, 0.01 %, index
+_CHUNK_OVERHEAD_BYTES = 120
+_OPEN_POINT_BYTES = 8 * len(_COLUMNS)
+
+
+class _Chunk:
+    __slots__ = ("track_id", "start_ms", "end_ms", "count", "blob")
+
+    def __init__(self, track_id: str, columns: list[array]) -> None:
+        self.track_id = track_id
+        self.start_ms = columns[0][0]
+        self.end_ms = columns[0][-1]
+        self.count = len(columns[0])
+        # Delta-encode every column (first value absolute) so slow-moving series become runs
+        # of small integers that zlib packs tightly.
+        packed = array("q")
+        for column in columns:
+            packed.append(column[0])
+            packed.extend(b - a for a, b in zip(column, column[1:]))
+        self.blob = zlib.compress(packed.tobytes(), 6)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.blob) + _CHUNK_OVERHEAD_BYTES
+
+    def decode(self) -> list[list[int]]:
+        packed = array("q")
+        packed.frombytes(zlib.decompress(self.blob))
+        count = self.count
+        return [list(accumulate(packed[index * count : (index + 1) * count])) for index in range(len(_COLUMNS))]
+
+
+class _TrackHistory:
+    __slots__ = ("chunks", "open", "last_ms")
+
+    def __init__(self) -> None:
+        self.chunks: deque[_Chunk] = deque()
+        self.open: list[array] = [array("q") for _ in _COLUMNS]
+        self.last_ms = 0
+
+
+def downsample_lttb(columns: list[list[float]], max_points: int) -> list[int]:
+    """Indexes kept by Largest-Triangle-Three-Buckets over several series at once.
+
+    ``columns[0]`` is the x axis (time). The triangle area of each candidate is summed over
+    the remaining series, each normalised by its range, so a point survives if it matters
+    for any of them (a turn in the trail, a speed spike, a probability change).
+    """
+    count = len(columns[0])
+    if max_points >= count or count <= 2:
+        return list(range(count))
+    if max_points < 3:
+        return [0, count - 1][:max(max_points, 0)]
+
+    times = columns[0]
+    series = []
+    for column in columns[1:]:
+        low, high = min(column), max(column)
+        if high > low:
+            series.append([(value - low) / (high - low) for value in column])
+    span = (times[-1] - times[0]) or 1
+    t = [(value - times[0]) / span for value in times]
+
+    kept = [0]
+    bucket = (count - 2) / (max_points - 2)
+    previous = 0
+    for index in range(max_points - 2):
+        start = int(index * bucket) + 1
+        end = int((index + 1) * bucket) + 1
+        next_end = min(int((index + 2) * bucket) + 1, count)
+        if index == max_points - 3:
+            next_start, next_end = count - 1, count
+        else:
+            next_start = end
+        width = next_end - next_start
+        avg_t = sum(t[next_start:next_end]) / width
+        averages = [sum(values[next_start:next_end]) / width for values in series]
+
+        best, best_area = start, -1.0
+        t_a = t[previous]
+        for candidate in range(start, end):
+            dt_next = avg_t - t_a
+            dt_candidate = t[candidate] - t_a
+            area = 0.0
+            for values, average in zip(series, averages):
+                area += abs(dt_next * (values[candidate] - values[previous]) - dt_candidate * (average - values[previous]))
+            if area > best_area:
+                best, best_area = candidate, area
+        kept.append(best)
+        previous = best
+    kept.append(count - 1)
+    return kept
+
+
+class TrackHistoryStore:
+    """In-memory per-track time series of position, speed and top-class probability.
+
+    Points are fixed-point quantised (0.1 m, 0.01 m/s, 0.01 %) and appended to an open
+    chunk per track; every ``chunk_points`` points (or when a track goes idle) the chunk is
+    sealed: delta-encoded per column and zlib-compressed. Sealed chunks are evicted oldest
+    first, both when they age past ``retention_ms`` and while the store exceeds
+    ``max_bytes``. Queries decode only chunks overlapping the requested window.
+    """
+
+    def __init__(
+        self,
+        retention_ms: int = 1_800_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        chunk_points: int = 128,
+        idle_seal_ms: int = 10_000,
+    ) -> None:
+        self.retention_ms = retention_ms
+        self.max_bytes = max_bytes
+        self.chunk_points = max(2, chunk_points)
+        self.idle_seal_ms = idle_seal_ms
+        self._tracks: dict[str, _TrackHistory] = {}
+        # Sealed chunks in seal order, which is also (per track exactly) end-time order.
+        self._sealed: deque[_Chunk] = deque()
+        self._class_codes: dict[str, int] = {}
+        self._class_names: list[str] = []
+        self.sealed_bytes = 0
+        self.open_points = 0
+        self.evicted_chunks = 0
+        self._last_maintenance_ms = 0
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    @property
+    def nbytes(self) -> int:
+        return self.sealed_bytes + self.open_points * _OPEN_POINT_BYTES
+
+    def append(
+        self,
+        track_id: str,
+        timestamp_ms: int,
+        x: float,
+        y: float,
+        z: float,
+        speed: float,
+        object_class: str,
+        probability: float,
+    ) -> None:
+        track = self._tracks.get(track_id)
+        if track is None:
+            track = self._tracks[track_id] = _TrackHistory()
+        elif timestamp_ms <= track.last_ms:
+            return
+        code = self._class_codes.get(object_class)
+        if code is None:
+            code = self._class_codes[object_class] = len(self._class_names)
+            self._class_names.append(object_class)
+
+        values = (timestamp_ms, x, y, z, speed, probability)
+        for column, value, scale in zip(track.open, values, _SCALES):
+            column.append(int(round(value * scale)))
+        track.open[-1].append(code)
+        track.last_ms = timestamp_ms
+        self.open_points += 1
+        if len(track.open[0]) >= self.chunk_points:
+            self._seal(track_id, track)
+
+    def _seal(self, track_id: str, track: _TrackHistory) -> None:
+        if not track.open[0]:
+            return
+        chunk = _Chunk(track_id, track.open)
+        self.open_points -= chunk.count
+        track.open = [array("q") for _ in _COLUMNS]
+        track.chunks.append(chunk)
+        self._sealed.append(chunk)
+        self.sealed_bytes += chunk.nbytes
+
+    def maintain(self, now_ms: int) -> None:
+        """Seal idle tracks and enforce retention and the memory cap (at most once a second)."""
+        if now_ms - self._last_maintenance_ms < 1000 and self.nbytes <= self.max_bytes:
+            return
+        self._last_maintenance_ms = now_ms
+        # Over the cap, compress sizeable open chunks early before dropping sealed history.
+        pressure = self.nbytes > self.max_bytes
+        idle_before = now_ms - self.idle_seal_ms
+        early_points = self.chunk_points // 4
+        for track_id, track in self._tracks.items():
+            open_points = len(track.open[0])
+            if open_points and (track.last_ms < idle_before or (pressure and open_points >= early_points)):
+                self._seal(track_id, track)
+
+        expire_before = now_ms - self.retention_ms
+        while self._sealed and (self._sealed[0].end_ms < expire_before or self.nbytes > self.max_bytes):
+            self._evict_oldest()
+        for track_id in [track_id for track_id, track in self._tracks.items() if not track.chunks and not track.open[0]]:
+            del self._tracks[track_id]
+
+    def _evict_oldest(self) -> None:
+        chunk = self._sealed.popleft()
+        track = self._tracks.get(chunk.track_id)
+        if track is not None and track.chunks and track.chunks[0] is chunk:
+            track.chunks.popleft()
+        self.sealed_bytes -= chunk.nbytes
+        self.evicted_chunks += 1
+
+    def query(
+        self,
+        track_id: str,
+        from_ms: int | None = None,
+        to_ms: int | None = None,
+        max_points: int = 500,
+    ) -> dict[str, Any] | None:
+        """Downsampled history of one track, or ``None`` if the track has no history."""
+        track = self._tracks.get(track_id)
+        if track is None:
+            return None
+        low = from_ms if from_ms is not None else -(1 << 62)
+        high = to_ms if to_ms is not None else 1 << 62
+
+        columns: list[list[int]] = [[] for _ in _COLUMNS]
+        blocks = [chunk.decode() for chunk in track.chunks if chunk.end_ms >= low and chunk.start_ms <= high]
+        if track.open[0] and track.open[0][-1] >= low and track.open[0][0] <= high:
+            blocks.append([list(column) for column in track.open])
+        for block in blocks:
+            times = block[0]
+            keep = [index for index, value in enumerate(times) if low <= value <= high]
+            if len(keep) == len(times):
+                for target, source in zip(columns, block):
+                    target.extend(source)
+            else:
+                for target, source in zip(columns, block):
+                    target.extend(source[index] for index in keep)
+
+        total = len(columns[0])
+        # Downsample on the quantised integers; only the kept points are converted back.
+        indexes = downsample_lttb(columns[:6], max_points)
+        points = [
+            {
+                "timestampMs": columns[0][index],
+                "x": columns[1][index] / 10,
+                "y": columns[2][index] / 10,
+                "z": columns[3][index] / 10,
+                "speed": columns[4][index] / 100,
+                "class": self._class_names[columns[6][index]],
+                "topClassProbability": columns[5][index] / 100,
+            }
+            for index in indexes
+        ]
+        return {"trackId": track_id, "totalPoints": total, "returnedPoints": len(points), "points": points}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tracks": len(self._tracks),
+            "sealedChunks": len(self._sealed),
+            "openPoints": self.open_points,
+            "bytes": self.nbytes,
+            "maxBytes": self.max_bytes,
+            "retentionMs": self.retention_ms,
+            "evictedChunks": self.evicted_chunks,
+        }
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -8,6 +9,8 @@ from pathlib import Path
 from statistics import mean
 from typing import Any
 
+from eye_features import FEATURE_LAYOUTS, KINEMATIC_EYE_V2, KINEMATIC_V1, eye_vector, resolve_feature_layout
+
 
 MULTICLASS_LABELS: tuple[str, ...] = (
     "HELICOPTER",
@@ -51,6 +54,9 @@ class TrackObservation:
     distance: float
     object_class: str
     confidence: float
+    # Latest cached ARGUS-Eye features packed in EYE_FEATURE_KEYS order (None = not available).
+    eye_features: tuple[float, ...] | None = None
+    eye_timestamp_ms: int = 0
 
 
 @dataclass
@@ -61,6 +67,7 @@ class LoadedModel:
     model_path: str
     loaded_at: str
     predictor: Any | None = None
+    feature_layout: str = KINEMATIC_V1
 
 
 class ArgusBrainInferencer:
@@ -111,6 +118,7 @@ class ArgusBrainInferencer:
                     "modelVersion": model.model_version,
                     "modelPath": model.model_path,
                     "loadedAt": model.loaded_at,
+                    "featureLayout": model.feature_layout,
                     "active": model.model_id == self._active_model_id,
                 }
             )
@@ -121,10 +129,9 @@ class ArgusBrainInferencer:
             raise ValueError(f"model not found: {model_id}")
         self._active_model_id = model_id
 
-    def register_joblib_model(self, model_id: str, model_path: str, activate: bool = True) -> dict[str, Any]:
-        model_id = model_id.strip()
-        if not model_id:
-            raise ValueError("model_id must not be empty")
+    @staticmethod
+    def load_joblib_predictor(model_path: str) -> tuple[Path, Any]:
+        # Safe to call off the event loop: touches no inferencer state.
         path = Path(model_path).expanduser().resolve()
         if not path.exists():
             raise ValueError(f"model path does not exist: {path}")
@@ -134,7 +141,33 @@ class ArgusBrainInferencer:
             predictor = joblib.load(path)
         except Exception as error:
             raise ValueError(f"failed to load joblib model: {error}") from error
+        return path, predictor
+
+    def register_joblib_model(
+        self,
+        model_id: str,
+        model_path: str,
+        activate: bool = True,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        model_id = model_id.strip()
+        if not model_id:
+            raise ValueError("model_id must not be empty")
+        path, predictor = self.load_joblib_predictor(model_path)
+        return self.install_joblib_model(model_id, path, predictor, activate=activate, feature_layout=feature_layout)
 
+    def install_joblib_model(
+        self,
+        model_id: str,
+        path: Path,
+        predictor: Any,
+        activate: bool = True,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        model_id = model_id.strip()
+        if not model_id:
+            raise ValueError("model_id must not be empty")
+        layout = resolve_feature_layout(predictor, feature_layout)
         self._models[model_id] = LoadedModel(
             model_id=model_id,
             model_type="joblib",
@@ -142,6 +175,7 @@ class ArgusBrainInferencer:
             model_path=str(path),
             loaded_at=datetime.now(timezone.utc).isoformat(),
             predictor=predictor,
+            feature_layout=layout,
         )
         if activate:
             self.activate_model(model_id)
@@ -189,6 +223,7 @@ class ArgusBrainInferencer:
             "modelVersion": model.model_version,
             "modelPath": model.model_path,
             "loadedAt": model.loaded_at,
+            "featureLayout": model.feature_layout,
             "active": model.model_id == self._active_model_id,
         }
 
@@ -220,6 +255,41 @@ class ArgusBrainInferencer:
             "inferenceModelVersion": self.model_version,
         }
 
+    def observe_batch(
+        self,
+        observations: list[tuple[str, TrackObservation]],
+    ) -> list[tuple[dict[str, Any], float]]:
+        results: list[tuple[dict[str, Any], float]] = []
+        for track_id, observation in observations:
+            started = time.perf_counter()
+            inference = self.observe(track_id, observation)
+            results.append((inference, (time.perf_counter() - started) * 1000.0))
+        return results
+
+    def export_tracks(self, min_timestamp_ms: int = 0) -> dict[str, list[TrackObservation]]:
+        """Buffered observations per track, skipping samples older than ``min_timestamp_ms``."""
+        tracks: dict[str, list[TrackObservation]] = {}
+        for track_id, buffer in self._buffers.items():
+            if not buffer or buffer[-1].timestamp_ms < min_timestamp_ms:
+                continue
+            if buffer[0].timestamp_ms >= min_timestamp_ms:
+                tracks[track_id] = list(buffer)
+            else:
+                tracks[track_id] = [observation for observation in buffer if observation.timestamp_ms >= min_timestamp_ms]
+        return tracks
+
+    def restore_tracks(self, tracks: dict[str, list[TrackObservation]]) -> int:
+        restored = 0
+        for track_id, observations in tracks.items():
+            if not observations:
+                continue
+            cutoff = observations[-1].timestamp_ms - self.feature_window_ms
+            buffer = self._buffers[track_id]
+            buffer.clear()
+            buffer.extend(observation for observation in observations if observation.timestamp_ms >= cutoff)
+            restored += 1
+        return restored
+
     def _to_uav_decision(self, probability: float) -> str:
         if probability >= self.threshold:
             return "UAV"
@@ -250,7 +320,7 @@ class ArgusBrainInferencer:
 
         active_model = self._get_active_model()
         if active_model.model_type == "joblib" and active_model.predictor is not None:
-            prediction = self._predict_with_joblib_model(active_model.predictor, buffer)
+            prediction = self._predict_with_joblib_model(active_model.predictor, buffer, active_model.feature_layout)
             if prediction is not None:
                 return prediction
 
@@ -260,8 +330,9 @@ class ArgusBrainInferencer:
         self,
         predictor: Any,
         buffer: deque[TrackObservation],
+        feature_layout: str = KINEMATIC_V1,
     ) -> dict[str, float] | None:
-        feature_vector = self._build_feature_vector(buffer)
+        feature_vector = self._build_feature_vector(buffer, feature_layout)
 
         try:
             if hasattr(predictor, "predict_proba"):
@@ -388,13 +459,13 @@ class ArgusBrainInferencer:
         normalized = str(raw_label).strip().replace("-", "_").replace(" ", "_").upper()
         return CLASS_ALIASES.get(normalized)
 
-    def _build_feature_vector(self, buffer: deque[TrackObservation]) -> list[float]:
-        # Keep feature order/length stable for compatibility with existing joblib models.
+    def _build_feature_vector(self, buffer: deque[TrackObservation], feature_layout: str = KINEMATIC_V1) -> list[float]:
+        # kinematic-v1 order/length is frozen for existing joblib models; see FEATURE_LAYOUTS.
         latest = buffer[-1]
         speeds = [sample.speed for sample in buffer]
         avg_speed = mean(speeds)
         speed_span = max(speeds) - min(speeds) if len(speeds) > 1 else 0.0
-        return [
+        vector = [
             latest.speed,
             latest.distance,
             latest.confidence,
@@ -402,6 +473,19 @@ class ArgusBrainInferencer:
             speed_span,
             float(len(buffer)),
         ]
+        if feature_layout == KINEMATIC_EYE_V2:
+            # Radar and signal updates are not in lockstep: use the newest observation that
+            # carried Eye features and report its age.
+            carrier = next((sample for sample in reversed(buffer) if sample.eye_features is not None), None)
+            if carrier is None:
+                vector.extend(eye_vector(None, 0, latest.timestamp_ms))
+            else:
+                vector.extend(eye_vector(carrier.eye_features, carrier.eye_timestamp_ms, latest.timestamp_ms))
+        return vector
+
+    @staticmethod
+    def feature_layouts() -> dict[str, list[str]]:
+        return {layout: list(names) for layout, names in FEATURE_LAYOUTS.items()}
 
 
 # Backward-compatible alias
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import Any
+
+
+def backoff_delay_ms(
+    consecutive_errors: int,
+    base_ms: float,
+    max_ms: float,
+    rng: random.Random | None = None,
+) -> float:
+    """Exponential backoff with equal jitter (half fixed, half random); zero without errors."""
+    if consecutive_errors <= 0:
+        return 0.0
+    ceiling = min(max_ms, base_ms * (2 ** min(consecutive_errors - 1, 30)))
+    return (rng or random).uniform(ceiling / 2.0, ceiling)
+
+
+class FrameScheduler:
+    """Deadline-driven tick source for the poll loop.
+
+    Ticks are anchored to ``start + n * period`` rather than "sleep after work", so
+    processing time does not stretch the frame period. A tick that finishes past its
+    deadline is an overrun: the next tick starts immediately, and whole periods that
+    elapsed meanwhile are skipped (not queued) so the loop realigns instead of bursting.
+    """
+
+    def __init__(self, period_ms: float) -> None:
+        self.period_ms = max(1.0, float(period_ms))
+        self._tick_start = time.monotonic()
+        self.tick_count = 0
+        self.overrun_count = 0
+        self.skipped_ticks = 0
+        self.last_overrun_ms = 0.0
+        self.consecutive_errors = 0
+        self.backoff_ms = 0.0
+
+    def update_period(self, period_ms: float) -> None:
+        self.period_ms = max(1.0, float(period_ms))
+
+    def reset(self) -> None:
+        self._tick_start = time.monotonic()
+
+    def budget_sec(self) -> float:
+        """Time left until the current tick's deadline."""
+        return max(0.0, self._tick_start + self.period_ms / 1000.0 - time.monotonic())
+
+    def complete(self, ok: bool | None, backoff_ms: float = 0.0) -> float:
+        """Record the end of a tick and return how long to sleep before the next one.
+
+        ``ok`` is None for a tick where no source was polled or answered (all backing off or
+        still in flight); it neither extends nor resets the error streak. ``backoff_ms`` is
+        the time until any failing source may be retried; the next tick is pushed to the
+        first deadline after it.
+        """
+        now = time.monotonic()
+        period_sec = self.period_ms / 1000.0
+        self.tick_count += 1
+        deadline = self._tick_start + period_sec
+
+        if now > deadline:
+            late_sec = now - deadline
+            self.overrun_count += 1
+            self.last_overrun_ms = round(late_sec * 1000.0, 3)
+            missed = math.floor(late_sec / period_sec)
+            self.skipped_ticks += missed
+            deadline += missed * period_sec
+
+        if ok is not None:
+            self.consecutive_errors = 0 if ok else self.consecutive_errors + 1
+        self.backoff_ms = max(0.0, backoff_ms)
+        if self.backoff_ms > (deadline - now) * 1000.0:
+            # Keep the grid: resume on the first deadline after the backoff expires.
+            resume = now + self.backoff_ms / 1000.0
+            deadline += math.ceil((resume - deadline) / period_sec) * period_sec
+
+        self._tick_start = deadline
+        return max(0.0, deadline - now)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "targetFps": round(1000.0 / self.period_ms, 3),
+            "frameOverruns": self.overrun_count,
+            "skippedTicks": self.skipped_ticks,
+            "lastOverrunMs": self.last_overrun_ms,
+            "pollBackoffMs": round(self.backoff_ms, 3),
+            "pollConsecutiveErrors": self.consecutive_errors,
+        }
+
+
+OVERLOAD_MODES: tuple[str, ...] = ("NORMAL", "REDUCED", "CACHED", "THINNED")
+
+
+class OverloadGovernor:
+    """Steps the pipeline through degradation levels when frames exceed their budget.
+
+    ``load`` is an EWMA of processing time over the poll period. Sustained load above
+    ``high_load`` for ``escalate_frames`` frames raises the level by one; load below
+    ``low_load`` for ``recover_frames`` frames lowers it by one. The gap between the two
+    thresholds and the longer recovery streak keep the level from flapping as shedding
+    itself brings the load down. The first ``warmup_frames`` frames (first model calls,
+    filling caches) are not counted as load.
+
+    Levels (each includes the previous ones):
+
+    - 0 ``NORMAL``: full pipeline.
+    - 1 ``REDUCED``: skip Eye feature lookups; pass through only upstream ``ALERT`` events.
+    - 2 ``CACHED``: low-priority tracks reuse their last inference, refreshed round-robin.
+    - 3 ``THINNED``: low-priority tracks beyond the far range are not processed or published.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        high_load: float = 0.9,
+        low_load: float = 0.6,
+        escalate_frames: int = 3,
+        recover_frames: int = 20,
+        smoothing: float = 0.3,
+        refresh_stride: int = 4,
+        warmup_frames: int = 3,
+    ) -> None:
+        self.enabled = enabled
+        self.high_load = high_load
+        self.low_load = low_load
+        self.escalate_frames = escalate_frames
+        self.recover_frames = recover_frames
+        self.smoothing = smoothing
+        self.refresh_stride = max(1, refresh_stride)
+        self.warmup_frames = warmup_frames
+        self.level = 0
+        self.load = 0.0
+        self.frame_index = 0
+        self.transitions = 0
+        self.shed_tracks = 0
+        self.cached_tracks = 0
+        self._over = 0
+        self._under = 0
+
+    def record(self, processing_ms: float, period_ms: float) -> int:
+        """Feed one frame's processing time; returns the level for the next frame."""
+        self.frame_index += 1
+        if self.frame_index <= self.warmup_frames:
+            return self.level
+        ratio = processing_ms / max(period_ms, 1.0)
+        if self.frame_index == self.warmup_frames + 1:
+            self.load = ratio
+        else:
+            self.load += self.smoothing * (ratio - self.load)
+        if not self.enabled:
+            self._over = self._under = 0
+            if self.level:
+                self.level = 0
+                self.transitions += 1
+            return self.level
+
+        if self.load > self.high_load:
+            self._over += 1
+            self._under = 0
+        elif self.load < self.low_load:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.escalate_frames and self.level < len(OVERLOAD_MODES) - 1:
+            self.level += 1
+            self.transitions += 1
+            self._over = 0
+        elif self._under >= self.recover_frames and self.level > 0:
+            self.level -= 1
+            self.transitions += 1
+            self._under = 0
+        return self.level
+
+    def refresh_due(self, track_id: str) -> bool:
+        """Whether a cached low-priority track gets a real inference this frame."""
+        return hash(track_id) % self.refresh_stride == self.frame_index % self.refresh_stride
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "overloadLevel": self.level,
+            "overloadMode": OVERLOAD_MODES[self.level],
+            "overloadLoad": round(self.load, 3),
+            "overloadTransitions": self.transitions,
+            "overloadCachedTracks": self.cached_tracks,
+            "overloadShedTracks": self.shed_tracks,
+        }
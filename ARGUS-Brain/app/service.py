@@ -0,0 +1,1062 @@
+from __future__ import annotations
+
+# Service module loaded by main.py (python3 ARGUS-Brain/app/main.py) after the port is bound.
+import sys
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+if str(CURRENT_DIR) not in sys.path:
+    sys.path.append(str(CURRENT_DIR))
+
+import asyncio  # noqa: E402
+import math  # noqa: E402
+import time  # noqa: E402
+from collections import deque  # noqa: E402
+from typing import Any  # noqa: E402
+
+from bootstrap import STARTUP  # noqa: E402
+
+from fastapi import FastAPI, HTTPException, Query  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+STARTUP.mark("framework_import")
+
+from association import DetectionAssociator  # noqa: E402
+from config import ServiceConfig  # noqa: E402
+from events import EventStore  # noqa: E402
+from eye_features import EyeFeatureCache  # noqa: E402
+from history import TrackHistoryStore  # noqa: E402
+from inference import ArgusBrainInferencer, TrackObservation  # noqa: E402
+from sharding import ShardedInferencer  # noqa: E402
+from spatial import TrackSpatialIndex  # noqa: E402
+from snapshot import TrackSnapshot, read_snapshot, write_snapshot  # noqa: E402
+from scheduler import FrameScheduler, OverloadGovernor  # noqa: E402
+from sources import FusedIdMap, SourceFanIn, SpatialDeduplicator  # noqa: E402
+
+STARTUP.mark("service_modules_import")
+
+
+def _to_record(value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        return value
+    return {}
+
+
+def _to_float(value: Any, fallback: float = 0.0) -> float:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return fallback
+    if math.isnan(parsed) or math.isinf(parsed):
+        return fallback
+    return parsed
+
+
+def _to_int(value: Any, fallback: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return fallback
+
+
+def _to_text(value: Any, fallback: str = "") -> str:
+    if value is None:
+        return fallback
+    return str(value).strip() or fallback
+
+
+def _extract_objects(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    if isinstance(payload.get("objects"), list):
+        return payload["objects"]
+    if isinstance(payload.get("tracks"), list):
+        return payload["tracks"]
+    if isinstance(payload.get("targets"), list):
+        return payload["targets"]
+    data = _to_record(payload.get("data"))
+    if isinstance(data.get("objects"), list):
+        return data["objects"]
+    if isinstance(data.get("tracks"), list):
+        return data["tracks"]
+    return []
+
+
+def _extract_events(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    if isinstance(payload.get("events"), list):
+        return payload["events"]
+    if isinstance(payload.get("alerts"), list):
+        return payload["alerts"]
+    data = _to_record(payload.get("data"))
+    if isinstance(data.get("events"), list):
+        return data["events"]
+    if isinstance(data.get("alerts"), list):
+        return data["alerts"]
+    return []
+
+
+def _extract_status(payload: dict[str, Any]) -> dict[str, Any]:
+    if isinstance(payload.get("systemStatus"), dict):
+        return payload["systemStatus"]
+    if isinstance(payload.get("status"), dict):
+        return payload["status"]
+    data = _to_record(payload.get("data"))
+    if isinstance(data.get("systemStatus"), dict):
+        return data["systemStatus"]
+    if isinstance(data.get("status"), dict):
+        return data["status"]
+    return {}
+
+
+class ConfigPatch(BaseModel):
+    argusSourceUrl: str | None = None
+    argusAuthToken: str | None = None
+    pollIntervalMs: int | None = None
+    requestTimeoutMs: int | None = None
+    uavThreshold: float | None = None
+    featureWindowMs: int | None = None
+    modelPath: str | None = None
+    activeModelId: str | None = None
+    argusSources: list[dict[str, Any]] | None = None
+    dedupRadiusM: float | None = None
+    sourceStaleMs: int | None = None
+    pollBackoffMaxMs: int | None = None
+    eyeFeaturesEnabled: bool | None = None
+    eyeFeatureMaxAgeMs: int | None = None
+    eventRateWindowMs: int | None = None
+    eventRateLimit: int | None = None
+    associationGateM: float | None = None
+    associationCoastMs: int | None = None
+    overloadEnabled: bool | None = None
+    overloadFarRangeM: float | None = None
+    historyRetentionMs: int | None = None
+
+
+class ModelRegisterRequest(BaseModel):
+    modelId: str
+    modelPath: str
+    activate: bool = True
+    featureLayout: str | None = None
+
+
+class EyeFeatureResult(BaseModel):
+    # The published object id; with several sources that is the namespaced "source:id".
+    trackId: str
+    timestampMs: int | None = None
+    # Non-numeric values are dropped per key by the cache instead of rejecting the batch.
+    features: dict[str, Any]
+
+
+class EyeFeatureBatch(BaseModel):
+    results: list[EyeFeatureResult]
+
+
+class ModelActivateRequest(BaseModel):
+    modelId: str
+
+
+class ServiceState:
+    def __init__(self, config: ServiceConfig):
+        self.config = config
+        # Joblib models load in the background after the server is up (see warm_up).
+        self.pending_model_path = config.model_path
+        self.pending_model_id = config.active_model_id
+        self.ready = not config.model_path and config.active_model_id in {"", "heuristic-default"}
+        self.warmup_error = ""
+        self.warm_task: asyncio.Task | None = None
+        self.shard_pool: ShardedInferencer | None = None
+        self.inferencer: ArgusBrainInferencer | ShardedInferencer
+        if config.shard_workers > 0:
+            self.shard_pool = ShardedInferencer(
+                worker_count=config.shard_workers,
+                threshold=config.uav_threshold,
+                feature_window_ms=config.feature_window_ms,
+            )
+            self.inferencer = self.shard_pool
+        else:
+            self.inferencer = ArgusBrainInferencer(
+                threshold=config.uav_threshold,
+                feature_window_ms=config.feature_window_ms,
+            )
+        self.sources = SourceFanIn(
+            config.resolved_sources(),
+            backoff_base_ms=config.poll_interval_ms,
+            backoff_max_ms=config.poll_backoff_max_ms,
+        )
+        self.scheduler = FrameScheduler(config.poll_interval_ms)
+        self.governor = OverloadGovernor(enabled=config.overload_enabled)
+        # Last inference per published track, reused for low-priority tracks under overload.
+        self.last_inference: dict[str, dict[str, Any]] = {}
+        self.source_frames: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self.fused_ids = FusedIdMap(config.source_stale_ms)
+        self.eye_cache = EyeFeatureCache(
+            max_age_ms=config.eye_feature_max_age_ms,
+            max_tracks=config.eye_feature_cache_tracks,
+        )
+        self.event_store = EventStore(
+            capacity=config.event_capacity,
+            max_per_object=config.event_max_per_object,
+            rate_window_ms=config.event_rate_window_ms,
+            rate_limit=config.event_rate_limit,
+        )
+        self.spatial_index = TrackSpatialIndex(config.spatial_cell_m)
+        self.history = TrackHistoryStore(
+            retention_ms=config.history_retention_ms,
+            max_bytes=config.history_max_mb * 1024 * 1024,
+        )
+        self.associator = DetectionAssociator(
+            gate_m=config.association_gate_m,
+            coast_ms=config.association_coast_ms,
+        )
+        self.frame_timestamp_history: deque[float] = deque(maxlen=240)
+        self.inference_ms_history: deque[float] = deque(maxlen=300)
+        self.model_latency_frame_history: deque[float] = deque(maxlen=300)
+        self.pipeline_ms_history: deque[float] = deque(maxlen=300)
+        self.last_frame: dict[str, Any] = {
+            "objects": [],
+            "events": [],
+            "systemStatus": self._build_status({}, [], connected=False),
+        }
+        self.last_error = ""
+        self.source_connected = False
+        self.loop_task: asyncio.Task | None = None
+        self.stop_event = asyncio.Event()
+        self.start_ts = time.time()
+        self.lock = asyncio.Lock()
+        # Serialises model/config calls that run off the event loop (sharded mode).
+        self.model_lock = asyncio.Lock()
+        self.last_uav_decision: dict[str, str] = {}
+        self.last_polled_at = 0.0
+        self.snapshot_task: asyncio.Task | None = None
+        self.snapshot_stats: dict[str, Any] = {
+            "restoredTracks": 0,
+            "lastSavedAt": 0.0,
+            "lastSavedBytes": 0,
+            "lastSaveMs": 0.0,
+            "lastError": "",
+        }
+        self._sync_model_config()
+
+    def _sync_model_config(self) -> None:
+        active_model_id = self.inferencer.active_model_id
+        self.config.active_model_id = active_model_id
+        self.config.model_path = ""
+        for model in self.inferencer.list_models():
+            if model["modelId"] == active_model_id:
+                self.config.model_path = model["modelPath"] or ""
+                break
+
+    async def _call_inferencer(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        call = getattr(self.inferencer, method)
+        if self.shard_pool is None:
+            async with self.lock:
+                return call(*args, **kwargs)
+        # A shard broadcast waits on every worker (model loads take seconds), so run it in a
+        # thread outside self.lock; /healthz and polling keep answering meanwhile.
+        async with self.model_lock:
+            return await asyncio.to_thread(call, *args, **kwargs)
+
+    async def _install_model_file(
+        self,
+        model_id: str,
+        model_path: str,
+        activate: bool,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        model_id = model_id.strip()
+        if not model_id:
+            raise ValueError("model_id must not be empty")
+        path, predictor = await asyncio.to_thread(ArgusBrainInferencer.load_joblib_predictor, model_path)
+        return await self._call_inferencer(
+            "install_joblib_model", model_id, path, predictor, activate=activate, feature_layout=feature_layout
+        )
+
+    def _build_status(
+        self,
+        source_status: dict[str, Any],
+        objects: list[dict[str, Any]],
+        connected: bool,
+    ) -> dict[str, Any]:
+        inference_p50, inference_p95 = self._percentiles(self.inference_ms_history)
+        model_p50, model_p95 = self._percentiles(self.model_latency_frame_history)
+        _, pipeline_p95 = self._percentiles(self.pipeline_ms_history)
+        measured_fps = self._calculate_measured_fps()
+
+        active_count = sum(
+            1
+            for obj in objects
+            if _to_text(obj.get("status"), "").upper() in {"TRACKING", "STABLE"}
+        )
+        model_name = _to_text(source_status.get("modelName"), "ARGUS-Brain-Multiclass")
+        model_version = _to_text(source_status.get("modelVersion"), self.inferencer.model_version)
+
+        return {
+            "connectionStatus": "LIVE" if connected else "DISCONNECTED",
+            "modelName": model_name,
+            "modelVersion": model_version,
+            "device": _to_text(source_status.get("device"), "AESA-Array-X1"),
+            "latency": model_p50 if model_p50 > 0 else _to_float(source_status.get("latency"), 0.0),
+            "fps": measured_fps if measured_fps > 0 else _to_float(source_status.get("fps"), 0.0),
+            "trackedObjects": len(objects),
+            "activeTracksCount": active_count,
+            "totalDetected": max(
+                len(objects), _to_int(source_status.get("totalDetected"), len(objects))
+            ),
+            "sensorStatus": _to_text(source_status.get("sensorStatus"), "ONLINE"),
+            "cpuUsage": _to_float(source_status.get("cpuUsage"), 0.0),
+            "gpuUsage": _to_float(source_status.get("gpuUsage"), 0.0),
+            "ramUsage": _to_float(source_status.get("ramUsage"), 0.0),
+            "measuredFps": measured_fps,
+            "modelLatencyP50": model_p50,
+            "modelLatencyP95": model_p95,
+            "inferenceLatencyP50": inference_p50,
+            "inferenceLatencyP95": inference_p95,
+            "pipelineLatencyP95": pipeline_p95,
+            "sourcesTotal": len(self.sources.source_ids),
+            "sourcesConnected": self.sources.connected_count(),
+            **self.scheduler.to_dict(),
+            **self.governor.to_dict(),
+        }
+
+    @staticmethod
+    def _percentiles(values: deque[float]) -> tuple[float, float]:
+        if not values:
+            return (0.0, 0.0)
+        ordered = sorted(values)
+        p50_idx = int(0.5 * (len(ordered) - 1))
+        p95_idx = int(0.95 * (len(ordered) - 1))
+        return (round(ordered[p50_idx], 3), round(ordered[p95_idx], 3))
+
+    def _calculate_measured_fps(self) -> float:
+        if len(self.frame_timestamp_history) < 2:
+            return 0.0
+        elapsed = self.frame_timestamp_history[-1] - self.frame_timestamp_history[0]
+        if elapsed <= 0:
+            return 0.0
+        fps = (len(self.frame_timestamp_history) - 1) / elapsed
+        return round(fps, 3)
+
+    def _normalize_object(self, raw: Any, source_id: str, namespaced: bool) -> tuple[dict[str, Any], dict[str, Any]]:
+        obj = _to_record(raw)
+        # Id-less detections keep "" here; poll_once gives them associated synthetic ids.
+        object_id = _to_text(obj.get("id") or obj.get("trackId") or obj.get("objectId"), "")
+        if namespaced and object_id:
+            # Radars number tracks independently; keep ids unique across sources.
+            object_id = f"{source_id}:{object_id}"
+        position = _to_record(obj.get("position"))
+        velocity = _to_record(obj.get("velocity"))
+
+        x = _to_float(position.get("x"), _to_float(obj.get("x"), 0.0))
+        y = _to_float(position.get("y"), _to_float(obj.get("y"), 0.0))
+        z = _to_float(position.get("z"), _to_float(obj.get("z"), _to_float(obj.get("altitude"), 0.0)))
+
+        vx = _to_float(velocity.get("x"), _to_float(obj.get("vx"), 0.0))
+        vy = _to_float(velocity.get("y"), _to_float(obj.get("vy"), 0.0))
+        vz = _to_float(velocity.get("z"), _to_float(obj.get("vz"), 0.0))
+        speed = _to_float(obj.get("speed"), math.sqrt(vx * vx + vy * vy + vz * vz))
+        distance = _to_float(obj.get("distance"), math.sqrt(x * x + y * y))
+        confidence = _to_float(obj.get("confidence"), 60.0)
+        object_class = _to_text(obj.get("class") or obj.get("className"), "UNKNOWN")
+
+        return (
+            obj,
+            {
+                "id": object_id,
+                "class": object_class,
+                "position": {"x": x, "y": y, "z": z},
+                "velocity": {"x": vx, "y": vy, "z": vz},
+                "speed": speed,
+                "distance": distance,
+                "confidence": confidence,
+                "sourceIds": [source_id],
+            },
+        )
+
+    def _carry_over_objects(
+        self,
+        fresh_source_ids: set[str],
+        deduplicator: SpatialDeduplicator,
+        fresh_ids: set[str],
+    ) -> list[dict[str, Any]]:
+        """Re-publish the last inferred objects of sources that have not answered this frame."""
+        carried: list[dict[str, Any]] = []
+        stale_before = time.time() - self.config.source_stale_ms / 1000.0
+        for source_id, (received_at, objects) in list(self.source_frames.items()):
+            if source_id in fresh_source_ids:
+                continue
+            if source_id not in self.sources.source_ids or received_at < stale_before:
+                del self.source_frames[source_id]
+                continue
+            for obj in objects:
+                if obj["id"] in fresh_ids or deduplicator.find(obj) is not None:
+                    continue
+                carried.append(obj)
+        return carried
+
+    def _attach_eye_features(
+        self,
+        obj: dict[str, Any],
+        object_id: str,
+        observation: TrackObservation,
+        now_ms: int,
+    ) -> None:
+        # Sources may embed the Eye result for this track; it only refreshes the cache.
+        embedded = obj.get("eyeFeatures")
+        if isinstance(embedded, dict):
+            self.eye_cache.update(object_id, embedded, _to_int(obj.get("eyeTimestampMs"), now_ms))
+        cached = self.eye_cache.lookup(object_id, now_ms)
+        if cached is not None:
+            observation.eye_timestamp_ms, observation.eye_features = cached
+
+    async def ingest_eye_features(self, results: list[dict[str, Any]]) -> dict[str, Any]:
+        async with self.lock:
+            accepted = self.eye_cache.update_many(results, int(time.time() * 1000))
+            return {"accepted": accepted, "cache": self.eye_cache.stats()}
+
+    async def poll_once(self, budget_sec: float | None = None) -> bool:
+        """Poll the sources and publish a frame; False when no source answered this tick."""
+        poll_start = time.perf_counter()
+        if budget_sec is None:
+            budget_sec = self.config.poll_interval_ms / 1000.0
+        results, errors = await self.sources.collect(budget_sec)
+        if not results:
+            if errors and self.sources.connected_count() == 0:
+                raise RuntimeError("; ".join(f"{source_id}: {error}" for source_id, error in errors.items()))
+            return False
+
+        processing_start = time.perf_counter()
+        level = self.governor.level
+        now_ms = int(time.time() * 1000)
+        namespaced = len(self.sources.source_ids) > 1
+        source_status = _extract_status(results[0].payload)
+        received_at = {result.source_id: result.received_at for result in results}
+
+        normalized_objects: list[dict[str, Any]] = []
+        # (type, message, objectId, objectClass, id, timestamp); stored under the lock below.
+        raw_events: list[tuple[str, str, str, str, str, str]] = []
+        frame_model_latency_total_ms = 0.0
+        pending: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        observations: list[tuple[str, TrackObservation]] = []
+        events: list[Any] = []
+
+        deduplicator = SpatialDeduplicator(self.config.dedup_radius_m if namespaced else 0.0)
+        for result in results:
+            if level < 1:
+                events.extend(_extract_events(result.payload))
+            else:
+                # Overload: only upstream alerts are passed through.
+                events.extend(
+                    event for event in _extract_events(result.payload)
+                    if _to_text(_to_record(event).get("type"), "").upper() == "ALERT"
+                )
+            batch = [
+                self._normalize_object(raw, result.source_id, namespaced)
+                for raw in _extract_objects(result.payload)
+            ]
+            anonymous = [normalized for _, normalized in batch if not normalized["id"]]
+            self.associator.associate(result.source_id, anonymous, now_ms)
+            if namespaced:
+                for normalized in anonymous:
+                    normalized["id"] = f"{result.source_id}:{normalized['id']}"
+            for obj, normalized in batch:
+                if deduplicator.add(normalized) is normalized:
+                    pending.append((obj, normalized))
+        if namespaced:
+            # A merged object keeps the id it was first published under, whichever of its
+            # sources happens to lead this frame.
+            fused = self.fused_ids.assign([members for _, members in deduplicator.clusters], now_ms)
+            for (entry, _), fused_id in zip(deduplicator.clusters, fused):
+                entry["id"] = fused_id
+
+        previous_inference = self.last_inference
+        cached: dict[int, dict[str, Any]] = {}
+        shed: set[str] = set()
+        if level >= 2:
+            far_range_m = self.config.overload_far_range_m
+            kept: list[tuple[dict[str, Any], dict[str, Any]]] = []
+            for obj, normalized in pending:
+                object_id = normalized["id"]
+                previous = previous_inference.get(object_id)
+                if previous is None or self.last_uav_decision.get(object_id) == "UAV":
+                    kept.append((obj, normalized))
+                    continue
+                if level >= 3 and normalized["distance"] > far_range_m:
+                    shed.add(object_id)
+                    continue
+                if not self.governor.refresh_due(object_id):
+                    cached[len(kept)] = previous
+                kept.append((obj, normalized))
+            pending = kept
+        self.governor.cached_tracks = len(cached)
+        self.governor.shed_tracks = len(shed)
+
+        eye_enabled = self.config.eye_features_enabled and level < 1
+        for index, (obj, normalized) in enumerate(pending):
+            if index in cached:
+                continue
+            position = normalized["position"]
+            observation = TrackObservation(
+                timestamp_ms=now_ms,
+                x=position["x"],
+                y=position["y"],
+                z=position["z"],
+                speed=normalized["speed"],
+                distance=normalized["distance"],
+                object_class=normalized["class"],
+                confidence=normalized["confidence"],
+            )
+            if eye_enabled:
+                self._attach_eye_features(obj, normalized["id"], observation, now_ms)
+            observations.append((normalized["id"], observation))
+
+        # Sharded mode fans this batch out to worker processes from a thread so the blocking
+        # pipe round trip does not stall the event loop; in-process mode runs it inline.
+        if self.shard_pool is not None:
+            inferred = iter(await asyncio.to_thread(self.shard_pool.observe_batch, observations))
+        else:
+            inferred = iter(self.inferencer.observe_batch(observations))
+        current_inference: dict[str, dict[str, Any]] = {
+            object_id: previous_inference[object_id] for object_id in shed
+        }
+
+        for index, (obj, normalized) in enumerate(pending):
+            object_id = normalized["id"]
+            if index in cached:
+                inference, inference_ms = cached[index], 0.0
+            else:
+                inference, inference_ms = next(inferred)
+                frame_model_latency_total_ms += inference_ms
+                self.inference_ms_history.append(inference_ms)
+            current_inference[object_id] = inference
+
+            prev_decision = self.last_uav_decision.get(object_id, "UNKNOWN")
+            current_decision = inference["uavDecision"]
+            self.last_uav_decision[object_id] = current_decision
+            if prev_decision != "UAV" and current_decision == "UAV":
+                raw_events.append(
+                    (
+                        "ALERT",
+                        f"{object_id} UAV 의심 객체 감지 ({inference['uavProbability']:.1f}%)",
+                        object_id,
+                        inference.get("class", normalized["class"]),
+                        "",
+                        "",
+                    )
+                )
+
+            normalized_objects.append(
+                {
+                    **obj,
+                    **normalized,
+                    "inferenceLatencyMs": round(inference_ms, 3),
+                    **inference,
+                }
+            )
+
+        for event in events:
+            evt = _to_record(event)
+            raw_events.append(
+                (
+                    _to_text(evt.get("type"), "INFO"),
+                    _to_text(evt.get("message"), "이벤트"),
+                    _to_text(evt.get("objectId"), ""),
+                    _to_text(evt.get("objectClass") or evt.get("class") or evt.get("className"), "UNKNOWN"),
+                    _to_text(evt.get("id"), ""),
+                    _to_text(evt.get("timestamp"), ""),
+                )
+            )
+
+        fresh_ids = {obj["id"] for obj in normalized_objects}
+        carried_objects = self._carry_over_objects(set(received_at), deduplicator, fresh_ids)
+        for source_id in received_at:
+            self.source_frames[source_id] = (
+                received_at[source_id],
+                [obj for obj in normalized_objects if obj["sourceIds"][0] == source_id],
+            )
+        published_objects = normalized_objects + carried_objects
+
+        pipeline_ms = (time.perf_counter() - poll_start) * 1000.0
+        self.pipeline_ms_history.append(pipeline_ms)
+        frame_model_latency_avg = (
+            frame_model_latency_total_ms / len(observations) if observations else 0.0
+        )
+        self.model_latency_frame_history.append(frame_model_latency_avg)
+        self.frame_timestamp_history.append(time.perf_counter())
+        self.last_inference = current_inference
+        self.governor.record((time.perf_counter() - processing_start) * 1000.0, self.config.poll_interval_ms)
+
+        async with self.lock:
+            self.source_connected = True
+            self.last_polled_at = time.time()
+            self.last_error = "; ".join(f"{source_id}: {error}" for source_id, error in errors.items())
+            normalized_events = []
+            for event_type, message, object_id, object_class, event_id, timestamp in raw_events:
+                stored = self.event_store.add(
+                    event_type, message, object_id, object_class, now_ms, event_id, timestamp
+                )
+                if stored is not None:
+                    normalized_events.append(stored)
+            self.spatial_index.update(published_objects)
+            for obj in normalized_objects:
+                position = obj["position"]
+                self.history.append(
+                    obj["id"],
+                    now_ms,
+                    position["x"],
+                    position["y"],
+                    position["z"],
+                    obj["speed"],
+                    obj["class"],
+                    obj["confidence"],
+                )
+            self.history.maintain(now_ms)
+            self.last_frame = {
+                "objects": published_objects,
+                "events": normalized_events,
+                "systemStatus": self._build_status(source_status, published_objects, connected=True),
+            }
+        return True
+
+    async def poll_loop(self) -> None:
+        self.scheduler.reset()
+        while not self.stop_event.is_set():
+            self.scheduler.update_period(self.config.poll_interval_ms)
+            ok: bool | None = True
+            try:
+                if not await self.poll_once(self.scheduler.budget_sec()):
+                    ok = None
+            except Exception as error:
+                ok = False
+                async with self.lock:
+                    self.source_connected = False
+                    self.last_error = str(error)
+                    self.last_frame["systemStatus"] = self._build_status(
+                        self.last_frame.get("systemStatus", {}),
+                        self.last_frame.get("objects", []),
+                        connected=False,
+                    )
+            delay_sec = self.scheduler.complete(ok, backoff_ms=self.sources.retry_delay_ms())
+            if delay_sec <= 0:
+                await asyncio.sleep(0)
+                continue
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=delay_sec)
+            except asyncio.TimeoutError:
+                pass
+
+    async def restore_snapshot(self) -> None:
+        if not self.config.snapshot_path:
+            return
+        # Anything older than one feature window would be trimmed on the next observe anyway.
+        min_timestamp_ms = int(time.time() * 1000) - self.config.feature_window_ms
+        try:
+            restored = await asyncio.to_thread(read_snapshot, self.config.snapshot_path, min_timestamp_ms)
+            if restored is None:
+                return
+            if self.shard_pool is not None:
+                restored_tracks = await asyncio.to_thread(self.shard_pool.restore_tracks, restored.tracks)
+            else:
+                restored_tracks = self.inferencer.restore_tracks(restored.tracks)
+        except Exception as error:
+            # Start cold: the snapshot only saves feature-window warm-up.
+            self.snapshot_stats["lastError"] = f"restore failed: {type(error).__name__}: {error}"
+            return
+        self.snapshot_stats["restoredTracks"] = restored_tracks
+        self.last_uav_decision.update(restored.decisions)
+
+    async def save_snapshot(self) -> None:
+        if not self.config.snapshot_path:
+            return
+        started = time.perf_counter()
+        now_ms = int(time.time() * 1000)
+        # Tracks silent for a whole feature window are dead and would be dropped on restore.
+        min_timestamp_ms = now_ms - self.config.feature_window_ms
+        if self.shard_pool is not None:
+            tracks = await asyncio.to_thread(self.shard_pool.export_tracks, min_timestamp_ms)
+        else:
+            # Export on the loop (buffers are mutated by poll_once); encode and write off-loop.
+            tracks = self.inferencer.export_tracks(min_timestamp_ms)
+        snapshot = TrackSnapshot(
+            saved_at_ms=now_ms,
+            tracks=tracks,
+            decisions={track_id: self.last_uav_decision.get(track_id, "UNKNOWN") for track_id in tracks},
+        )
+        try:
+            size = await asyncio.to_thread(write_snapshot, self.config.snapshot_path, snapshot)
+        except OSError as error:
+            self.snapshot_stats["lastError"] = f"save failed: {error}"
+            return
+        self.snapshot_stats.update(
+            {
+                "lastSavedAt": time.time(),
+                "lastSavedBytes": size,
+                "lastSaveMs": round((time.perf_counter() - started) * 1000.0, 3),
+                "lastError": "",
+            }
+        )
+
+    async def snapshot_loop(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self.stop_event.wait(),
+                    timeout=max(0.5, self.config.snapshot_interval_ms / 1000.0),
+                )
+            except asyncio.TimeoutError:
+                await self.save_snapshot()
+
+    async def warm_up(self) -> None:
+        try:
+            if self.pending_model_path:
+                await self._install_model_file("env-model", self.pending_model_path, activate=True)
+            if self.pending_model_id:
+                try:
+                    await self._call_inferencer("activate_model", self.pending_model_id)
+                except ValueError:
+                    await self._call_inferencer("activate_model", "heuristic-default")
+        except (ValueError, RuntimeError) as error:
+            # Keep serving with the heuristic model instead of failing the whole process.
+            self.warmup_error = str(error)
+        async with self.lock:
+            self._sync_model_config()
+            self.ready = True
+        STARTUP.mark("models_loaded")
+
+    async def start(self) -> None:
+        self.stop_event.clear()
+        if self.shard_pool is not None:
+            # Waits for every worker's ready handshake, so polling never sees their startup.
+            await asyncio.to_thread(self.shard_pool.start)
+        await self.restore_snapshot()
+        # Polling starts right away (heuristic model) so feature windows fill while models load.
+        self.loop_task = asyncio.create_task(self.poll_loop())
+        self.snapshot_task = asyncio.create_task(self.snapshot_loop())
+        if not self.ready:
+            self.warm_task = asyncio.create_task(self.warm_up())
+
+    async def stop(self) -> None:
+        self.stop_event.set()
+        if self.warm_task:
+            await self.warm_task
+            self.warm_task = None
+        if self.loop_task:
+            await self.loop_task
+            self.loop_task = None
+        if self.snapshot_task:
+            await self.snapshot_task
+            self.snapshot_task = None
+        await self.save_snapshot()
+        await self.sources.close()
+        if self.shard_pool is not None:
+            self.shard_pool.close()
+
+    async def snapshot(
+        self,
+        bbox: tuple[float, float, float, float] | None = None,
+        radius: tuple[float, float, float] | None = None,
+    ) -> dict[str, Any]:
+        async with self.lock:
+            objects = self.last_frame.get("objects", [])
+            events = self.last_frame.get("events", [])
+            if bbox is not None or radius is not None:
+                # Region queries read the spatial index, which always mirrors last_frame.
+                if bbox is not None:
+                    objects = self.spatial_index.within_bbox(*bbox)
+                if radius is not None:
+                    inside = self.spatial_index.within_radius(*radius)
+                    if bbox is not None:
+                        ids = {obj["id"] for obj in objects}
+                        inside = [obj for obj in inside if obj["id"] in ids]
+                    objects = inside
+                ids = {obj["id"] for obj in objects}
+                events = [event for event in events if not event["objectId"] or event["objectId"] in ids]
+            return {
+                "objects": objects,
+                "events": events,
+                "systemStatus": self.last_frame.get("systemStatus", {}),
+            }
+
+    async def nearest_tracks(self, x: float, y: float, k: int, max_distance_m: float | None) -> dict[str, Any]:
+        async with self.lock:
+            return {
+                "tracks": [
+                    {"distanceM": round(distance, 3), "object": obj}
+                    for distance, obj in self.spatial_index.nearest(x, y, k, max_distance_m)
+                ],
+            }
+
+    async def query_events(
+        self,
+        since_ms: int | None,
+        object_id: str | None,
+        event_type: str | None,
+        cursor: int | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        async with self.lock:
+            events = self.event_store.query(since_ms, object_id, event_type, cursor, limit)
+            return {
+                "events": events,
+                "cursor": events[-1]["seq"] if events else cursor,
+                "lastSeq": self.event_store.stats()["lastSeq"],
+            }
+
+    async def track_history(
+        self,
+        track_id: str,
+        from_ms: int | None,
+        to_ms: int | None,
+        max_points: int,
+    ) -> dict[str, Any] | None:
+        async with self.lock:
+            return self.history.query(track_id, from_ms, to_ms, max_points)
+
+    async def health(self) -> dict[str, Any]:
+        async with self.lock:
+            return {
+                "status": (
+                    "warming" if not self.ready else "ok" if self.source_connected else "degraded"
+                ),
+                "ready": self.ready,
+                "warmupError": self.warmup_error,
+                "startup": STARTUP.to_dict(),
+                "sourceConnected": self.source_connected,
+                "activeModelId": self.inferencer.active_model_id,
+                "modelVersion": self.inferencer.model_version,
+                "uptimeSec": int(time.time() - self.start_ts),
+                "lastPolledAt": self.last_polled_at,
+                "lastError": self.last_error,
+                "models": self.inferencer.list_models(),
+                "config": self.config.to_dict(),
+                "queueDepth": 0,
+                "sources": self.sources.stats(),
+                "snapshot": dict(self.snapshot_stats),
+                "shards": self.shard_pool.status() if self.shard_pool is not None else [],
+                "eyeFeatures": {"enabled": self.config.eye_features_enabled, **self.eye_cache.stats()},
+                "events": self.event_store.stats(),
+                "spatialIndex": self.spatial_index.stats(),
+                "association": self.associator.stats(),
+                "history": self.history.stats(),
+            }
+
+    async def list_models(self) -> dict[str, Any]:
+        async with self.lock:
+            return {
+                "activeModelId": self.inferencer.active_model_id,
+                "models": self.inferencer.list_models(),
+            }
+
+    async def register_model(
+        self,
+        model_id: str,
+        model_path: str,
+        activate: bool,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        descriptor = await self._install_model_file(
+            model_id, model_path, activate=activate, feature_layout=feature_layout
+        )
+        async with self.lock:
+            self._sync_model_config()
+            return {
+                "registered": descriptor,
+                "activeModelId": self.inferencer.active_model_id,
+                "models": self.inferencer.list_models(),
+            }
+
+    async def activate_model(self, model_id: str) -> dict[str, Any]:
+        await self._call_inferencer("activate_model", model_id)
+        async with self.lock:
+            self._sync_model_config()
+            return {
+                "activeModelId": self.inferencer.active_model_id,
+                "models": self.inferencer.list_models(),
+            }
+
+    async def unregister_model(self, model_id: str) -> dict[str, Any]:
+        await self._call_inferencer("unregister_model", model_id)
+        async with self.lock:
+            self._sync_model_config()
+            return {
+                "activeModelId": self.inferencer.active_model_id,
+                "models": self.inferencer.list_models(),
+            }
+
+    async def reload(self, patch: dict[str, Any]) -> dict[str, Any]:
+        async with self.lock:
+            self.config.apply_patch(patch)
+            threshold = self.config.uav_threshold
+            feature_window_ms = self.config.feature_window_ms
+            self.sources.backoff_base_ms = self.config.poll_interval_ms
+            self.sources.backoff_max_ms = self.config.poll_backoff_max_ms
+            self.sources.configure(self.config.resolved_sources())
+            self.scheduler.update_period(self.config.poll_interval_ms)
+            self.eye_cache.max_age_ms = self.config.eye_feature_max_age_ms
+            self.event_store.rate_window_ms = self.config.event_rate_window_ms
+            self.event_store.rate_limit = self.config.event_rate_limit
+            self.associator.gate_m = self.config.association_gate_m
+            self.associator.coast_ms = self.config.association_coast_ms
+            self.governor.enabled = self.config.overload_enabled
+            self.history.retention_ms = self.config.history_retention_ms
+            self.fused_ids.ttl_ms = self.config.source_stale_ms
+
+        await self._call_inferencer("update_threshold", threshold)
+        await self._call_inferencer("update_feature_window", feature_window_ms)
+
+        if "modelPath" in patch:
+            model_path = str(patch["modelPath"] or "").strip()
+            if model_path:
+                await self._install_model_file("runtime-model", model_path, activate=True)
+
+        if "activeModelId" in patch:
+            active_model_id = str(patch["activeModelId"] or "").strip()
+            if active_model_id:
+                await self._call_inferencer("activate_model", active_model_id)
+
+        async with self.lock:
+            self._sync_model_config()
+            return self.config.to_dict()
+
+
+config = ServiceConfig.from_env()
+state = ServiceState(config=config)
+app = FastAPI(title="Radar UAV Inference Service", version="0.1.0")
+STARTUP.mark("state_init")
+
+
+@app.on_event("startup")
+async def on_startup() -> None:
+    await state.start()
+    STARTUP.mark("service_start")
+    STARTUP.report("serving")
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await state.stop()
+
+
+@app.get("/healthz")
+async def healthz() -> dict[str, Any]:
+    return await state.health()
+
+
+def _require_finite(**values: float | None) -> None:
+    # FastAPI parses "inf"/"nan" as floats; the spatial grid cannot place them.
+    for name, value in values.items():
+        if value is not None and not math.isfinite(value):
+            raise HTTPException(status_code=400, detail=f"{name} must be a finite number")
+
+
+@app.get("/api/v1/radar/frame")
+async def radar_frame(
+    minX: float | None = None,
+    minY: float | None = None,
+    maxX: float | None = None,
+    maxY: float | None = None,
+    x: float | None = None,
+    y: float | None = None,
+    radiusM: float | None = None,
+) -> dict[str, Any]:
+    _require_finite(minX=minX, minY=minY, maxX=maxX, maxY=maxY, x=x, y=y, radiusM=radiusM)
+    bounds = (minX, minY, maxX, maxY)
+    if any(value is not None for value in bounds) and any(value is None for value in bounds):
+        raise HTTPException(status_code=400, detail="minX, minY, maxX and maxY must be given together")
+    circle = (x, y, radiusM)
+    if any(value is not None for value in circle) and any(value is None for value in circle):
+        raise HTTPException(status_code=400, detail="x, y and radiusM must be given together")
+    return await state.snapshot(
+        bbox=bounds if minX is not None else None,
+        radius=circle if radiusM is not None else None,
+    )
+
+
+@app.get("/api/v1/tracks/nearest")
+async def nearest_tracks(
+    x: float,
+    y: float,
+    k: int = Query(1, ge=1, le=1000),
+    maxDistanceM: float | None = None,
+) -> dict[str, Any]:
+    _require_finite(x=x, y=y, maxDistanceM=maxDistanceM)
+    return await state.nearest_tracks(x, y, k, maxDistanceM)
+
+
+@app.get("/api/v1/events")
+async def query_events(
+    since: int | None = None,
+    objectId: str | None = None,
+    type: str | None = None,
+    cursor: int | None = None,
+    limit: int = Query(500, ge=1, le=5000),
+) -> dict[str, Any]:
+    return await state.query_events(since, objectId, type, cursor, limit)
+
+
+@app.get("/api/v1/tracks/{track_id}/history")
+async def track_history(
+    track_id: str,
+    from_ms: int | None = Query(None, alias="from"),
+    to_ms: int | None = Query(None, alias="to"),
+    maxPoints: int = Query(500, ge=2, le=10000),
+) -> dict[str, Any]:
+    history = await state.track_history(track_id, from_ms, to_ms, maxPoints)
+    if history is None:
+        raise HTTPException(status_code=404, detail=f"no history for track: {track_id}")
+    return history
+
+
+@app.post("/api/v1/config/reload")
+async def reload_config(patch: ConfigPatch) -> dict[str, Any]:
+    try:
+        applied = await state.reload(patch.model_dump(exclude_none=True))
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return {"ok": True, "config": applied}
+
+
+@app.get("/api/v1/models")
+async def list_models() -> dict[str, Any]:
+    return await state.list_models()
+
+
+@app.post("/api/v1/models/register")
+async def register_model(payload: ModelRegisterRequest) -> dict[str, Any]:
+    try:
+        result = await state.register_model(
+            model_id=payload.modelId,
+            model_path=payload.modelPath,
+            activate=payload.activate,
+            feature_layout=payload.featureLayout,
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return {"ok": True, **result}
+
+
+@app.get("/api/v1/models/feature-layouts")
+async def feature_layouts() -> dict[str, Any]:
+    return {"layouts": ArgusBrainInferencer.feature_layouts()}
+
+
+@app.post("/api/v1/eye/features")
+async def ingest_eye_features(payload: EyeFeatureBatch) -> dict[str, Any]:
+    result = await state.ingest_eye_features([item.model_dump() for item in payload.results])
+    return {"ok": True, **result}
+
+
+@app.post("/api/v1/models/activate")
+async def activate_model(payload: ModelActivateRequest) -> dict[str, Any]:
+    try:
+        result = await state.activate_model(payload.modelId)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return {"ok": True, **result}
+
+
+@app.delete("/api/v1/models/{model_id}")
+async def unregister_model(model_id: str) -> dict[str, Any]:
+    try:
+        result = await state.unregister_model(model_id)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return {"ok": True, **result}
+
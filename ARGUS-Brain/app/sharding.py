@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from inference import ArgusBrainInferencer, TrackObservation
+
+# Registry/config mutations that must be replayed on every worker (and on a restarted worker).
+CONTROL_METHODS: frozenset[str] = frozenset(
+    {
+        "activate_model",
+        "register_joblib_model",
+        "unregister_model",
+        "load_legacy_model_path",
+        "update_threshold",
+        "update_feature_window",
+    }
+)
+
+# Control calls that only set a value: the log keeps just the latest one of each.
+SETTER_METHODS: frozenset[str] = frozenset({"update_threshold", "update_feature_window"})
+
+# How long a new worker may take to import, build its inferencer and replay the control log
+# (which may load joblib models) before it is considered failed.
+READY_TIMEOUT_SEC = 60.0
+
+
+def _stable_hash(value: str) -> int:
+    # Python's hash() is salted per process; shard placement must be reproducible.
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    def __init__(self, shard_count: int, virtual_nodes: int = 64) -> None:
+        if shard_count <= 0:
+            raise ValueError("shard_count must be > 0")
+        points: list[tuple[int, int]] = []
+        for shard in range(shard_count):
+            for replica in range(virtual_nodes):
+                points.append((_stable_hash(f"shard-{shard}#{replica}"), shard))
+        points.sort()
+        self.shard_count = shard_count
+        self._keys = [key for key, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, track_id: str) -> int:
+        index = bisect.bisect(self._keys, _stable_hash(track_id))
+        if index == len(self._keys):
+            index = 0
+        return self._shards[index]
+
+
+def _worker_main(connection: Connection, init_kwargs: dict[str, Any], control_log: list[tuple[str, tuple]]) -> None:
+    inferencer = ArgusBrainInferencer(**init_kwargs)
+    for method, args in control_log:
+        try:
+            getattr(inferencer, method)(*args)
+        except ValueError:
+            pass
+    connection.send(("ready", None))
+
+    while True:
+        try:
+            op, payload = connection.recv()
+        except (EOFError, OSError):
+            break
+
+        if op == "stop":
+            break
+        if op == "observe":
+            connection.send(inferencer.observe_batch(payload))
+            continue
+        if op == "export":
+            connection.send(inferencer.export_tracks(payload or 0))
+            continue
+        if op == "restore":
+            connection.send(inferencer.restore_tracks(payload))
+            continue
+        if op == "call":
+            method, args = payload
+            if method not in CONTROL_METHODS:
+                connection.send(("error", f"method not allowed: {method}"))
+                continue
+            try:
+                getattr(inferencer, method)(*args)
+            except ValueError as error:
+                connection.send(("error", str(error)))
+            else:
+                connection.send(("ok", None))
+            continue
+        connection.send(("error", f"unknown op: {op}"))
+
+    connection.close()
+
+
+class _ShardWorker:
+    def __init__(self, shard: int) -> None:
+        self.shard = shard
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.connection: Connection | None = None
+        self.restarts = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive() and self.connection is not None
+
+
+class ShardedInferencer:
+    """Distributes tracks over N worker processes, each owning its own ArgusBrainInferencer.
+
+    Tracks are placed by consistent hash of the track id so every observation of a track
+    lands on the same worker and its feature window stays continuous. The aggregator keeps
+    a local registry replica so model metadata queries never round-trip to the workers.
+
+    Pipe round trips are serialised by an internal lock, so ``observe_batch`` and control
+    calls may run in worker threads (off the event loop). Metadata reads go through a
+    snapshot of the registry that is only republished once a control call has finished,
+    so they never block on, or observe half of, a broadcast in flight.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        threshold: float,
+        feature_window_ms: int,
+        model_path: str = "",
+        active_model_id: str = "heuristic-default",
+    ) -> None:
+        self._init_kwargs: dict[str, Any] = {
+            "threshold": threshold,
+            "feature_window_ms": feature_window_ms,
+            "model_path": model_path,
+            "active_model_id": active_model_id,
+        }
+        self._registry = ArgusBrainInferencer(**self._init_kwargs)
+        self._control_log: list[tuple[str, tuple]] = []
+        self._ring = ConsistentHashRing(worker_count)
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = [_ShardWorker(shard) for shard in range(worker_count)]
+        self._io_lock = threading.RLock()
+        self._view: dict[str, Any] = {}
+        self._publish_registry()
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    @property
+    def threshold(self) -> float:
+        return self._view["threshold"]
+
+    @property
+    def feature_window_ms(self) -> int:
+        return self._view["feature_window_ms"]
+
+    @property
+    def active_model_id(self) -> str:
+        return self._view["active_model_id"]
+
+    @property
+    def model_version(self) -> str:
+        return self._view["model_version"]
+
+    def list_models(self) -> list[dict[str, Any]]:
+        return [dict(model) for model in self._view["models"]]
+
+    def shard_for(self, track_id: str) -> int:
+        return self._ring.shard_for(track_id)
+
+    def start(self) -> None:
+        """Start every worker and wait until each has reported ready."""
+        with self._io_lock:
+            self._spawn_all([worker for worker in self._workers if not worker.alive])
+
+    def close(self) -> None:
+        with self._io_lock:
+            self._close_workers()
+
+    def _close_workers(self) -> None:
+        for worker in self._workers:
+            if worker.connection is not None:
+                try:
+                    worker.connection.send(("stop", None))
+                except (BrokenPipeError, OSError):
+                    pass
+                worker.connection.close()
+                worker.connection = None
+            if worker.process is not None:
+                worker.process.join(timeout=2.0)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+                worker.process = None
+
+    def status(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "shard": worker.shard,
+                "alive": worker.alive,
+                "pid": worker.process.pid if worker.process is not None else None,
+                "restarts": worker.restarts,
+            }
+            for worker in self._workers
+        ]
+
+    def _spawn(self, worker: _ShardWorker) -> bool:
+        self._launch(worker)
+        return self._await_ready(worker)
+
+    def _spawn_all(self, workers: list[_ShardWorker]) -> None:
+        # Launch first so the workers start up in parallel, then collect the handshakes.
+        for worker in workers:
+            self._launch(worker)
+        for worker in workers:
+            self._await_ready(worker)
+
+    def _launch(self, worker: _ShardWorker) -> None:
+        if worker.process is not None:
+            worker.restarts += 1
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.process.join(timeout=1.0)
+        if worker.connection is not None:
+            worker.connection.close()
+
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._init_kwargs, list(self._control_log)),
+            name=f"argus-brain-shard-{worker.shard}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker.process = process
+        worker.connection = parent_conn
+
+    def _await_ready(self, worker: _ShardWorker) -> bool:
+        """Consume the worker's ready message; a worker that never sends it is stopped.
+
+        Without the handshake the first request would silently wait out the worker's
+        startup, and that stall would be accounted to whatever frame happened to send it.
+        """
+        connection = worker.connection
+        try:
+            if connection.poll(READY_TIMEOUT_SEC) and connection.recv() == ("ready", None):
+                return True
+        except (EOFError, OSError):
+            pass
+        connection.close()
+        worker.connection = None
+        if worker.process.is_alive():
+            worker.process.terminate()
+        return False
+
+    def _registry_state(self) -> tuple[Any, ...]:
+        registry = self._registry
+        return (
+            dict(registry._models),
+            registry._active_model_id,
+            registry.threshold,
+            registry.feature_window_ms,
+            list(self._control_log),
+        )
+
+    def _rollback(self, state: tuple[Any, ...]) -> None:
+        """Restore the registry and resync every worker after a partially applied call."""
+        registry = self._registry
+        models, registry._active_model_id, registry.threshold, registry.feature_window_ms, control_log = state
+        registry._models = models
+        self._control_log = control_log
+        # Workers that accepted the call are ahead of the registry; a respawn replays the
+        # restored control log. Feature windows are carried over so tracks keep their history.
+        tracks = self.export_tracks()
+        self._spawn_all(self._workers)
+        self.restore_tracks(tracks)
+
+    def _publish_registry(self) -> None:
+        registry = self._registry
+        # Rebinding one attribute is atomic, so readers on other threads see old or new, never a mix.
+        self._view = {
+            "threshold": registry.threshold,
+            "feature_window_ms": registry.feature_window_ms,
+            "active_model_id": registry.active_model_id,
+            "model_version": registry.model_version,
+            "models": registry.list_models(),
+        }
+
+    def _broadcast(self, method: str, *args: Any) -> Any:
+        with self._io_lock:
+            state = self._registry_state()
+            try:
+                # Apply locally first so invalid requests raise ValueError before touching workers.
+                result = getattr(self._registry, method)(*args)
+                self._replicate_or_rollback(method, args, state)
+            finally:
+                self._publish_registry()
+            return result
+
+    def _replicate_or_rollback(self, method: str, args: tuple, state: tuple[Any, ...]) -> None:
+        try:
+            self._replicate(method, args)
+        except RuntimeError as error:
+            self._rollback(state)
+            raise ValueError(str(error)) from error
+
+    def _replicate(self, method: str, args: tuple) -> None:
+        if method in SETTER_METHODS:
+            self._control_log = [entry for entry in self._control_log if entry[0] != method]
+        self._control_log.append((method, args))
+        # Send to every worker before collecting replies so slow calls (model loads) overlap.
+        sent: list[_ShardWorker] = []
+        for worker in self._workers:
+            if not worker.alive:
+                continue
+            try:
+                worker.connection.send(("call", (method, args)))
+            except (BrokenPipeError, OSError):
+                # A restarted worker replays the control log, so it will catch up.
+                self._spawn(worker)
+                continue
+            sent.append(worker)
+
+        rejected = ""
+        for worker in sent:
+            try:
+                status, message = worker.connection.recv()
+            except (EOFError, OSError):
+                self._spawn(worker)
+                continue
+            if status != "ok":
+                rejected = rejected or f"shard {worker.shard} rejected {method}: {message}"
+        if rejected:
+            raise RuntimeError(rejected)
+
+    def update_threshold(self, threshold: float) -> None:
+        self._broadcast("update_threshold", threshold)
+
+    def update_feature_window(self, feature_window_ms: int) -> None:
+        self._broadcast("update_feature_window", feature_window_ms)
+
+    def activate_model(self, model_id: str) -> None:
+        self._broadcast("activate_model", model_id)
+
+    def register_joblib_model(
+        self,
+        model_id: str,
+        model_path: str,
+        activate: bool = True,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        return self._broadcast("register_joblib_model", model_id, model_path, activate, feature_layout)
+
+    def install_joblib_model(
+        self,
+        model_id: str,
+        path: Path,
+        predictor: Any,
+        activate: bool = True,
+        feature_layout: str | None = None,
+    ) -> dict[str, Any]:
+        # The aggregator already holds the predictor; workers load their own copy from disk.
+        with self._io_lock:
+            state = self._registry_state()
+            try:
+                descriptor = self._registry.install_joblib_model(
+                    model_id, path, predictor, activate=activate, feature_layout=feature_layout
+                )
+                self._replicate_or_rollback(
+                    "register_joblib_model", (model_id, str(path), activate, descriptor["featureLayout"]), state
+                )
+            finally:
+                self._publish_registry()
+            return descriptor
+
+    def unregister_model(self, model_id: str) -> None:
+        self._broadcast("unregister_model", model_id)
+
+    def load_legacy_model_path(self, model_path: str, activate: bool = True) -> dict[str, Any]:
+        return self._broadcast("load_legacy_model_path", model_path, activate)
+
+    def export_tracks(self, min_timestamp_ms: int = 0) -> dict[str, list[TrackObservation]]:
+        tracks: dict[str, list[TrackObservation]] = {}
+        with self._io_lock:
+            for worker in self._workers:
+                if not worker.alive:
+                    continue
+                try:
+                    worker.connection.send(("export", min_timestamp_ms))
+                    tracks.update(worker.connection.recv())
+                except (EOFError, BrokenPipeError, OSError):
+                    self._spawn(worker)
+        return tracks
+
+    def restore_tracks(self, tracks: dict[str, list[TrackObservation]]) -> int:
+        partitions: list[dict[str, list[TrackObservation]]] = [{} for _ in self._workers]
+        for track_id, observations in tracks.items():
+            partitions[self._ring.shard_for(track_id)][track_id] = observations
+
+        restored = 0
+        with self._io_lock:
+            for worker, partition in zip(self._workers, partitions):
+                if not partition:
+                    continue
+                if not worker.alive and not self._spawn(worker):
+                    # The tracks of a worker that cannot start simply begin cold.
+                    continue
+                worker.connection.send(("restore", partition))
+                restored += worker.connection.recv()
+        return restored
+
+    def observe(self, track_id: str, observation: TrackObservation) -> dict[str, Any]:
+        return self.observe_batch([(track_id, observation)])[0][0]
+
+    def observe_batch(
+        self,
+        observations: list[tuple[str, TrackObservation]],
+    ) -> list[tuple[dict[str, Any], float]]:
+        partitions: list[list[int]] = [[] for _ in self._workers]
+        for index, (track_id, _) in enumerate(observations):
+            partitions[self._ring.shard_for(track_id)].append(index)
+        with self._io_lock:
+            return self._observe_partitions(observations, partitions)
+
+    def _observe_partitions(
+        self,
+        observations: list[tuple[str, TrackObservation]],
+        partitions: list[list[int]],
+    ) -> list[tuple[dict[str, Any], float]]:
+        # Fan out to every shard before collecting so workers run concurrently.
+        dispatched: list[_ShardWorker] = []
+        failure: Exception | None = None
+        for worker, indices in zip(self._workers, partitions):
+            if not indices:
+                continue
+            if not worker.alive and not self._spawn(worker):
+                failure = failure or RuntimeError(f"shard {worker.shard} failed to start")
+                continue
+            try:
+                worker.connection.send(("observe", [observations[index] for index in indices]))
+            except (BrokenPipeError, OSError) as error:
+                self._spawn(worker)
+                failure = failure or RuntimeError(f"shard {worker.shard} unavailable: {error}")
+                continue
+            dispatched.append(worker)
+
+        # Always read every dispatched reply, even after a failure: an unread reply would be
+        # returned by the next recv() and attributed to the wrong tracks.
+        results: list[tuple[dict[str, Any], float] | None] = [None] * len(observations)
+        for worker in dispatched:
+            try:
+                shard_results = worker.connection.recv()
+            except (EOFError, OSError) as error:
+                self._spawn(worker)
+                failure = failure or RuntimeError(f"shard {worker.shard} died: {error}")
+                continue
+            for index, result in zip(partitions[worker.shard], shard_results):
+                results[index] = result
+
+        if failure is not None:
+            raise failure
+        return results  # type: ignore[return-value]
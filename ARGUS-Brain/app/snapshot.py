@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from inference import TrackObservation
+
+# File layout (little-endian):
+#   header   : magic, version, saved_at_ms, string_count, track_count, observation_count
+#   strings  : string_count x (u16 length + utf-8 bytes)  -- track ids, classes, decisions
+#   tracks   : track_count x (track id idx, decision idx, observation count)
+#   samples  : observation_count x (timestamp_ms, x, y, z, speed, distance, confidence, class idx)
+SNAPSHOT_MAGIC = b"ABWS"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<4sHqIII")
+_STRING_LEN = struct.Struct("<H")
+_TRACK = struct.Struct("<III")
+_SAMPLE = struct.Struct("<q6fI")
+
+
+@dataclass
+class TrackSnapshot:
+    saved_at_ms: int = 0
+    tracks: dict[str, list[TrackObservation]] = field(default_factory=dict)
+    decisions: dict[str, str] = field(default_factory=dict)
+
+
+def encode_snapshot(snapshot: TrackSnapshot) -> bytes:
+    strings: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    track_rows: list[bytes] = []
+    sample_rows: list[bytes] = []
+    for track_id, observations in snapshot.tracks.items():
+        track_rows.append(
+            _TRACK.pack(intern(track_id), intern(snapshot.decisions.get(track_id, "UNKNOWN")), len(observations))
+        )
+        for observation in observations:
+            sample_rows.append(
+                _SAMPLE.pack(
+                    observation.timestamp_ms,
+                    observation.x,
+                    observation.y,
+                    observation.z,
+                    observation.speed,
+                    observation.distance,
+                    observation.confidence,
+                    intern(observation.object_class),
+                )
+            )
+
+    string_rows: list[bytes] = []
+    for value in strings:
+        encoded = value.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            # Cut on a character boundary so the row still decodes as UTF-8.
+            encoded = encoded[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+        string_rows.append(_STRING_LEN.pack(len(encoded)) + encoded)
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        snapshot.saved_at_ms,
+        len(strings),
+        len(track_rows),
+        len(sample_rows),
+    )
+    return b"".join([header, *string_rows, *track_rows, *sample_rows])
+
+
+def decode_snapshot(buffer: memoryview | bytes, min_timestamp_ms: int = 0) -> TrackSnapshot:
+    """Decode a snapshot, dropping samples older than ``min_timestamp_ms`` and emptied tracks.
+
+    Every count and string index is checked against the buffer before use, so a corrupt or
+    truncated file raises ``ValueError``. Values are unpacked straight from ``buffer`` without
+    sub-views, so nothing keeps the underlying mmap exported once this returns or raises.
+    """
+    with memoryview(buffer) as view:
+        return _decode(view, min_timestamp_ms)
+
+
+def _decode(view: memoryview, min_timestamp_ms: int) -> TrackSnapshot:
+    size = len(view)
+    if size < _HEADER.size:
+        raise ValueError("snapshot truncated")
+    magic, version, saved_at_ms, string_count, track_count, sample_count = _HEADER.unpack_from(view, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not an ARGUS-Brain track snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version: {version}")
+    fixed_size = _HEADER.size + string_count * _STRING_LEN.size + track_count * _TRACK.size + sample_count * _SAMPLE.size
+    if fixed_size > size:
+        raise ValueError("snapshot truncated")
+
+    offset = _HEADER.size
+    strings: list[str] = []
+    for _ in range(string_count):
+        (length,) = _STRING_LEN.unpack_from(view, offset)
+        offset += _STRING_LEN.size
+        if offset + length > size:
+            raise ValueError("snapshot truncated")
+        strings.append(bytes(view[offset : offset + length]).decode("utf-8"))
+        offset += length
+
+    samples_offset = offset + track_count * _TRACK.size
+    if samples_offset + sample_count * _SAMPLE.size != size:
+        raise ValueError("snapshot size does not match its header")
+    track_rows = [_TRACK.unpack_from(view, offset + row * _TRACK.size) for row in range(track_count)]
+    if sum(count for _, _, count in track_rows) != sample_count:
+        raise ValueError("snapshot track counts do not match its sample count")
+    for track_index, decision_index, _ in track_rows:
+        if track_index >= string_count or decision_index >= string_count:
+            raise ValueError("snapshot string index out of range")
+
+    snapshot = TrackSnapshot(saved_at_ms=saved_at_ms)
+    offset = samples_offset
+    for track_index, decision_index, count in track_rows:
+        observations: list[TrackObservation] = []
+        for _ in range(count):
+            timestamp_ms, x, y, z, speed, distance, confidence, class_index = _SAMPLE.unpack_from(view, offset)
+            offset += _SAMPLE.size
+            if class_index >= string_count:
+                raise ValueError("snapshot string index out of range")
+            if timestamp_ms < min_timestamp_ms:
+                continue
+            observations.append(
+                TrackObservation(
+                    timestamp_ms=timestamp_ms,
+                    x=x,
+                    y=y,
+                    z=z,
+                    speed=speed,
+                    distance=distance,
+                    object_class=strings[class_index],
+                    confidence=confidence,
+                )
+            )
+        if observations:
+            track_id = strings[track_index]
+            snapshot.tracks[track_id] = observations
+            snapshot.decisions[track_id] = strings[decision_index]
+    return snapshot
+
+
+def write_snapshot(path: str | Path, snapshot: TrackSnapshot) -> int:
+    """Atomically replace ``path`` with the encoded snapshot; returns the byte size."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = encode_snapshot(snapshot)
+    temp_path = target.with_name(f"{target.name}.tmp")
+    with open(temp_path, "wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        # The data must be durable before the rename, or a crash can leave an empty target.
+        os.fsync(handle.fileno())
+    os.replace(temp_path, target)
+    return len(payload)
+
+
+def read_snapshot(path: str | Path, min_timestamp_ms: int = 0) -> TrackSnapshot | None:
+    target = Path(path)
+    try:
+        with open(target, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return decode_snapshot(mapped, min_timestamp_ms=min_timestamp_ms)
+    except FileNotFoundError:
+        return None
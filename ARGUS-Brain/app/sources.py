@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from config import SourceConfig
+from scheduler import backoff_delay_ms
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass
+class SourceResult:
+    source_id: str
+    payload: dict[str, Any]
+    latency_ms: float
+    received_at: float
+
+
+@dataclass
+class SourceStats:
+    source_id: str
+    url: str
+    timeout_ms: int
+    connected: bool = False
+    ok_count: int = 0
+    error_count: int = 0
+    consecutive_errors: int = 0
+    last_error: str = ""
+    last_ok_at: float = 0.0
+    retry_at: float = 0.0
+    latency_ms_history: deque[float] = field(default_factory=lambda: deque(maxlen=120))
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latency_ms_history)
+        p50 = round(ordered[int(0.5 * (len(ordered) - 1))], 3) if ordered else 0.0
+        p95 = round(ordered[int(0.95 * (len(ordered) - 1))], 3) if ordered else 0.0
+        return {
+            "id": self.source_id,
+            "url": self.url,
+            "timeoutMs": self.timeout_ms,
+            "connected": self.connected,
+            "okCount": self.ok_count,
+            "errorCount": self.error_count,
+            "consecutiveErrors": self.consecutive_errors,
+            "lastError": self.last_error,
+            "lastOkAt": self.last_ok_at,
+            "retryInMs": round(max(0.0, self.retry_at - time.monotonic()) * 1000.0, 3),
+            "latencyP50": p50,
+            "latencyP95": p95,
+        }
+
+
+class SourceFanIn:
+    """Polls every configured ARGUS source concurrently over one pooled HTTP client.
+
+    Each source has at most one request in flight. A frame waits up to its budget for
+    the sources; a source that is still pending keeps running and its payload is picked
+    up by a later frame, so one slow or dead radar never holds back the others. A failing
+    source is retried with exponential backoff and jitter instead of at the frame rate.
+    """
+
+    def __init__(
+        self,
+        sources: list[SourceConfig],
+        backoff_base_ms: float = 100.0,
+        backoff_max_ms: float = 5000.0,
+    ) -> None:
+        self.backoff_base_ms = backoff_base_ms
+        self.backoff_max_ms = backoff_max_ms
+        self._client: httpx.AsyncClient | None = None
+        self._sources: dict[str, SourceConfig] = {}
+        self._stats: dict[str, SourceStats] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.configure(sources)
+
+    @property
+    def source_ids(self) -> list[str]:
+        return list(self._sources)
+
+    def configure(self, sources: list[SourceConfig]) -> None:
+        next_sources = {source.source_id: source for source in sources}
+        for source_id in list(self._inflight):
+            previous = self._sources.get(source_id)
+            if source_id not in next_sources or previous != next_sources[source_id]:
+                self._inflight.pop(source_id).cancel()
+
+        next_stats: dict[str, SourceStats] = {}
+        for source in sources:
+            stats = self._stats.get(source.source_id)
+            if stats is None or stats.url != source.url:
+                stats = SourceStats(source.source_id, source.url, source.timeout_ms)
+            stats.timeout_ms = source.timeout_ms
+            next_stats[source.source_id] = stats
+        self._sources = next_sources
+        self._stats = next_stats
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [stats.to_dict() for stats in self._stats.values()]
+
+    def connected_count(self) -> int:
+        return sum(1 for stats in self._stats.values() if stats.connected)
+
+    def retry_delay_ms(self) -> float:
+        """Time until the next source may be polled when every source is backing off, else 0."""
+        if self._inflight or not self._stats:
+            return 0.0
+        now = time.monotonic()
+        return max(0.0, min(stats.retry_at - now for stats in self._stats.values()) * 1000.0)
+
+    async def close(self) -> None:
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Imported on first poll: httpx is one of the heavier imports on the startup path.
+            import httpx
+
+            # One keep-alive pool shared by all sources; sources added later still fit.
+            pool_size = max(8, len(self._sources) * 2)
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=pool_size),
+            )
+        return self._client
+
+    async def _fetch(self, source: SourceConfig) -> SourceResult:
+        headers: dict[str, str] = {"Accept": "application/json"}
+        if source.auth_token:
+            headers["Authorization"] = f"Bearer {source.auth_token}"
+        timeout_sec = source.timeout_ms / 1000.0
+        started = time.perf_counter()
+        response = await asyncio.wait_for(
+            self._get_client().get(source.url, headers=headers, timeout=timeout_sec),
+            timeout=timeout_sec,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if not isinstance(payload, dict):
+            raise ValueError("source payload must be a JSON object")
+        return SourceResult(
+            source_id=source.source_id,
+            payload=payload,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            received_at=time.time(),
+        )
+
+    async def collect(self, budget_sec: float) -> tuple[list[SourceResult], dict[str, str]]:
+        now = time.monotonic()
+        for source_id, source in self._sources.items():
+            if source_id not in self._inflight and self._stats[source_id].retry_at <= now:
+                self._inflight[source_id] = asyncio.create_task(self._fetch(source))
+
+        tasks = set(self._inflight.values())
+        if not tasks:
+            return [], {}
+        done, pending = await asyncio.wait(tasks, timeout=max(0.0, budget_sec))
+        if not done and pending:
+            # Nothing arrived within budget: wait for the first source, at most one source timeout.
+            timeout_sec = max(
+                self._sources[source_id].timeout_ms for source_id, task in self._inflight.items() if task in pending
+            ) / 1000.0
+            done, pending = await asyncio.wait(pending, timeout=timeout_sec, return_when=asyncio.FIRST_COMPLETED)
+
+        results: list[SourceResult] = []
+        errors: dict[str, str] = {}
+        for source_id, task in list(self._inflight.items()):
+            if task not in done:
+                continue
+            del self._inflight[source_id]
+            stats = self._stats[source_id]
+            if task.cancelled():
+                continue
+            error = task.exception()
+            if error is not None:
+                message = str(error) or type(error).__name__
+                stats.connected = False
+                stats.error_count += 1
+                stats.consecutive_errors += 1
+                stats.last_error = message
+                stats.retry_at = time.monotonic() + backoff_delay_ms(
+                    stats.consecutive_errors, self.backoff_base_ms, self.backoff_max_ms
+                ) / 1000.0
+                errors[source_id] = message
+                continue
+            result = task.result()
+            stats.connected = True
+            stats.ok_count += 1
+            stats.consecutive_errors = 0
+            stats.last_error = ""
+            stats.retry_at = 0.0
+            stats.last_ok_at = result.received_at
+            stats.latency_ms_history.append(result.latency_ms)
+            results.append(result)
+
+        # Keep configured source order so the primary source wins merges deterministically.
+        order = {source_id: index for index, source_id in enumerate(self._sources)}
+        results.sort(key=lambda result: order.get(result.source_id, len(order)))
+        return results, errors
+
+
+class SpatialDeduplicator:
+    """Grid-hashed merge of detections reported by different sources within a radius."""
+
+    def __init__(self, radius_m: float) -> None:
+        self.radius_m = radius_m
+        self._cell = max(radius_m, 1e-6)
+        self._grid: dict[tuple[int, int], list[dict[str, Any]]] = {}
+        # Kept entries in insertion order with the ids merged into each (own id first).
+        self.clusters: list[tuple[dict[str, Any], list[str]]] = []
+        self._members: dict[int, list[str]] = {}
+
+    def _key(self, position: dict[str, float]) -> tuple[int, int]:
+        return (math.floor(position["x"] / self._cell), math.floor(position["y"] / self._cell))
+
+    def find(self, entry: dict[str, Any], exclude_source: str | None = None) -> dict[str, Any] | None:
+        if self.radius_m <= 0:
+            return None
+        position = entry["position"]
+        cx, cy = self._key(position)
+        best: dict[str, Any] | None = None
+        best_dist = self.radius_m
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for candidate in self._grid.get((cx + dx, cy + dy), ()):
+                    if exclude_source is not None and exclude_source in candidate["sourceIds"]:
+                        continue
+                    other = candidate["position"]
+                    dist = math.sqrt(
+                        (other["x"] - position["x"]) ** 2
+                        + (other["y"] - position["y"]) ** 2
+                        + (other["z"] - position["z"]) ** 2
+                    )
+                    if dist <= best_dist:
+                        best, best_dist = candidate, dist
+        return best
+
+    def add(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Insert a fresh detection, merging it into an earlier one from another source if close."""
+        source_id = entry["sourceIds"][0]
+        match = self.find(entry, exclude_source=source_id)
+        if match is None:
+            self._grid.setdefault(self._key(entry["position"]), []).append(entry)
+            members = [entry["id"]]
+            self._members[id(entry)] = members
+            self.clusters.append((entry, members))
+            return entry
+        self._members[id(match)].append(entry["id"])
+        match["sourceIds"].append(source_id)
+        match["confidence"] = max(match["confidence"], entry["confidence"])
+        return match
+
+
+class FusedIdMap:
+    """Keeps the id first published for a dedup cluster while its members keep reporting.
+
+    Without it a merged object would take the id of whichever source happened to report it
+    first in a frame, so its id (and feature window, history, alerts) would flip whenever
+    the primary source missed a poll. Every member id remembers the fused id of its cluster
+    for ``ttl_ms`` after it was last seen.
+    """
+
+    def __init__(self, ttl_ms: int) -> None:
+        self.ttl_ms = ttl_ms
+        self._aliases: dict[str, tuple[str, int]] = {}
+        self._last_prune_ms = 0
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def assign(self, clusters: list[list[str]], now_ms: int) -> list[str]:
+        """Fused id of each cluster (its member ids, primary first), unique within the frame."""
+        # A member id present this frame is reserved for its own cluster, so a remembered
+        # alias never steals the id of an object that is itself being published.
+        owner = {member: index for index, members in enumerate(clusters) for member in members}
+        cutoff = now_ms - self.ttl_ms
+        taken: set[str] = set()
+        fused_ids: list[str] = []
+        for index, members in enumerate(clusters):
+            fused = members[0]
+            for member in members:
+                alias = self._aliases.get(member)
+                if alias is None or alias[1] < cutoff:
+                    continue
+                if alias[0] not in taken and owner.get(alias[0], index) == index:
+                    fused = alias[0]
+                    break
+            taken.add(fused)
+            fused_ids.append(fused)
+            for member in members:
+                self._aliases[member] = (fused, now_ms)
+
+        if now_ms - self._last_prune_ms >= self.ttl_ms:
+            self._last_prune_ms = now_ms
+            for member in [member for member, (_, seen_ms) in self._aliases.items() if seen_ms < cutoff]:
+                del self._aliases[member]
+        return fused_ids
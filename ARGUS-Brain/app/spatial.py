@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Iterable
+
+
+class TrackSpatialIndex:
+    """Uniform x/y grid over the published tracks, updated incrementally each frame.
+
+    ``update`` only moves tracks whose cell changed and drops tracks that disappeared, so a
+    frame costs O(tracks) dict operations with no rebuild. Queries touch the cells overlapping
+    the query region (or the occupied cells, whichever is fewer) and return tracks in frame
+    order. Distances are horizontal (x/y); ``z`` does not affect membership.
+    """
+
+    def __init__(self, cell_m: float = 1000.0) -> None:
+        self.cell_m = max(float(cell_m), 1e-3)
+        self._cells: dict[tuple[int, int], dict[str, tuple[float, float, int]]] = {}
+        self._track_cells: dict[str, tuple[int, int]] = {}
+        self._objects: list[dict[str, Any]] = []
+        self._extent = (0, 0, 0, 0)
+        self.moves = 0
+
+    def __len__(self) -> int:
+        return len(self._track_cells)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_m), math.floor(y / self.cell_m))
+
+    def update(self, objects: list[dict[str, Any]]) -> None:
+        """Index the published objects of a frame (each with ``id`` and ``position``)."""
+        cells = self._cells
+        track_cells = self._track_cells
+        seen: set[str] = set()
+        for order, obj in enumerate(objects):
+            track_id = obj["id"]
+            position = obj["position"]
+            x, y = position["x"], position["y"]
+            cell = self._cell(x, y)
+            previous = track_cells.get(track_id)
+            if previous != cell:
+                if previous is not None:
+                    self._discard(previous, track_id)
+                    self.moves += 1
+                track_cells[track_id] = cell
+            cells.setdefault(cell, {})[track_id] = (x, y, order)
+            seen.add(track_id)
+        if len(seen) != len(track_cells):
+            for track_id in [track_id for track_id in track_cells if track_id not in seen]:
+                self._discard(track_cells.pop(track_id), track_id)
+        self._objects = objects
+        if cells:
+            xs = [key[0] for key in cells]
+            ys = [key[1] for key in cells]
+            self._extent = (min(xs), min(ys), max(xs), max(ys))
+
+    def _discard(self, cell: tuple[int, int], track_id: str) -> None:
+        members = self._cells.get(cell)
+        if members is None:
+            return
+        members.pop(track_id, None)
+        if not members:
+            del self._cells[cell]
+
+    def _cells_in(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterable[dict[str, tuple[float, float, int]]]:
+        low_x, low_y = self._cell(min_x, min_y)
+        high_x, high_y = self._cell(max_x, max_y)
+        span = (high_x - low_x + 1) * (high_y - low_y + 1)
+        if span > len(self._cells):
+            # Large region: walking occupied cells is cheaper than walking the rectangle.
+            return (
+                members
+                for (cx, cy), members in self._cells.items()
+                if low_x <= cx <= high_x and low_y <= cy <= high_y
+            )
+        cells = self._cells
+        return (
+            cells[(cx, cy)]
+            for cx in range(low_x, high_x + 1)
+            for cy in range(low_y, high_y + 1)
+            if (cx, cy) in cells
+        )
+
+    def _collect(self, orders: list[int]) -> list[dict[str, Any]]:
+        orders.sort()
+        return [self._objects[order] for order in orders]
+
+    def within_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[dict[str, Any]]:
+        if min_x > max_x or min_y > max_y:
+            return []
+        orders = [
+            order
+            for members in self._cells_in(min_x, min_y, max_x, max_y)
+            for x, y, order in members.values()
+            if min_x <= x <= max_x and min_y <= y <= max_y
+        ]
+        return self._collect(orders)
+
+    def within_radius(self, x: float, y: float, radius_m: float) -> list[dict[str, Any]]:
+        if radius_m < 0:
+            return []
+        limit = radius_m * radius_m
+        orders = [
+            order
+            for members in self._cells_in(x - radius_m, y - radius_m, x + radius_m, y + radius_m)
+            for px, py, order in members.values()
+            if (px - x) ** 2 + (py - y) ** 2 <= limit
+        ]
+        return self._collect(orders)
+
+    def nearest(self, x: float, y: float, k: int = 1, max_distance_m: float | None = None) -> list[tuple[float, dict[str, Any]]]:
+        """Up to ``k`` ``(distance, object)`` pairs closest to ``(x, y)``, nearest first.
+
+        Searches rings of cells outward from the query cell and stops once the next ring is
+        farther than the current k-th best, so cost follows local density, not track count.
+        """
+        if k <= 0 or not self._cells:
+            return []
+        cx, cy = self._cell(x, y)
+        cell = self.cell_m
+        limit = math.inf if max_distance_m is None else max_distance_m
+        low_x, low_y, high_x, high_y = self._extent
+        max_ring = max(cx - low_x, high_x - cx, cy - low_y, high_y - cy)
+        # Bounded max-heap of (-distance, order).
+        best: list[tuple[float, int]] = []
+
+        def consider(members: dict[str, tuple[float, float, int]]) -> None:
+            for px, py, order in members.values():
+                distance = math.hypot(px - x, py - y)
+                if distance > limit:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, order))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, order))
+
+        ring = 0
+        while ring <= max_ring:
+            # Nearest possible point of this ring is (ring - 1) cells from the query point.
+            ring_floor = max(0, ring - 1) * cell
+            if ring_floor > limit or (len(best) == k and ring_floor > -best[0][0]):
+                break
+            if (2 * ring + 1) ** 2 > len(self._cells):
+                # Sparse tracks far from the query: one pass over the occupied cells is cheaper
+                # than walking more empty rings.
+                scored = [
+                    (math.hypot(px - x, py - y), order)
+                    for members in self._cells.values()
+                    for px, py, order in members.values()
+                ]
+                return [
+                    (distance, self._objects[order])
+                    for distance, order in heapq.nsmallest(k, scored)
+                    if distance <= limit
+                ]
+            for members in self._ring(cx, cy, ring):
+                consider(members)
+            ring += 1
+        return [(-negative, self._objects[order]) for negative, order in sorted(best, reverse=True)]
+
+    def _ring(self, cx: int, cy: int, ring: int) -> Iterable[dict[str, tuple[float, float, int]]]:
+        cells = self._cells
+        if ring == 0:
+            keys: Iterable[tuple[int, int]] = ((cx, cy),)
+        else:
+            top = ((cx + dx, cy + ring) for dx in range(-ring, ring + 1))
+            bottom = ((cx + dx, cy - ring) for dx in range(-ring, ring + 1))
+            left = ((cx - ring, cy + dy) for dy in range(-ring + 1, ring))
+            right = ((cx + ring, cy + dy) for dy in range(-ring + 1, ring))
+            keys = (key for side in (top, bottom, left, right) for key in side)
+        return (cells[key] for key in keys if key in cells)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tracks": len(self._track_cells),
+            "cells": len(self._cells),
+            "cellM": self.cell_m,
+            "moves": self.moves,
+        }
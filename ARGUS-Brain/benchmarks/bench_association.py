@@ -0,0 +1,105 @@
+"""Id-less detection association cost as detections per frame grow.
+
+Compares the gated, grid-hashed associator with an all-pairs gating pass (the O(n^2) step
+it replaces). Run from the ARGUS-Brain directory:
+
+    python benchmarks/bench_association.py
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from association import DetectionAssociator  # noqa: E402
+
+
+def _targets(count: int, extent_m: float, rng: random.Random) -> list[list[float]]:
+    return [
+        [rng.uniform(-extent_m, extent_m), rng.uniform(-extent_m, extent_m), rng.uniform(50, 500), rng.uniform(-40, 40), rng.uniform(-40, 40)]
+        for _ in range(count)
+    ]
+
+
+def _frame(targets: list[list[float]], dt: float, rng: random.Random) -> list[tuple[int, dict]]:
+    detections = []
+    for index, target in enumerate(targets):
+        target[0] += target[3] * dt
+        target[1] += target[4] * dt
+        detections.append(
+            (
+                index,
+                {
+                    "position": {"x": target[0] + rng.gauss(0, 3), "y": target[1] + rng.gauss(0, 3), "z": target[2]},
+                    "velocity": {"x": 0.0, "y": 0.0, "z": 0.0},
+                },
+            )
+        )
+    rng.shuffle(detections)
+    return detections
+
+
+def _all_pairs(detections: list[dict], previous: list[dict], gate_m: float) -> int:
+    gate_sq = gate_m * gate_m
+    pairs = 0
+    for detection in detections:
+        a = detection["position"]
+        for other in previous:
+            b = other["position"]
+            if (a["x"] - b["x"]) ** 2 + (a["y"] - b["y"]) ** 2 + (a["z"] - b["z"]) ** 2 <= gate_sq:
+                pairs += 1
+    return pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--detections", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000])
+    parser.add_argument("--density", type=float, default=20.0, help="targets per km^2")
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--gate-m", type=float, default=75.0)
+    parser.add_argument("--all-pairs-max", type=int, default=2000, help="skip the O(n^2) pass above this size")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print(f"{'dets':>6} {'assoc ms':>9} {'us/det':>7} {'all-pairs ms':>13} {'id switches':>12} {'greedy':>7}")
+    for count in args.detections:
+        extent_m = math.sqrt(count / args.density) * 500.0
+        targets = _targets(count, extent_m, rng)
+        associator = DetectionAssociator(gate_m=args.gate_m)
+        truth: dict[int, str] = {}
+        switches = 0
+        elapsed = 0.0
+        previous: list[dict] = []
+        for frame in range(args.frames + 1):
+            frame_detections = _frame(targets, args.frame_ms / 1000.0, rng)
+            detections = [detection for _, detection in frame_detections]
+            started = time.perf_counter()
+            associator.associate("bench", detections, frame * args.frame_ms)
+            if frame:  # frame 0 only creates tracks
+                elapsed += time.perf_counter() - started
+            for index, detection in frame_detections:
+                if frame and truth[index] != detection["id"]:
+                    switches += 1
+                truth[index] = detection["id"]
+            if frame == 1:
+                previous = detections
+        all_pairs = "-"
+        if count <= args.all_pairs_max:
+            started = time.perf_counter()
+            _all_pairs(detections, previous, args.gate_m)
+            all_pairs = f"{(time.perf_counter() - started) * 1000:.1f}"
+        per_frame_ms = elapsed / args.frames * 1000
+        print(
+            f"{count:>6} {per_frame_ms:>9.1f} {per_frame_ms * 1000 / count:>7.1f} {all_pairs:>13} "
+            f"{switches:>12} {associator.stats()['greedyComponents']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
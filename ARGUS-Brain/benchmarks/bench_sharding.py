@@ -0,0 +1,84 @@
+"""Inference throughput of the in-process inferencer vs. N shard worker processes.
+
+Run from the ARGUS-Brain directory:
+
+    python benchmarks/bench_sharding.py --shards 1 2 4 8
+
+Scaling follows the number of free cores; on a single core the shard rows mostly show the
+pipe overhead.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from inference import ArgusBrainInferencer, TrackObservation  # noqa: E402
+from sharding import ShardedInferencer  # noqa: E402
+
+
+def _frames(tracks: int, frames: int, rng: random.Random) -> list[list[tuple[str, TrackObservation]]]:
+    starts = [(rng.uniform(-5000, 5000), rng.uniform(-5000, 5000), rng.uniform(50, 500)) for _ in range(tracks)]
+    batches = []
+    for frame in range(frames):
+        timestamp_ms = 1_000_000 + frame * 100
+        batches.append(
+            [
+                (
+                    f"T-{index}",
+                    TrackObservation(
+                        timestamp_ms=timestamp_ms,
+                        x=x + frame * 3.0,
+                        y=y,
+                        z=z,
+                        speed=30.0,
+                        distance=(x * x + y * y) ** 0.5,
+                        object_class="UAV",
+                        confidence=0.8,
+                    ),
+                )
+                for index, (x, y, z) in enumerate(starts)
+            ]
+        )
+    return batches
+
+
+def _throughput(inferencer, batches: list[list[tuple[str, TrackObservation]]]) -> float:
+    inferencer.observe_batch(batches[0])  # warm-up: worker start, first feature windows
+    started = time.perf_counter()
+    for batch in batches[1:]:
+        inferencer.observe_batch(batch)
+    elapsed = time.perf_counter() - started
+    return sum(len(batch) for batch in batches[1:]) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tracks", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    batches = _frames(args.tracks, args.frames, random.Random(7))
+    print(f"cores={os.cpu_count()} tracks={args.tracks} frames={args.frames}")
+    print(f"{'shards':>7} {'obs/s':>10} {'speedup':>8}")
+
+    baseline = _throughput(ArgusBrainInferencer(threshold=0.6, feature_window_ms=5000), batches)
+    print(f"{'inline':>7} {baseline:>10.0f} {1.0:>8.2f}")
+    for count in args.shards:
+        pool = ShardedInferencer(count, threshold=0.6, feature_window_ms=5000)
+        pool.start()
+        try:
+            rate = _throughput(pool, batches)
+        finally:
+            pool.close()
+        print(f"{count:>7} {rate:>10.0f} {rate / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Spatial index vs linear scan for region and nearest-track queries.
+
+Run from the ARGUS-Brain directory:
+
+    python benchmarks/bench_spatial.py
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from spatial import TrackSpatialIndex  # noqa: E402
+
+
+def _objects(count: int, extent_m: float, rng: random.Random) -> list[dict]:
+    return [
+        {"id": f"T-{index}", "position": {"x": rng.uniform(-extent_m, extent_m), "y": rng.uniform(-extent_m, extent_m), "z": 0.0}}
+        for index in range(count)
+    ]
+
+
+def _linear_bbox(objects: list[dict], min_x: float, min_y: float, max_x: float, max_y: float) -> list[dict]:
+    return [
+        obj for obj in objects
+        if min_x <= obj["position"]["x"] <= max_x and min_y <= obj["position"]["y"] <= max_y
+    ]
+
+
+def _linear_nearest(objects: list[dict], x: float, y: float, k: int) -> list[dict]:
+    ranked = sorted(objects, key=lambda obj: math.hypot(obj["position"]["x"] - x, obj["position"]["y"] - y))
+    return ranked[:k]
+
+
+def _time_per_call(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--extent-m", type=float, default=50000.0, help="tracks spread over +-extent in x/y")
+    parser.add_argument("--sector-m", type=float, default=5000.0, help="bbox query side length")
+    parser.add_argument("--cell-m", type=float, default=1000.0)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print(
+        f"{'tracks':>7} {'update us':>10} {'bbox us':>9} {'scan us':>9} "
+        f"{'knn us':>8} {'scan us':>9} {'hits':>6}"
+    )
+    for count in args.tracks:
+        objects = _objects(count, args.extent_m, rng)
+        index = TrackSpatialIndex(args.cell_m)
+        index.update(objects)
+        # Steady state: every track moves a little per frame.
+        moved = [
+            {"id": obj["id"], "position": {"x": obj["position"]["x"] + 30.0, "y": obj["position"]["y"], "z": 0.0}}
+            for obj in objects
+        ]
+        update_us = _time_per_call(lambda: (index.update(moved), index.update(objects)), 5) / 2
+
+        centers = [(rng.uniform(-args.extent_m, args.extent_m), rng.uniform(-args.extent_m, args.extent_m)) for _ in range(args.queries)]
+        boxes = [(x, y, x + args.sector_m, y + args.sector_m) for x, y in centers]
+        hits = sum(len(index.within_bbox(*box)) for box in boxes) / len(boxes)
+        position = iter(boxes * 1000)
+        bbox_us = _time_per_call(lambda: index.within_bbox(*next(position)), len(boxes))
+        scan_repeat = max(3, min(len(boxes), 2_000_000 // max(count, 1)))
+        position = iter(boxes * 1000)
+        scan_us = _time_per_call(lambda: _linear_bbox(objects, *next(position)), scan_repeat)
+
+        point = iter(centers * 1000)
+        knn_us = _time_per_call(lambda: index.nearest(*next(point), k=5), len(centers))
+        point = iter(centers * 1000)
+        knn_scan_us = _time_per_call(lambda: _linear_nearest(objects, *next(point), 5), max(3, scan_repeat // 10))
+
+        print(
+            f"{count:>7} {update_us:>10.0f} {bbox_us:>9.1f} {scan_us:>9.1f} "
+            f"{knn_us:>8.1f} {knn_scan_us:>9.1f} {hits:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
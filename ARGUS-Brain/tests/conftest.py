@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The service modules import each other by flat name, as when run from app/.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
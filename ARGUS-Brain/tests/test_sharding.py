@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from inference import ArgusBrainInferencer, TrackObservation
+from sharding import ConsistentHashRing, ShardedInferencer
+
+
+def _frames(tracks: int, frames: int, prefix: str = "T") -> list[list[tuple[str, TrackObservation]]]:
+    rng = random.Random(3)
+    starts = [(rng.uniform(-5000, 5000), rng.uniform(-5000, 5000), rng.uniform(50, 500)) for _ in range(tracks)]
+    return [
+        [
+            (
+                f"{prefix}-{index}",
+                TrackObservation(
+                    timestamp_ms=1_000_000 + frame * 100,
+                    x=x + frame * rng.uniform(0.0, 6.0),
+                    y=y,
+                    z=z,
+                    speed=rng.uniform(5.0, 80.0),
+                    distance=(x * x + y * y) ** 0.5,
+                    object_class="UAV" if index % 3 else "BIRD",
+                    confidence=0.8,
+                ),
+            )
+            for index, (x, y, z) in enumerate(starts)
+        ]
+        for frame in range(frames)
+    ]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ShardedInferencer(2, threshold=0.6, feature_window_ms=5000)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def test_ring_is_stable_and_uses_every_shard():
+    ring = ConsistentHashRing(4)
+    shards = [ring.shard_for(f"T-{index}") for index in range(400)]
+    assert shards == [ConsistentHashRing(4).shard_for(f"T-{index}") for index in range(400)]
+    assert set(shards) == {0, 1, 2, 3}
+
+
+def test_sharded_observe_batch_matches_in_process(pool):
+    inline = ArgusBrainInferencer(threshold=0.6, feature_window_ms=5000)
+    for batch in _frames(tracks=40, frames=6):
+        expected = [result for result, _ in inline.observe_batch(batch)]
+        assert [result for result, _ in pool.observe_batch(batch)] == expected
+
+
+def test_broadcast_setting_reaches_every_shard(pool):
+    inline = ArgusBrainInferencer(threshold=0.6, feature_window_ms=5000)
+    pool.update_threshold(0.8)
+    inline.update_threshold(0.8)
+    try:
+        batch = _frames(tracks=20, frames=1, prefix="B")[0]
+        assert [result for result, _ in pool.observe_batch(batch)] == [
+            result for result, _ in inline.observe_batch(batch)
+        ]
+        assert pool.threshold == 0.8
+    finally:
+        pool.update_threshold(0.6)
+
+
+def test_invalid_broadcast_raises_and_keeps_registry(pool):
+    with pytest.raises(ValueError):
+        pool.activate_model("missing-model")
+    assert pool.active_model_id == "heuristic-default"
+    assert [model["modelId"] for model in pool.list_models()] == ["heuristic-default"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from inference import TrackObservation
+from snapshot import TrackSnapshot, decode_snapshot, encode_snapshot, read_snapshot, write_snapshot
+
+
+def _observation(timestamp_ms: int, object_class: str = "UAV") -> TrackObservation:
+    # Values exactly representable as float32, the on-disk sample precision.
+    return TrackObservation(
+        timestamp_ms=timestamp_ms,
+        x=1.5,
+        y=-2.25,
+        z=300.0,
+        speed=42.5,
+        distance=1250.0,
+        object_class=object_class,
+        confidence=0.75,
+    )
+
+
+def _snapshot() -> TrackSnapshot:
+    return TrackSnapshot(
+        saved_at_ms=5_000,
+        tracks={
+            "T-1": [_observation(1_000), _observation(2_000, "BIRD")],
+            "레이더-2": [_observation(1_500)],
+        },
+        decisions={"T-1": "UAV", "레이더-2": "NON_UAV"},
+    )
+
+
+def test_round_trip():
+    snapshot = _snapshot()
+    assert decode_snapshot(encode_snapshot(snapshot)) == snapshot
+
+
+def test_min_timestamp_drops_old_samples_and_emptied_tracks():
+    decoded = decode_snapshot(encode_snapshot(_snapshot()), min_timestamp_ms=1_800)
+    assert list(decoded.tracks) == ["T-1"]
+    assert [observation.timestamp_ms for observation in decoded.tracks["T-1"]] == [2_000]
+    assert decoded.decisions == {"T-1": "UAV"}
+
+
+def test_file_round_trip(tmp_path):
+    path = tmp_path / "nested" / "tracks.bin"
+    assert read_snapshot(path) is None
+    size = write_snapshot(path, _snapshot())
+    assert path.stat().st_size == size
+    assert read_snapshot(path) == _snapshot()
+
+
+def test_long_multibyte_id_is_cut_on_a_character_boundary():
+    track_id = "가" * 30_000  # 90 000 UTF-8 bytes, over the 16-bit length field
+    snapshot = TrackSnapshot(tracks={track_id: [_observation(1_000)]}, decisions={track_id: "UAV"})
+    (decoded_id,) = decode_snapshot(encode_snapshot(snapshot)).tracks
+    assert len(decoded_id.encode("utf-8")) <= 0xFFFF
+    assert track_id.startswith(decoded_id)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda payload: payload[:10],
+        lambda payload: payload[:-1],
+        lambda payload: payload + b"\x00",
+        lambda payload: b"XXXX" + payload[4:],
+        lambda payload: payload[:4] + struct.pack("<H", 99) + payload[6:],
+        # Claim far more strings than the file holds.
+        lambda payload: payload[:14] + struct.pack("<I", 1_000_000) + payload[18:],
+    ],
+)
+def test_corrupt_input_raises_value_error(corrupt):
+    with pytest.raises(ValueError):
+        decode_snapshot(corrupt(encode_snapshot(_snapshot())))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from config import ServiceConfig, _to_sources
+from scheduler import FrameScheduler
+from sources import FusedIdMap, SourceConfig, SourceFanIn
+
+
+def test_fused_id_survives_primary_missing_a_poll():
+    fused_ids = FusedIdMap(ttl_ms=1500)
+    assert fused_ids.assign([["a:1", "b:7"]], now_ms=0) == ["a:1"]
+    # The primary source missed this poll; the cluster keeps its published id.
+    assert fused_ids.assign([["b:7"]], now_ms=100) == ["a:1"]
+    assert fused_ids.assign([["a:1", "b:7"]], now_ms=200) == ["a:1"]
+
+
+def test_fused_id_expires_after_ttl():
+    fused_ids = FusedIdMap(ttl_ms=1500)
+    fused_ids.assign([["a:1", "b:7"]], now_ms=0)
+    assert fused_ids.assign([["b:7"]], now_ms=2000) == ["b:7"]
+
+
+def test_split_cluster_never_publishes_a_duplicate_id():
+    fused_ids = FusedIdMap(ttl_ms=1500)
+    fused_ids.assign([["a:1", "b:7"]], now_ms=0)
+    # Both members now report separately; each keeps a distinct id.
+    assert fused_ids.assign([["b:7"], ["a:1"]], now_ms=100) == ["b:7", "a:1"]
+    split = fused_ids.assign([["b:7", "c:3"], ["a:9"]], now_ms=200)
+    assert len(set(split)) == len(split)
+
+
+def test_apply_patch_is_all_or_nothing():
+    config = ServiceConfig()
+    before = config.to_dict()
+    with pytest.raises(ValueError):
+        config.apply_patch({"uavThreshold": 70, "argusSources": [{"id": "no-url"}]})
+    assert config.to_dict() == before
+    config.apply_patch({"uavThreshold": 70})
+    assert config.uav_threshold == 70.0
+
+
+@pytest.mark.parametrize("value", ["{not json", '{"id": "x"}', '[{"id": "x"}]', '[{"url": "http://a"}, 5]'])
+def test_bad_source_env_falls_back_to_the_default_source(value):
+    assert _to_sources(value) == []
+
+
+def test_collect_wait_is_bounded_by_the_source_timeout():
+    async def hang(reader, writer):
+        # Never answer; return once the client hangs up.
+        await reader.read()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(hang, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        fan_in = SourceFanIn([SourceConfig("slow", f"http://127.0.0.1:{port}/", timeout_ms=300)])
+        started = time.monotonic()
+        try:
+            results, _ = await asyncio.wait_for(fan_in.collect(0.01), timeout=2.0)
+            return results, time.monotonic() - started
+        finally:
+            await fan_in.close()
+            server.close()
+            await server.wait_closed()
+
+    results, elapsed_sec = asyncio.run(run())
+    assert results == []
+    assert elapsed_sec < 1.0
+
+
+def test_backing_off_sources_return_an_empty_poll():
+    async def run():
+        fan_in = SourceFanIn([SourceConfig("dead", "http://127.0.0.1:1/", timeout_ms=200)], backoff_base_ms=10_000)
+        try:
+            return await fan_in.collect(0.5), await fan_in.collect(0.5), fan_in.retry_delay_ms()
+        finally:
+            await fan_in.close()
+
+    first, second, retry_delay_ms = asyncio.run(run())
+    assert set(first[1]) == {"dead"}
+    assert second == ([], {})
+    assert retry_delay_ms > 0
+
+
+def test_idle_tick_keeps_the_error_streak():
+    scheduler = FrameScheduler(100)
+    scheduler.complete(False)
+    scheduler.complete(False)
+    scheduler.complete(None)
+    assert scheduler.consecutive_errors == 2
+    scheduler.complete(True)
+    assert scheduler.consecutive_errors == 0
@@ -0,0 +1,348 @@
+"""Offline feature extraction for recorded signal captures.
+
+Memory-maps a raw or ``.npy`` capture, splits every track into fixed windows, extracts
+features in parallel worker processes and streams them to a columnar output. Run from the
+ARGUS-Eye directory:
+
+    python -m app.batch capture.npy --sample-rate 8000 --window 4096 --output features/
+    python -m app.batch capture.bin --dtype <i2 --tracks 16 --layout interleaved \\
+        --sample-rate 20000 --window 2048 --hop 1024 --spectral-frame-size 256 --output features.parquet
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+import numpy as np
+
+from .pipeline import FEATURE_KEYS, summarize_block
+from .spectral import SpectralFeatureEngine
+
+INDEX_COLUMNS: tuple[str, ...] = ("track", "window", "start_sample", "start_sec")
+
+
+@dataclass(frozen=True)
+class CaptureLayout:
+    """Where the samples live in the capture file.
+
+    ``planar`` stores one contiguous row per track (``tracks x samples``); ``interleaved``
+    stores one row per sample instant (``samples x tracks``).
+    """
+
+    path: str
+    dtype: str
+    tracks: int
+    samples: int
+    offset: int
+    layout: str
+
+    @classmethod
+    def open(cls, path: str, dtype: str | None, tracks: int | None, layout: str) -> "CaptureLayout":
+        file_path = Path(path)
+        if file_path.suffix == ".npy":
+            with file_path.open("rb") as handle:
+                version = np.lib.format.read_magic(handle)
+                read_header = (
+                    np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+                )
+                shape, fortran_order, npy_dtype = read_header(handle)
+                offset = handle.tell()
+            if len(shape) == 1:
+                shape, layout = (1, shape[0]), "planar"
+            elif len(shape) != 2:
+                raise ValueError(f"expected a 1-D or 2-D capture, got shape {shape}")
+            if fortran_order:
+                # Column-major (a, b) is row-major (b, a).
+                shape = shape[::-1]
+                layout = "interleaved" if layout == "planar" else "planar"
+            if layout == "planar":
+                track_count, sample_count = shape
+            else:
+                sample_count, track_count = shape
+            return cls(str(file_path), npy_dtype.str, int(track_count), int(sample_count), offset, layout)
+
+        if dtype is None or tracks is None:
+            raise ValueError("raw captures need --dtype and --tracks")
+        item = np.dtype(dtype)
+        size = file_path.stat().st_size
+        sample_count = size // (item.itemsize * tracks)
+        return cls(str(file_path), item.str, tracks, sample_count, 0, layout)
+
+    def read(self, first_track: int, track_count: int, start: int, count: int) -> np.ndarray:
+        """Map only ``[start, start + count)`` of the given tracks; returns ``tracks x count``."""
+        item = np.dtype(self.dtype)
+        if self.layout == "interleaved":
+            mapped = np.memmap(
+                self.path,
+                dtype=item,
+                mode="r",
+                offset=self.offset + start * self.tracks * item.itemsize,
+                shape=(count, self.tracks),
+            )
+            block = np.array(mapped[:, first_track : first_track + track_count].T)
+        else:
+            block = np.empty((track_count, count), dtype=item)
+            for row in range(track_count):
+                mapped = np.memmap(
+                    self.path,
+                    dtype=item,
+                    mode="r",
+                    offset=self.offset + ((first_track + row) * self.samples + start) * item.itemsize,
+                    shape=(count,),
+                )
+                block[row] = mapped
+        del mapped  # unmap now so resident pages stay bounded by one task
+        return block
+
+
+@dataclass(frozen=True)
+class _Task:
+    first_track: int
+    track_count: int
+    first_window: int
+    window_count: int
+
+
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(capture: dict[str, Any], window: int, hop: int, sample_rate_hz: float, spectral_frame_size: int) -> None:
+    _worker_state["capture"] = CaptureLayout(**capture)
+    _worker_state["window"] = window
+    _worker_state["hop"] = hop
+    _worker_state["rate"] = sample_rate_hz
+    _worker_state["spectral"] = (
+        SpectralFeatureEngine(frame_size=spectral_frame_size) if spectral_frame_size > 0 else None
+    )
+
+
+def _run_task(task: _Task) -> tuple[_Task, dict[str, np.ndarray]]:
+    capture: CaptureLayout = _worker_state["capture"]
+    window, hop, rate = _worker_state["window"], _worker_state["hop"], _worker_state["rate"]
+    spectral: SpectralFeatureEngine | None = _worker_state["spectral"]
+
+    start = task.first_window * hop
+    span = (task.window_count - 1) * hop + window
+    block = capture.read(task.first_track, task.track_count, start, span)
+    # (tracks, windows, window) strided view -> rows ordered track-major.
+    windows = np.lib.stride_tricks.sliding_window_view(block, window, axis=1)[:, ::hop][:, : task.window_count]
+    rows = windows.reshape(-1, window)
+
+    columns = summarize_block(rows, rate)
+    if spectral is not None:
+        columns.update(spectral.compute_block(rows, rate))
+    return task, columns
+
+
+def feature_columns(spectral_frame_size: int) -> list[str]:
+    names = list(FEATURE_KEYS)
+    if spectral_frame_size > 0:
+        names += SpectralFeatureEngine(frame_size=spectral_frame_size).feature_names()
+    return names
+
+
+class _NpyColumnWriter:
+    """One preallocated ``.npy`` per column (row = ``track * windows + window``).
+
+    Rows are written through plain file handles as tasks finish instead of through a
+    mapping, so the output never stays resident in this process however large it grows.
+    """
+
+    def __init__(self, directory: Path, columns: list[str], rows: int, metadata: dict[str, Any]) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.columns: dict[str, tuple[BinaryIO, int, np.dtype]] = {}
+        for name in columns:
+            dtype = np.dtype(np.int64 if name in INDEX_COLUMNS[:3] else np.float64)
+            path = directory / f"{name}.npy"
+            header = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(rows,))
+            data_offset = header.offset
+            del header
+            self.columns[name] = (path.open("r+b"), data_offset, dtype)
+        (directory / "columns.json").write_text(
+            json.dumps({"rows": rows, "columns": columns, **metadata}, indent=2), encoding="utf-8"
+        )
+
+    def write(self, first_rows: np.ndarray, run_length: int, values: dict[str, np.ndarray]) -> None:
+        # Each task covers ``run_length`` consecutive windows of several tracks.
+        for name, (handle, data_offset, dtype) in self.columns.items():
+            column = np.ascontiguousarray(values[name], dtype=dtype)
+            for index, first_row in enumerate(first_rows):
+                handle.seek(data_offset + int(first_row) * dtype.itemsize)
+                handle.write(column[index * run_length : (index + 1) * run_length].tobytes())
+
+    def close(self) -> None:
+        for handle, _, _ in self.columns.values():
+            handle.close()
+        self.columns.clear()
+
+
+class _ParquetWriter:
+    """Row groups appended in completion order; ``track``/``window`` identify each row."""
+
+    def __init__(self, path: Path, columns: list[str], metadata: dict[str, Any]) -> None:
+        try:
+            self.pa = importlib.import_module("pyarrow")
+            parquet = importlib.import_module("pyarrow.parquet")
+        except ImportError as error:
+            raise SystemExit("parquet output needs pyarrow; write to a directory for .npy columns") from error
+        fields = [
+            self.pa.field(name, self.pa.int64() if name in INDEX_COLUMNS[:3] else self.pa.float64())
+            for name in columns
+        ]
+        schema = self.pa.schema(fields, metadata={"argus": json.dumps(metadata)})
+        self.columns = columns
+        self.writer = parquet.ParquetWriter(str(path), schema)
+
+    def write(self, first_rows: np.ndarray, run_length: int, values: dict[str, np.ndarray]) -> None:
+        self.writer.write_table(
+            self.pa.table({name: values[name] for name in self.columns}),
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _plan(capture: CaptureLayout, window_total: int, tracks_per_task: int, windows_per_task: int) -> Iterator[_Task]:
+    for first_track in range(0, capture.tracks, tracks_per_task):
+        track_count = min(tracks_per_task, capture.tracks - first_track)
+        for first_window in range(0, window_total, windows_per_task):
+            yield _Task(first_track, track_count, first_window, min(windows_per_task, window_total - first_window))
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def _check_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject inconsistent options before any worker, capture map or output exists."""
+    if args.sample_rate <= 0:
+        parser.error("--sample-rate must be > 0")
+    if args.window <= 0:
+        parser.error("--window must be > 0")
+    if args.hop < 0:
+        parser.error("--hop must be >= 0")
+    if args.tracks is not None and args.tracks <= 0:
+        parser.error("--tracks must be > 0")
+    if args.spectral_frame_size < 0:
+        parser.error("--spectral-frame-size must be >= 0 (0 = off)")
+    if args.spectral_frame_size:
+        if args.spectral_frame_size < 8:
+            parser.error("--spectral-frame-size must be >= 8")
+        if args.spectral_frame_size > args.window:
+            parser.error(f"--spectral-frame-size {args.spectral_frame_size} exceeds --window {args.window}")
+    if args.workers < 0:
+        parser.error("--workers must be >= 0 (0 = all cores)")
+    if args.task_mb <= 0:
+        parser.error("--task-mb must be > 0")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="raw sample file or .npy")
+    parser.add_argument("--output", required=True, help="directory (one .npy per column) or *.parquet")
+    parser.add_argument("--sample-rate", type=float, required=True)
+    parser.add_argument("--window", type=int, default=4096, help="samples per feature window")
+    parser.add_argument("--hop", type=int, default=0, help="samples between window starts (0 = window)")
+    parser.add_argument("--dtype", help="raw captures: sample dtype, e.g. <i2 or <f4")
+    parser.add_argument("--tracks", type=int, help="raw captures: number of tracks")
+    parser.add_argument("--layout", choices=("planar", "interleaved"), default="planar")
+    parser.add_argument("--spectral-frame-size", type=int, default=0, help="add STFT features (0 = off)")
+    parser.add_argument("--workers", type=int, default=0, help="0 = all cores")
+    parser.add_argument("--task-mb", type=float, default=16.0, help="samples mapped per task (bounds RSS)")
+    parser.add_argument("--progress-sec", type=float, default=1.0)
+    args = parser.parse_args(argv)
+    _check_options(parser, args)
+
+    hop = args.hop or args.window
+    try:
+        capture = CaptureLayout.open(args.capture, args.dtype, args.tracks, args.layout)
+    except (OSError, ValueError, TypeError) as error:
+        parser.error(f"cannot open capture {args.capture}: {error}")
+    if capture.samples < args.window:
+        parser.error(f"capture has {capture.samples} samples per track, fewer than --window {args.window}")
+    window_total = (capture.samples - args.window) // hop + 1
+    rows_total = window_total * capture.tracks
+
+    # Size tasks so each maps about --task-mb of samples.
+    item = np.dtype(capture.dtype).itemsize
+    budget = max(1, int(args.task_mb * 2**20 / item))
+    tracks_per_task = capture.tracks if capture.layout == "interleaved" else max(1, min(capture.tracks, budget // args.window))
+    windows_per_task = max(1, (budget // tracks_per_task - args.window) // hop + 1)
+
+    columns = list(INDEX_COLUMNS) + feature_columns(args.spectral_frame_size)
+    metadata = {
+        "capture": os.path.abspath(args.capture),
+        "sampleRateHz": args.sample_rate,
+        "window": args.window,
+        "hop": hop,
+        "tracks": capture.tracks,
+        "windowsPerTrack": window_total,
+    }
+    output = Path(args.output)
+    writer: _NpyColumnWriter | _ParquetWriter
+    if output.suffix == ".parquet":
+        writer = _ParquetWriter(output, columns, metadata)
+    else:
+        writer = _NpyColumnWriter(output, columns, rows_total, metadata)
+
+    workers = args.workers or os.cpu_count() or 1
+    context = multiprocessing.get_context("spawn")
+    tasks = list(_plan(capture, window_total, tracks_per_task, windows_per_task))
+    started = time.perf_counter()
+    last_report = started
+    done_rows = 0
+    sample_bytes_per_row = args.window * item
+
+    print(
+        f"[batch] {capture.tracks} tracks x {capture.samples} samples ({capture.layout}, {capture.dtype}) -> "
+        f"{rows_total} windows in {len(tasks)} tasks on {workers} workers",
+        file=sys.stderr,
+        flush=True,
+    )
+    with context.Pool(
+        workers,
+        initializer=_init_worker,
+        initargs=(asdict(capture), args.window, hop, args.sample_rate, args.spectral_frame_size),
+    ) as pool:
+        for task, values in pool.imap_unordered(_run_task, tasks):
+            tracks = np.repeat(np.arange(task.first_track, task.first_track + task.track_count), task.window_count)
+            window_index = np.tile(np.arange(task.first_window, task.first_window + task.window_count), task.track_count)
+            values["track"] = tracks
+            values["window"] = window_index
+            values["start_sample"] = window_index * hop
+            values["start_sec"] = window_index * hop / args.sample_rate
+            first_rows = np.arange(task.first_track, task.first_track + task.track_count) * window_total + task.first_window
+            writer.write(first_rows, task.window_count, values)
+            done_rows += tracks.size
+
+            now = time.perf_counter()
+            if now - last_report >= args.progress_sec or done_rows == rows_total:
+                elapsed = now - started
+                rate = done_rows / elapsed if elapsed > 0 else 0.0
+                eta = (rows_total - done_rows) / rate if rate > 0 else 0.0
+                print(
+                    f"[batch] {done_rows}/{rows_total} windows ({done_rows / rows_total:.1%}) "
+                    f"{rate:.0f} windows/s {rate * sample_bytes_per_row / 2**20:.1f} MB/s "
+                    f"eta {eta:.1f}s rss {_rss_mb():.0f}MB",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                last_report = now
+    writer.close()
+    print(f"[batch] done in {time.perf_counter() - started:.2f}s -> {output}", file=sys.stderr, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .pipeline import SampleInput, as_sample_array
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Denoising chain applied to each track: DC removal, notches, then a band-pass.
+
+    ``bandpass_hz`` is ``(low, high)``; ``low <= 0`` makes it a low-pass and ``high >=
+    Nyquist`` a high-pass. ``bandpass_kind="iir"`` cascades Butterworth sections of
+    ``order`` per edge (rounded up to even); ``"fir"`` uses a ``fir_taps`` windowed-sinc
+    (linear phase, ``(fir_taps - 1) / 2`` samples of delay).
+    """
+
+    bandpass_hz: tuple[float, float] | None = None
+    bandpass_kind: str = "iir"
+    order: int = 4
+    fir_taps: int = 101
+    notch_hz: tuple[float, ...] = ()
+    notch_q: float = 30.0
+    dc_block: bool = True
+    dc_pole: float = 0.995
+
+
+@dataclass(frozen=True)
+class _StateSpace:
+    a: np.ndarray  # (m, m)
+    b: np.ndarray  # (m,)
+    c: np.ndarray  # (m,)
+    d: float
+
+
+def _biquad(b: Sequence[float], a: Sequence[float]) -> _StateSpace:
+    # Transposed direct form II as a 2-state system.
+    b0, b1, b2 = (value / a[0] for value in b)
+    a1, a2 = a[1] / a[0], a[2] / a[0]
+    return _StateSpace(
+        a=np.array([[-a1, 1.0], [-a2, 0.0]]),
+        b=np.array([b1 - a1 * b0, b2 - a2 * b0]),
+        c=np.array([1.0, 0.0]),
+        d=b0,
+    )
+
+
+def _series(first: _StateSpace, second: _StateSpace) -> _StateSpace:
+    m1, m2 = first.a.shape[0], second.a.shape[0]
+    a = np.zeros((m1 + m2, m1 + m2))
+    a[:m1, :m1] = first.a
+    a[m1:, :m1] = np.outer(second.b, first.c)
+    a[m1:, m1:] = second.a
+    return _StateSpace(
+        a=a,
+        b=np.concatenate((first.b, second.b * first.d)),
+        c=np.concatenate((second.d * first.c, second.c)),
+        d=second.d * first.d,
+    )
+
+
+def _rbj_section(kind: str, frequency_hz: float, q: float, sample_rate_hz: float) -> _StateSpace:
+    w0 = 2.0 * math.pi * frequency_hz / sample_rate_hz
+    cos_w0 = math.cos(w0)
+    alpha = math.sin(w0) / (2.0 * q)
+    a = (1.0 + alpha, -2.0 * cos_w0, 1.0 - alpha)
+    if kind == "lowpass":
+        b = ((1.0 - cos_w0) / 2.0, 1.0 - cos_w0, (1.0 - cos_w0) / 2.0)
+    elif kind == "highpass":
+        b = ((1.0 + cos_w0) / 2.0, -(1.0 + cos_w0), (1.0 + cos_w0) / 2.0)
+    else:  # notch
+        b = (1.0, -2.0 * cos_w0, 1.0)
+    return _biquad(b, a)
+
+
+def _butterworth_sections(kind: str, cutoff_hz: float, order: int, sample_rate_hz: float) -> list[_StateSpace]:
+    order = max(2, order + order % 2)
+    return [
+        _rbj_section(kind, cutoff_hz, 1.0 / (2.0 * math.sin((2 * k + 1) * math.pi / (2 * order))), sample_rate_hz)
+        for k in range(order // 2)
+    ]
+
+
+def _fir_bandpass(low_hz: float, high_hz: float, taps: int, sample_rate_hz: float) -> np.ndarray:
+    taps = taps + (1 - taps % 2)  # odd length keeps the delay an integer
+    n = np.arange(taps) - (taps - 1) / 2.0
+    low, high = low_hz / sample_rate_hz, min(high_hz, sample_rate_hz / 2.0) / sample_rate_hz
+    kernel = 2.0 * high * np.sinc(2.0 * high * n) - 2.0 * low * np.sinc(2.0 * low * n)
+    kernel *= np.hamming(taps)
+    # Unity gain at the band centre.
+    centre = (low + high) / 2.0
+    gain = abs(np.sum(kernel * np.exp(-2j * np.pi * centre * np.arange(taps))))
+    return kernel / gain if gain > 0 else kernel
+
+
+class FilterDesign:
+    """Precomputed block-processing matrices for one (sample rate, spec).
+
+    The IIR chain is merged into one state-space system so a block of ``L`` samples is two
+    matrix products per track batch: zero-state response ``x @ H.T`` plus the carried state's
+    response ``s @ O.T``; the next state is ``s @ A^L.T + x @ G.T``. State only steps once
+    per block, so the Python loop runs ``chunk / L`` times instead of once per sample.
+    """
+
+    def __init__(self, sample_rate_hz: float, spec: FilterSpec, block: int = 128) -> None:
+        nyquist = sample_rate_hz / 2.0
+        self.sample_rate_hz = sample_rate_hz
+        self.spec = spec
+        self.block = block
+
+        sections: list[_StateSpace] = []
+        if spec.dc_block:
+            sections.append(_biquad((1.0, -1.0, 0.0), (1.0, -spec.dc_pole, 0.0)))
+        for frequency in spec.notch_hz:
+            if not 0 < frequency < nyquist:
+                raise ValueError(f"notch frequency must be within (0, {nyquist}) Hz")
+            sections.append(_rbj_section("notch", frequency, spec.notch_q, sample_rate_hz))
+
+        self.fir: np.ndarray | None = None
+        if spec.bandpass_hz is not None:
+            low, high = spec.bandpass_hz
+            if low >= high or high <= 0 or low >= nyquist:
+                raise ValueError("bandpass_hz must satisfy low < high within (0, Nyquist)")
+            if spec.bandpass_kind == "fir":
+                self.fir = _fir_bandpass(max(low, 0.0), high, spec.fir_taps, sample_rate_hz)
+            elif spec.bandpass_kind == "iir":
+                if low > 0:
+                    sections.extend(_butterworth_sections("highpass", low, spec.order, sample_rate_hz))
+                if high < nyquist:
+                    sections.extend(_butterworth_sections("lowpass", high, spec.order, sample_rate_hz))
+            else:
+                raise ValueError(f"unknown bandpass_kind: {spec.bandpass_kind}")
+
+        self.state_size = 0
+        if sections:
+            system = sections[0]
+            for section in sections[1:]:
+                system = _series(system, section)
+            self._build_blocks(system)
+        self.fir_history = 0 if self.fir is None else self.fir.size - 1
+
+    def _build_blocks(self, system: _StateSpace) -> None:
+        size = self.block
+        m = system.a.shape[0]
+        powers = np.empty((size + 1, m, m))
+        powers[0] = np.eye(m)
+        for index in range(1, size + 1):
+            powers[index] = powers[index - 1] @ system.a
+        # impulse[k] = C A^(k-1) B, k >= 1
+        impulse = np.empty(size)
+        impulse[0] = system.d
+        impulse[1:] = powers[: size - 1] @ system.b @ system.c
+        rows = np.arange(size)
+        lags = rows[:, None] - rows[None, :]
+        self.h_t = np.where(lags >= 0, impulse[np.clip(lags, 0, None)], 0.0).T  # (L, L)
+        self.o_t = (system.c @ powers[:size]).T.copy()  # (m, L): column i = (C A^i)^T
+        self.g_t = (powers[size - 1 :: -1] @ system.b).copy()  # (L, m): row k = A^(L-1-k) B
+        self.powers_t = powers.transpose(0, 2, 1).copy()
+        self.state_size = m
+
+    def initial_state(self, tracks: int) -> tuple[np.ndarray, np.ndarray]:
+        return np.zeros((tracks, self.state_size)), np.zeros((tracks, self.fir_history))
+
+    def apply(self, x: np.ndarray, state: np.ndarray, history: np.ndarray) -> np.ndarray:
+        """Filter ``x`` (tracks x n) into a new array, advancing ``state``/``history`` in place."""
+        if x.shape[1] == 0:
+            return np.empty_like(x, dtype=np.float64)
+        y = x
+        if self.state_size:
+            y = self._apply_iir(x, state)
+        if self.fir is not None:
+            extended = np.concatenate((history, y), axis=1)
+            history[:] = extended[:, extended.shape[1] - self.fir_history :]
+            y = sliding_window_view(extended, self.fir.size, axis=1) @ self.fir[::-1]
+        return y
+
+    def _apply_iir(self, x: np.ndarray, state: np.ndarray) -> np.ndarray:
+        tracks, count = x.shape
+        size = self.block
+        full = count // size
+        out = np.empty((tracks, count))
+        if full:
+            blocks = x[:, : full * size].reshape(tracks, full, size)
+            zero_state = blocks @ self.h_t  # (T, nb, L)
+            drive = blocks @ self.g_t  # (T, nb, m)
+            starts = np.empty((tracks, full, self.state_size))
+            transition = self.powers_t[size]
+            for index in range(full):
+                starts[:, index] = state
+                state[:] = state @ transition + drive[:, index]
+            zero_state += starts @ self.o_t
+            out[:, : full * size] = zero_state.reshape(tracks, full * size)
+        rest = count - full * size
+        if rest:
+            tail = x[:, full * size :]
+            out[:, full * size :] = tail @ self.h_t[:rest, :rest] + state @ self.o_t[:, :rest]
+            state[:] = state @ self.powers_t[rest] + tail @ self.g_t[size - rest :]
+        return out
+
+
+@lru_cache(maxsize=64)
+def get_design(sample_rate_hz: float, spec: FilterSpec) -> FilterDesign:
+    return FilterDesign(float(sample_rate_hz), spec)
+
+
+class _TrackFilterState:
+    __slots__ = ("design", "state", "history")
+
+    def __init__(self, design: FilterDesign) -> None:
+        self.design = design
+        state, history = design.initial_state(1)
+        self.state = state[0]
+        self.history = history[0]
+
+
+class StreamingFilterBank:
+    """Per-track streaming filters whose state carries across chunks.
+
+    Each chunk costs O(chunk); tracks sharing a design (same sample rate and spec) are
+    filtered together by ``process_batch``. Designs are cached by ``(sample_rate_hz, spec)``.
+    Track state is bounded by ``max_tracks`` (least recently used evicted first).
+    """
+
+    def __init__(self, spec: FilterSpec, max_tracks: int = 1024) -> None:
+        self.spec = spec
+        self.max_tracks = max_tracks
+        self._tracks: OrderedDict[str, _TrackFilterState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def _track(self, track_id: str, sample_rate_hz: float) -> _TrackFilterState:
+        design = get_design(float(sample_rate_hz), self.spec)
+        track = self._tracks.get(track_id)
+        if track is None or track.design is not design:
+            # New track or a rate change: old state belongs to a different filter.
+            track = _TrackFilterState(design)
+            self._tracks[track_id] = track
+        self._tracks.move_to_end(track_id)
+        while len(self._tracks) > self.max_tracks:
+            self._tracks.popitem(last=False)
+        return track
+
+    def process(self, track_id: str, samples: SampleInput, sample_rate_hz: float, dtype: Any = None) -> np.ndarray:
+        chunk = np.asarray(as_sample_array(samples, dtype).reshape(1, -1), dtype=np.float64)
+        return self.process_batch([track_id], chunk, sample_rate_hz)[0]
+
+    def process_batch(self, track_ids: Sequence[str], block: SampleInput, sample_rate_hz: float, dtype: Any = None) -> np.ndarray:
+        """Filter one chunk per track (``len(track_ids) x n``) sharing ``sample_rate_hz``."""
+        if sample_rate_hz <= 0:
+            raise ValueError("sample_rate_hz must be > 0")
+        x = np.asarray(as_sample_array(block, dtype), dtype=np.float64).reshape(len(track_ids), -1)
+        tracks = [self._track(track_id, sample_rate_hz) for track_id in track_ids]
+        design = tracks[0].design if tracks else get_design(float(sample_rate_hz), self.spec)
+        state = np.array([track.state for track in tracks]).reshape(len(tracks), design.state_size)
+        history = np.array([track.history for track in tracks]).reshape(len(tracks), design.fir_history)
+        y = design.apply(x, state, history)
+        for index, track in enumerate(tracks):
+            track.state = state[index]
+            track.history = history[index]
+        return y
+
+    def drop(self, track_id: str) -> None:
+        self._tracks.pop(track_id, None)
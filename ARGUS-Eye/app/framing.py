@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import math
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Mapping, Union
+
+import numpy as np
+
+# Binary track frame ("AEF1"), little-endian. See contracts/track-frame.binary.md.
+#
+#   0  4s  magic            b"AEF1"
+#   4  B   version          1
+#   5  B   dtype code       1 = float32, 2 = int16
+#   6  H   trackId length   UTF-8 bytes, >= 1
+#   8  I   meta length      UTF-8 JSON object bytes, 0 = no meta
+#  12  Q   timestampMs
+#  20  d   sampleRateHz     > 0
+#  28  I   sample count
+#  32      trackId, meta, zero padding to a 4-byte boundary, samples
+FRAME_MAGIC = b"AEF1"
+FRAME_VERSION = 1
+_HEADER = struct.Struct("<4sBBHIQdI")
+HEADER_SIZE = _HEADER.size
+
+DTYPE_CODES: dict[int, np.dtype] = {
+    1: np.dtype("<f4"),
+    2: np.dtype("<i2"),
+}
+_CODE_BY_DTYPE = {dtype: code for code, dtype in DTYPE_CODES.items()}
+
+_MAX_TIMESTAMP_MS = 2**63 - 1
+_NUMBER_TYPES = (int, float)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class FrameError(ValueError):
+    pass
+
+
+@dataclass
+class BinaryTrackFrame:
+    track_id: str
+    timestamp_ms: int
+    sample_rate_hz: float
+    samples: np.ndarray
+    meta: dict[str, Any] | None = field(default=None)
+
+    def as_frame(self) -> dict[str, Any]:
+        """Schema-shaped dict; ``samples`` stays an ndarray view (no list conversion)."""
+        frame: dict[str, Any] = {
+            "trackId": self.track_id,
+            "timestampMs": self.timestamp_ms,
+            "sampleRateHz": self.sample_rate_hz,
+            "samples": self.samples,
+        }
+        if self.meta is not None:
+            frame["meta"] = self.meta
+        return frame
+
+
+def _padding(offset: int) -> int:
+    return -offset % 4
+
+
+def encode_frame(
+    track_id: str,
+    timestamp_ms: int,
+    sample_rate_hz: float,
+    samples: Any,
+    dtype: Any = "<f4",
+    meta: Mapping[str, Any] | None = None,
+) -> bytes:
+    sample_dtype = np.dtype(dtype).newbyteorder("<")
+    code = _CODE_BY_DTYPE.get(sample_dtype)
+    if code is None:
+        raise FrameError(f"unsupported sample dtype: {dtype}")
+    track_bytes = str(track_id).encode("utf-8")
+    if not track_bytes or len(track_bytes) > 0xFFFF:
+        raise FrameError("trackId must be 1..65535 UTF-8 bytes")
+    if not 0 <= int(timestamp_ms) <= _MAX_TIMESTAMP_MS:
+        raise FrameError("timestampMs must be a non-negative int64")
+    if not (math.isfinite(sample_rate_hz) and sample_rate_hz > 0):
+        raise FrameError("sampleRateHz must be > 0")
+    meta_bytes = json.dumps(dict(meta), separators=(",", ":")).encode("utf-8") if meta is not None else b""
+
+    values = np.asarray(samples)
+    if sample_dtype.kind == "i" and values.dtype.kind == "f":
+        values = np.clip(np.rint(values), np.iinfo(sample_dtype).min, np.iinfo(sample_dtype).max)
+    payload = np.ascontiguousarray(values.reshape(-1), dtype=sample_dtype)
+
+    header = _HEADER.pack(
+        FRAME_MAGIC,
+        FRAME_VERSION,
+        code,
+        len(track_bytes),
+        len(meta_bytes),
+        int(timestamp_ms),
+        float(sample_rate_hz),
+        payload.size,
+    )
+    prefix_size = HEADER_SIZE + len(track_bytes) + len(meta_bytes)
+    return b"".join((header, track_bytes, meta_bytes, b"\x00" * _padding(prefix_size), payload.tobytes()))
+
+
+def frame_length(header: Buffer) -> int:
+    """Total size of the frame whose 32-byte header is given (for stream readers)."""
+    if memoryview(header).nbytes < HEADER_SIZE:
+        raise FrameError("truncated frame header")
+    magic, version, code, track_len, meta_len, _, _, count = _HEADER.unpack_from(header)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise FrameError("bad frame magic or version")
+    sample_dtype = DTYPE_CODES.get(code)
+    if sample_dtype is None:
+        raise FrameError(f"unsupported dtype code: {code}")
+    prefix_size = HEADER_SIZE + track_len + meta_len
+    return prefix_size + _padding(prefix_size) + count * sample_dtype.itemsize
+
+
+def decode_frame(buffer: Buffer, offset: int = 0) -> tuple[BinaryTrackFrame, int]:
+    """Decode one frame at ``offset``; returns the frame and the offset just past it.
+
+    ``samples`` is a read-only view into ``buffer`` (zero copy), so keep the buffer alive
+    while the frame is in use. Raises ``FrameError`` on any contract violation.
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) - offset < HEADER_SIZE:
+        raise FrameError("truncated frame header")
+    magic, version, code, track_len, meta_len, timestamp_ms, sample_rate_hz, count = _HEADER.unpack_from(
+        view, offset
+    )
+    if magic != FRAME_MAGIC:
+        raise FrameError("bad frame magic")
+    if version != FRAME_VERSION:
+        raise FrameError(f"unsupported frame version: {version}")
+    sample_dtype = DTYPE_CODES.get(code)
+    if sample_dtype is None:
+        raise FrameError(f"unsupported dtype code: {code}")
+    if track_len == 0:
+        raise FrameError("trackId must not be empty")
+    if timestamp_ms > _MAX_TIMESTAMP_MS:
+        raise FrameError("timestampMs out of range")
+    if not (math.isfinite(sample_rate_hz) and sample_rate_hz > 0):
+        raise FrameError("sampleRateHz must be > 0")
+
+    cursor = offset + HEADER_SIZE
+    samples_at = cursor + track_len + meta_len
+    samples_at += _padding(samples_at - offset)
+    end = samples_at + count * sample_dtype.itemsize
+    if end > len(view):
+        raise FrameError("truncated frame body")
+
+    try:
+        track_id = bytes(view[cursor : cursor + track_len]).decode("utf-8")
+    except UnicodeDecodeError as error:
+        raise FrameError("trackId is not valid UTF-8") from error
+    cursor += track_len
+    meta = None
+    if meta_len:
+        try:
+            meta = json.loads(bytes(view[cursor : cursor + meta_len]))
+        except ValueError as error:
+            raise FrameError("meta is not valid JSON") from error
+        if not isinstance(meta, dict):
+            raise FrameError("meta must be a JSON object")
+
+    samples = np.frombuffer(view, dtype=sample_dtype, count=count, offset=samples_at)
+    return BinaryTrackFrame(track_id, timestamp_ms, sample_rate_hz, samples, meta), end
+
+
+def iter_frames(buffer: Buffer) -> Iterator[BinaryTrackFrame]:
+    """Decode back-to-back frames (e.g. one socket read or file) without copying samples."""
+    offset = 0
+    size = memoryview(buffer).nbytes
+    while offset < size:
+        frame, offset = decode_frame(buffer, offset)
+        yield frame
+
+
+def validate_frame(frame: Any) -> list[str]:
+    """Check a decoded JSON frame against ``track-frame.schema.json``; returns error messages.
+
+    Hand-written equivalent of the schema (required keys, types, ``minLength``, ``minimum``,
+    ``exclusiveMinimum``, numeric ``samples`` items, object ``meta``). Booleans are not
+    numbers, as in JSON Schema. An ndarray ``samples`` (e.g. from ``as_frame``) is accepted
+    when its dtype is numeric.
+    """
+    if not isinstance(frame, dict):
+        return ["frame must be an object"]
+    errors: list[str] = []
+    for key in ("trackId", "timestampMs", "samples", "sampleRateHz"):
+        if key not in frame:
+            errors.append(f"missing required property: {key}")
+
+    track_id = frame.get("trackId")
+    if "trackId" in frame and (not isinstance(track_id, str) or not track_id):
+        errors.append("trackId must be a non-empty string")
+
+    timestamp_ms = frame.get("timestampMs")
+    if "timestampMs" in frame:
+        is_integer = type(timestamp_ms) is int or (type(timestamp_ms) is float and timestamp_ms.is_integer())
+        if not is_integer or timestamp_ms < 0:
+            errors.append("timestampMs must be an integer >= 0")
+
+    sample_rate_hz = frame.get("sampleRateHz")
+    if "sampleRateHz" in frame and (type(sample_rate_hz) not in _NUMBER_TYPES or not sample_rate_hz > 0):
+        errors.append("sampleRateHz must be a number > 0")
+
+    if "samples" in frame:
+        samples = frame["samples"]
+        if isinstance(samples, np.ndarray):
+            if samples.dtype.kind not in "iuf":
+                errors.append("samples must be numeric")
+        elif not isinstance(samples, list):
+            errors.append("samples must be an array")
+        else:
+            # Set of item types is built in C; only the rare bad frame pays for the slow path.
+            item_types = set(map(type, samples))
+            if not item_types <= {int, float}:
+                errors.append("samples items must be numbers")
+
+    if "meta" in frame and not isinstance(frame["meta"], dict):
+        errors.append("meta must be an object")
+    return errors
+
+
+def frame_from_json(payload: str | bytes) -> dict[str, Any]:
+    """Parse and validate a JSON track frame; raises ``FrameError``."""
+    try:
+        frame = json.loads(payload)
+    except ValueError as error:
+        raise FrameError(f"invalid JSON: {error}") from error
+    errors = validate_frame(frame)
+    if errors:
+        raise FrameError("; ".join(errors))
+    return frame
+
+
+def read_frame(payload: Buffer | str) -> dict[str, Any]:
+    """Accept either wire format and return a validated, schema-shaped frame dict.
+
+    Binary frames are detected by their magic; their ``samples`` stay zero-copy views.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)) and bytes(memoryview(payload)[:4]) == FRAME_MAGIC:
+        frame, _ = decode_frame(payload)
+        return frame.as_frame()
+    return frame_from_json(payload)
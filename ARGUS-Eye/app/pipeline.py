@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import sqrt
-from typing import Sequence
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+from .framing import BinaryTrackFrame, decode_frame
+
+# Anything exposing the buffer protocol (bytes, memoryview, array.array, ndarray) or a plain sequence.
+SampleInput = Union[bytes, bytearray, memoryview, np.ndarray, Sequence[float]]
+
+FEATURE_KEYS: tuple[str, ...] = (
+    "sample_count",
+    "sample_rate_hz",
+    "mean",
+    "rms",
+    "peak_to_peak",
+    "zero_crossing_rate",
+)
 
 
 @dataclass
@@ -15,15 +30,95 @@ class SignalSummary:
     zero_crossing_rate: float
 
 
+def as_sample_array(samples: SampleInput, dtype: Any = None) -> np.ndarray:
+    """View ``samples`` as a 1-D/2-D ndarray without copying when the input allows it.
+
+    Raw ``bytes``/``bytearray`` carry no element type, so ``dtype`` (default little-endian
+    float64) says how to interpret them. Typed buffers (memoryview, array.array, ndarray)
+    keep their own element type unless ``dtype`` is given.
+    """
+    if isinstance(samples, np.ndarray):
+        return samples if dtype is None else samples.astype(dtype, copy=False)
+    if isinstance(samples, (bytes, bytearray)):
+        return np.frombuffer(samples, dtype=np.dtype(dtype or "<f8"))
+    if isinstance(samples, memoryview) and samples.format in {"B", "b", "c"} and dtype is not None:
+        return np.frombuffer(samples, dtype=np.dtype(dtype))
+    array = np.asarray(samples)
+    if array.dtype == object:
+        array = np.asarray(samples, dtype=np.float64)
+    return array if dtype is None else array.astype(dtype, copy=False)
+
+
+def summarize_block(block: np.ndarray, sample_rate_hz: np.ndarray | float) -> dict[str, np.ndarray]:
+    """Compute time-domain features for every row of a ``tracks x samples`` block.
+
+    Sums are accumulated left to right (``cumsum``) so results are bit-identical to the
+    sequential reference implementation rather than NumPy's pairwise ``sum``.
+    """
+    if block.ndim != 2:
+        raise ValueError("block must be 2-D (tracks x samples)")
+    rates = np.broadcast_to(np.asarray(sample_rate_hz, dtype=np.float64), (block.shape[0],))
+    if np.any(rates <= 0):
+        raise ValueError("sample_rate_hz must be > 0")
+
+    tracks, count = block.shape
+    if count == 0:
+        zeros = np.zeros(tracks, dtype=np.float64)
+        return {
+            "sample_count": zeros.copy(),
+            "sample_rate_hz": rates.astype(np.float64),
+            "mean": zeros.copy(),
+            "rms": zeros.copy(),
+            "peak_to_peak": zeros.copy(),
+            "zero_crossing_rate": zeros,
+        }
+
+    # One float64 work buffer reused for both running sums.
+    work = np.empty(block.shape, dtype=np.float64)
+    np.cumsum(block, axis=1, dtype=np.float64, out=work)
+    mean = work[:, -1] / count
+    np.multiply(block, block, out=work, dtype=np.float64)
+    np.cumsum(work, axis=1, out=work)
+    rms = np.sqrt(work[:, -1] / count)
+
+    peak_to_peak = block.max(axis=1).astype(np.float64) - block.min(axis=1).astype(np.float64)
+
+    prev = block[:, :-1]
+    curr = block[:, 1:]
+    crossings = np.count_nonzero(
+        ((prev < 0) & (curr >= 0)) | ((prev > 0) & (curr <= 0)),
+        axis=1,
+    )
+    duration_sec = count / rates
+
+    return {
+        "sample_count": np.full(tracks, float(count)),
+        "sample_rate_hz": rates.astype(np.float64),
+        "mean": mean,
+        "rms": rms,
+        "peak_to_peak": peak_to_peak,
+        "zero_crossing_rate": crossings / duration_sec,
+    }
+
+
+def _row_features(features: dict[str, np.ndarray], row: int) -> dict[str, float]:
+    return {key: float(features[key][row]) for key in FEATURE_KEYS}
+
+
 class ArgusEyeProcessor:
     """Lightweight signal feature extractor for ARGUS-Eye."""
 
-    def extract_track_features(self, samples: Sequence[float], sample_rate_hz: float) -> dict[str, float]:
+    def extract_track_features(
+        self,
+        samples: SampleInput,
+        sample_rate_hz: float,
+        dtype: Any = None,
+    ) -> dict[str, float]:
         if sample_rate_hz <= 0:
             raise ValueError("sample_rate_hz must be > 0")
 
-        values = [float(sample) for sample in samples]
-        if not values:
+        values = as_sample_array(samples, dtype).reshape(-1)
+        if values.size == 0:
             return {
                 "sample_count": 0.0,
                 "sample_rate_hz": float(sample_rate_hz),
@@ -33,28 +128,14 @@ class ArgusEyeProcessor:
                 "zero_crossing_rate": 0.0,
             }
 
-        count = len(values)
-        mean = sum(values) / count
-        rms = sqrt(sum(value * value for value in values) / count)
-        peak_to_peak = max(values) - min(values)
-
-        crossings = 0
-        for index in range(1, count):
-            prev = values[index - 1]
-            curr = values[index]
-            if (prev < 0 <= curr) or (prev > 0 >= curr):
-                crossings += 1
-
-        duration_sec = count / sample_rate_hz
-        zcr = crossings / duration_sec if duration_sec > 0 else 0.0
-
+        features = summarize_block(values.reshape(1, -1), sample_rate_hz)
         summary = SignalSummary(
-            sample_count=count,
+            sample_count=int(values.size),
             sample_rate_hz=float(sample_rate_hz),
-            mean=mean,
-            rms=rms,
-            peak_to_peak=peak_to_peak,
-            zero_crossing_rate=zcr,
+            mean=float(features["mean"][0]),
+            rms=float(features["rms"][0]),
+            peak_to_peak=float(features["peak_to_peak"][0]),
+            zero_crossing_rate=float(features["zero_crossing_rate"][0]),
         )
 
         return {
@@ -65,3 +146,27 @@ class ArgusEyeProcessor:
             "peak_to_peak": summary.peak_to_peak,
             "zero_crossing_rate": summary.zero_crossing_rate,
         }
+
+    def extract_batch_features(
+        self,
+        block: SampleInput,
+        sample_rate_hz: float | Sequence[float],
+        dtype: Any = None,
+        track_samples: int | None = None,
+    ) -> list[dict[str, float]]:
+        """Extract features for a ``tracks x samples`` block in one vectorized pass.
+
+        ``block`` may be any 2-D array-like, or a flat buffer plus ``track_samples`` (the
+        row length). ``sample_rate_hz`` is either shared or one rate per track.
+        """
+        array = as_sample_array(block, dtype)
+        if track_samples is not None:
+            array = array.reshape(-1, track_samples)
+        features = summarize_block(array, np.asarray(sample_rate_hz, dtype=np.float64))
+        return [_row_features(features, row) for row in range(array.shape[0])]
+
+    def extract_frame_features(self, frame: BinaryTrackFrame | bytes | bytearray | memoryview) -> dict[str, float]:
+        """Features for one binary track frame, read straight from the wire buffer."""
+        if not isinstance(frame, BinaryTrackFrame):
+            frame, _ = decode_frame(frame)
+        return self.extract_track_features(frame.samples, frame.sample_rate_hz)
@@ -0,0 +1,133 @@
+"""ARGUS-Eye feature service.
+
+Accepts back-to-back binary (``AEF1``) track frames over TCP, extracts features on a
+multiprocess worker pool and writes one JSON line per result. Run from the ARGUS-Eye
+directory:
+
+    python -m app.service --workers 4 --port 9410
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import threading
+from typing import Any, TextIO
+
+from .framing import HEADER_SIZE, FrameError, frame_length
+from .workers import EyeWorkerPool
+
+
+def _write_results(pool: EyeWorkerPool, output: TextIO, stop: threading.Event) -> None:
+    while not stop.is_set():
+        result = pool.get_result(timeout=0.2)
+        if result is None:
+            continue
+        output.write(json.dumps(result, separators=(",", ":")) + "\n")
+        output.flush()
+
+
+async def _handle_connection(
+    pool: EyeWorkerPool,
+    submit_timeout_sec: float,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    peer = writer.get_extra_info("peername")
+    try:
+        while True:
+            header = await reader.readexactly(HEADER_SIZE)
+            length = frame_length(header)
+            if length > pool.max_frame_bytes:
+                # Decide from the header alone: a peer must not make us buffer a huge body.
+                pool.oversized += 1
+                pool.input_dropped += 1
+                raise FrameError(f"frame of {length} bytes exceeds the {pool.max_frame_bytes}-byte slot")
+            body = await reader.readexactly(length - HEADER_SIZE)
+            payload = header + body
+            if submit_timeout_sec > 0:
+                # Waiting for a slot blocks; keep the event loop serving other connections.
+                await asyncio.to_thread(pool.submit_frame, payload, submit_timeout_sec)
+            else:
+                pool.submit_frame(payload)
+    except asyncio.IncompleteReadError:
+        pass
+    except FrameError as error:
+        # The stream is out of sync; there is no way to find the next frame boundary.
+        print(f"[eye] closing {peer}: {error}", file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+
+
+async def _report_stats(pool: EyeWorkerPool, interval_sec: float) -> None:
+    while True:
+        await asyncio.sleep(interval_sec)
+        stats: dict[str, Any] = pool.stats()
+        stats.pop("perWorker")
+        print(f"[eye] {json.dumps(stats, separators=(',', ':'))}", file=sys.stderr, flush=True)
+
+
+async def _serve(args: argparse.Namespace, pool: EyeWorkerPool) -> None:
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_connection(pool, args.submit_timeout_ms / 1000.0, reader, writer),
+        host=args.host,
+        port=args.port,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+    reporter = asyncio.create_task(_report_stats(pool, args.stats_interval_sec)) if args.stats_interval_sec > 0 else None
+    print(f"[eye] listening on {args.host}:{args.port} with {pool.worker_count} workers", file=sys.stderr, flush=True)
+    async with server:
+        await stop.wait()
+    if reporter is not None:
+        reporter.cancel()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=os.getenv("ARGUS_EYE_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("ARGUS_EYE_PORT", "9410")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("ARGUS_EYE_WORKERS", "0")), help="0 = cores - 1")
+    parser.add_argument("--slots", type=int, default=256, help="shared-memory ring slots")
+    parser.add_argument("--slot-kib", type=int, default=128, help="max encoded frame size per slot")
+    parser.add_argument("--output-capacity", type=int, default=4096)
+    parser.add_argument("--output-timeout-ms", type=float, default=0.0, help="worker wait for output room before dropping")
+    parser.add_argument("--submit-timeout-ms", type=float, default=0.0, help="ingest wait for a free slot before dropping")
+    parser.add_argument("--spectral-frame-size", type=int, default=0, help="add STFT features (0 = off)")
+    parser.add_argument("--stats-interval-sec", type=float, default=5.0)
+    parser.add_argument("--output", default="-", help="JSON lines output path ('-' = stdout)")
+    args = parser.parse_args()
+
+    output = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    pool = EyeWorkerPool(
+        workers=args.workers or None,
+        slots=args.slots,
+        slot_bytes=args.slot_kib * 1024,
+        output_capacity=args.output_capacity,
+        output_timeout_sec=args.output_timeout_ms / 1000.0,
+        spectral_frame_size=args.spectral_frame_size,
+    )
+    pool.start()
+    stop_writer = threading.Event()
+    writer_thread = threading.Thread(target=_write_results, args=(pool, output, stop_writer), daemon=True)
+    writer_thread.start()
+    try:
+        asyncio.run(_serve(args, pool))
+    finally:
+        stop_writer.set()
+        writer_thread.join(1.0)
+        pool.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
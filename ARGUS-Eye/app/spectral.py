@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .pipeline import SampleInput, as_sample_array
+
+# Default analysis bands as fractions of Nyquist: body/bulk Doppler, low and high micro-Doppler.
+DEFAULT_RELATIVE_BANDS: tuple[tuple[float, float], ...] = (
+    (0.0, 0.05),
+    (0.05, 0.15),
+    (0.15, 0.35),
+    (0.35, 1.0),
+)
+
+_WINDOWS = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "rect": np.ones,
+}
+
+
+@lru_cache(maxsize=32)
+def get_window(name: str, size: int) -> np.ndarray:
+    if name not in _WINDOWS:
+        raise ValueError(f"unknown window: {name}")
+    window = np.asarray(_WINDOWS[name](size), dtype=np.float64)
+    window.setflags(write=False)
+    return window
+
+
+@lru_cache(maxsize=64)
+def _bin_frequencies(frame_size: int, sample_rate_hz: float) -> np.ndarray:
+    freqs = np.fft.rfftfreq(frame_size, d=1.0 / sample_rate_hz)
+    freqs.setflags(write=False)
+    return freqs
+
+
+class SpectralFeatureEngine:
+    """Batched STFT micro-Doppler features for ``tracks x samples`` blocks.
+
+    Frames are strided views of the input (no copy); windowing, power and envelope
+    buffers are reused across calls with the same shape, and window functions / bin
+    frequency tables are cached. An engine instance is not thread-safe: give each worker
+    its own.
+
+    Features per track:
+
+    - ``spectral_centroid_hz`` / ``spectral_bandwidth_hz`` / ``spectral_entropy`` of the
+      frame-averaged power spectrum (DC removed per frame)
+    - ``band_energy_<i>``: share of power in each analysis band
+    - ``dominant_freq_hz_<k>`` / ``dominant_power_ratio_<k>``: strongest spectral peaks
+      (rotor blade lines show up here)
+    - ``modulation_freq_hz`` / ``modulation_depth``: dominant periodicity of the
+      frame-energy envelope (blade flash / wing beat rate) and its relative amplitude
+    """
+
+    def __init__(
+        self,
+        frame_size: int = 256,
+        hop: int | None = None,
+        window: str = "hann",
+        bands_hz: Sequence[tuple[float, float]] | None = None,
+        top_k: int = 3,
+    ) -> None:
+        if frame_size < 8:
+            raise ValueError("frame_size must be >= 8")
+        self.frame_size = frame_size
+        self.hop = hop or frame_size // 2
+        if self.hop <= 0:
+            raise ValueError("hop must be > 0")
+        self.window_name = window
+        self.window = get_window(window, frame_size)
+        self.bands_hz = tuple(bands_hz) if bands_hz else None
+        self.top_k = top_k
+        self._buffers: dict[tuple[str, tuple[int, ...]], np.ndarray] = {}
+
+    def _buffer(self, name: str, shape: tuple[int, ...]) -> np.ndarray:
+        key = (name, shape)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            if len(self._buffers) > 32:
+                # Shapes change with track count; don't let a long tail of shapes pile up.
+                self._buffers.clear()
+            buffer = self._buffers[key] = np.empty(shape, dtype=np.float64)
+        return buffer
+
+    def _band_slices(self, sample_rate_hz: float, bins: int) -> list[slice]:
+        freqs = _bin_frequencies(self.frame_size, sample_rate_hz)
+        nyquist = sample_rate_hz / 2.0
+        bands = self.bands_hz or tuple((lo * nyquist, hi * nyquist) for lo, hi in DEFAULT_RELATIVE_BANDS)
+        slices: list[slice] = []
+        for index, (low, high) in enumerate(bands):
+            start = int(np.searchsorted(freqs, low, side="left"))
+            # The last default band includes the Nyquist bin.
+            side = "right" if index == len(bands) - 1 else "left"
+            stop = int(np.searchsorted(freqs, high, side=side))
+            slices.append(slice(max(1, start), min(bins, stop)))
+        return slices
+
+    def feature_names(self) -> list[str]:
+        band_count = len(self.bands_hz or DEFAULT_RELATIVE_BANDS)
+        names = ["spectral_centroid_hz", "spectral_bandwidth_hz", "spectral_entropy"]
+        names += [f"band_energy_{index}" for index in range(band_count)]
+        for rank in range(1, self.top_k + 1):
+            names += [f"dominant_freq_hz_{rank}", f"dominant_power_ratio_{rank}"]
+        names += ["modulation_freq_hz", "modulation_depth"]
+        return names
+
+    def compute_block(self, block: np.ndarray, sample_rate_hz: float) -> dict[str, np.ndarray]:
+        """Spectral features for every row of a 2-D block sharing one sample rate."""
+        if sample_rate_hz <= 0:
+            raise ValueError("sample_rate_hz must be > 0")
+        if block.ndim != 2:
+            raise ValueError("block must be 2-D (tracks x samples)")
+        if block.shape[1] < self.frame_size:
+            raise ValueError(f"need at least frame_size={self.frame_size} samples per track")
+
+        tracks = block.shape[0]
+        frames_view = sliding_window_view(block, self.frame_size, axis=1)[:, :: self.hop]
+        frame_count = frames_view.shape[1]
+
+        frames = self._buffer("frames", frames_view.shape)
+        np.copyto(frames, frames_view, casting="unsafe")
+        frames -= frames.mean(axis=2, keepdims=True)
+        frames *= self.window
+
+        spectrum = np.fft.rfft(frames, axis=2)
+        power = self._buffer("power", spectrum.shape)
+        scratch = self._buffer("scratch", spectrum.shape)
+        np.multiply(spectrum.real, spectrum.real, out=power)
+        np.multiply(spectrum.imag, spectrum.imag, out=scratch)
+        power += scratch
+
+        bins = power.shape[2]
+        freqs = _bin_frequencies(self.frame_size, float(sample_rate_hz))
+        mean_power = power.mean(axis=1)
+        mean_power[:, 0] = 0.0
+        total = mean_power.sum(axis=1)
+        safe_total = np.where(total > 0, total, 1.0)
+
+        centroid = (mean_power @ freqs) / safe_total
+        spread = (mean_power * (freqs[None, :] - centroid[:, None]) ** 2).sum(axis=1) / safe_total
+        distribution = mean_power[:, 1:] / safe_total[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entropy_terms = np.where(distribution > 0, distribution * np.log(distribution), 0.0)
+        entropy = -entropy_terms.sum(axis=1) / np.log(max(bins - 1, 2))
+
+        features: dict[str, np.ndarray] = {
+            "spectral_centroid_hz": centroid,
+            "spectral_bandwidth_hz": np.sqrt(spread),
+            "spectral_entropy": entropy,
+        }
+        for index, band in enumerate(self._band_slices(float(sample_rate_hz), bins)):
+            features[f"band_energy_{index}"] = mean_power[:, band].sum(axis=1) / safe_total
+
+        # Local maxima of the averaged spectrum, strongest first.
+        inner = mean_power[:, 1:-1]
+        is_peak = (inner > mean_power[:, :-2]) & (inner >= mean_power[:, 2:])
+        scores = np.where(is_peak, inner, -np.inf)
+        k = min(self.top_k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k > 0 else np.zeros((tracks, 0), dtype=int)
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        valid = np.isfinite(top_scores)
+        for rank in range(self.top_k):
+            if rank < k:
+                freq = np.where(valid[:, rank], freqs[top[:, rank] + 1], 0.0)
+                ratio = np.where(valid[:, rank], top_scores[:, rank], 0.0) / safe_total
+            else:
+                freq = ratio = np.zeros(tracks)
+            features[f"dominant_freq_hz_{rank + 1}"] = freq
+            features[f"dominant_power_ratio_{rank + 1}"] = ratio
+
+        if frame_count >= 4:
+            envelope = power[:, :, 1:].sum(axis=2)
+            envelope_mean = envelope.mean(axis=1)
+            envelope -= envelope_mean[:, None]
+            envelope_spectrum = np.abs(np.fft.rfft(envelope, axis=1))
+            envelope_spectrum[:, 0] = 0.0
+            peak_bin = envelope_spectrum.argmax(axis=1)
+            # Depth = amplitude of the dominant envelope harmonic relative to the mean envelope.
+            amplitude = 2.0 * envelope_spectrum[np.arange(tracks), peak_bin] / frame_count
+            frame_rate_hz = sample_rate_hz / self.hop
+            features["modulation_freq_hz"] = peak_bin * frame_rate_hz / frame_count
+            features["modulation_depth"] = np.where(
+                envelope_mean > 0, amplitude / np.where(envelope_mean > 0, envelope_mean, 1.0), 0.0
+            )
+        else:
+            features["modulation_freq_hz"] = np.zeros(tracks)
+            features["modulation_depth"] = np.zeros(tracks)
+        return features
+
+    def extract_batch_features(
+        self,
+        block: SampleInput,
+        sample_rate_hz: float,
+        dtype: Any = None,
+        track_samples: int | None = None,
+    ) -> list[dict[str, float]]:
+        array = as_sample_array(block, dtype)
+        if track_samples is not None:
+            array = array.reshape(-1, track_samples)
+        features = self.compute_block(array, sample_rate_hz)
+        names = self.feature_names()
+        return [{name: float(features[name][row]) for name in names} for row in range(array.shape[0])]
+
+    def extract_track_features(self, samples: SampleInput, sample_rate_hz: float, dtype: Any = None) -> dict[str, float]:
+        values = as_sample_array(samples, dtype).reshape(1, -1)
+        return self.extract_batch_features(values, sample_rate_hz)[0]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .filters import FilterSpec, StreamingFilterBank
+from .framing import BinaryTrackFrame, decode_frame
+from .pipeline import SampleInput, as_sample_array
+
+
+class _MonotonicWindowMax:
+    """Sliding-window maximum as a monotonic deque kept in NumPy arrays.
+
+    Values are strictly decreasing from front to back, so a chunk is merged by cutting
+    the dominated tail with one ``searchsorted`` and appending the chunk's suffix maxima.
+    """
+
+    def __init__(self) -> None:
+        self.values = np.empty(0, dtype=np.float64)
+        self.indices = np.empty(0, dtype=np.int64)
+
+    def push(self, chunk: np.ndarray, first_index: int, window_start: int) -> None:
+        # Entries <= the chunk max can never be the window max again.
+        keep = int(np.searchsorted(-self.values, -chunk.max(), side="left"))
+        suffix_max = np.maximum.accumulate(chunk[::-1])[::-1]
+        candidates = np.flatnonzero(np.append(chunk[:-1] > suffix_max[1:], True))
+        values = np.concatenate((self.values[:keep], chunk[candidates]))
+        indices = np.concatenate((self.indices[:keep], candidates + first_index))
+        expired = int(np.searchsorted(indices, window_start, side="left"))
+        self.values = values[expired:]
+        self.indices = indices[expired:]
+
+    @property
+    def current(self) -> float:
+        return float(self.values[0])
+
+
+class _TrackStream:
+    def __init__(self, window_samples: int, sample_rate_hz: float) -> None:
+        self.window_samples = window_samples
+        self.sample_rate_hz = sample_rate_hz
+        self.ring = np.zeros(window_samples, dtype=np.float64)
+        # crossing[i % W] is 1 when samples i-1 and i straddle zero.
+        self.crossing = np.zeros(window_samples, dtype=np.int8)
+        self.total = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.crossing_count = 0
+        self.since_resync = 0
+        self.last_sample = 0.0
+        self.maximum = _MonotonicWindowMax()
+        self.minimum = _MonotonicWindowMax()
+        self.last_seen = time.monotonic()
+        self.last_timestamp_ms: int | None = None
+
+    @property
+    def window_start(self) -> int:
+        return max(0, self.total - self.window_samples)
+
+    def push(self, chunk: np.ndarray) -> None:
+        size = self.window_samples
+        if chunk.size > size:
+            # Everything before the chunk tail leaves the window at once: restart it from the
+            # tail, keeping the preceding sample for the boundary zero crossing.
+            self.last_sample = float(chunk[-size - 1])
+            self.total += chunk.size - size
+            chunk = chunk[-size:]
+            self._reset_window()
+
+        count = chunk.size
+        if count == 0:
+            return
+        first = self.total
+        old_start = self.window_start
+        new_start = max(0, first + count - size)
+
+        prev = np.empty(count, dtype=np.float64)
+        prev[0] = self.last_sample
+        prev[1:] = chunk[:-1]
+        crossing = (((prev < 0) & (chunk >= 0)) | ((prev > 0) & (chunk <= 0))).astype(np.int8)
+        if first == 0:
+            crossing[0] = 0
+
+        expired = new_start - old_start
+        if expired > 0:
+            expired_slots = np.arange(old_start, new_start) % size
+            old_values = self.ring[expired_slots]
+            self.sum -= float(old_values.sum())
+            self.sum_sq -= float(np.dot(old_values, old_values))
+            self.crossing_count -= int(self.crossing[expired_slots].sum())
+
+        slots = np.arange(first, first + count) % size
+        self.ring[slots] = chunk
+        self.crossing[slots] = crossing
+        self.sum += float(chunk.sum())
+        self.sum_sq += float(np.dot(chunk, chunk))
+        self.crossing_count += int(crossing.sum())
+        self.total += count
+        self.last_sample = float(chunk[-1])
+
+        self.maximum.push(chunk, first, self.window_start)
+        self.minimum.push(-chunk, first, self.window_start)
+
+        self.since_resync += count
+        if self.since_resync >= size:
+            # Re-derive running sums from the ring so floating-point drift stays bounded.
+            self._resync()
+
+    def _reset_window(self) -> None:
+        self.ring.fill(0.0)
+        self.crossing.fill(0)
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.crossing_count = 0
+        self.maximum = _MonotonicWindowMax()
+        self.minimum = _MonotonicWindowMax()
+
+    def _resync(self) -> None:
+        count = self.total - self.window_start
+        slots = np.arange(self.window_start, self.total) % self.window_samples
+        values = self.ring[slots]
+        self.sum = float(values.sum())
+        self.sum_sq = float(np.dot(values, values))
+        self.crossing_count = int(self.crossing[slots].sum()) if count else 0
+        self.since_resync = 0
+
+    def features(self) -> dict[str, float]:
+        count = self.total - self.window_start
+        if count == 0:
+            return {
+                "sample_count": 0.0,
+                "sample_rate_hz": float(self.sample_rate_hz),
+                "mean": 0.0,
+                "rms": 0.0,
+                "peak_to_peak": 0.0,
+                "zero_crossing_rate": 0.0,
+            }
+        # The oldest sample's crossing flag pairs it with a sample that already left the window.
+        crossings = self.crossing_count - int(self.crossing[self.window_start % self.window_samples])
+        return {
+            "sample_count": float(count),
+            "sample_rate_hz": float(self.sample_rate_hz),
+            "mean": self.sum / count,
+            "rms": float(np.sqrt(max(self.sum_sq, 0.0) / count)),
+            "peak_to_peak": self.maximum.current + self.minimum.current,
+            "zero_crossing_rate": crossings / (count / self.sample_rate_hz),
+        }
+
+
+class StreamingArgusEyeProcessor:
+    """Per-track sliding-window feature extractor for chunked sample streams.
+
+    Each track keeps a fixed ``window_samples`` ring plus running sums, sliding min/max and
+    zero-crossing counts, so a chunk updates its features in O(chunk) instead of
+    re-processing the whole window. Memory is bounded per track (``window_samples``) and in
+    track count (``max_tracks``, least recently updated evicted first); tracks silent for
+    ``idle_timeout_sec`` are dropped by ``evict_idle``. With ``filter_spec`` set, each chunk
+    is denoised by a ``StreamingFilterBank`` (state carried per track) before it enters the
+    window.
+    """
+
+    def __init__(
+        self,
+        window_samples: int = 4096,
+        idle_timeout_sec: float = 10.0,
+        max_tracks: int = 1024,
+        filter_spec: FilterSpec | None = None,
+    ) -> None:
+        if window_samples <= 0:
+            raise ValueError("window_samples must be > 0")
+        self.window_samples = window_samples
+        self.idle_timeout_sec = idle_timeout_sec
+        self.max_tracks = max_tracks
+        self._tracks: OrderedDict[str, _TrackStream] = OrderedDict()
+        self.filters = StreamingFilterBank(filter_spec, max_tracks=max_tracks) if filter_spec is not None else None
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._tracks
+
+    def push(
+        self,
+        track_id: str,
+        samples: SampleInput,
+        sample_rate_hz: float,
+        timestamp_ms: int | None = None,
+        dtype: Any = None,
+    ) -> dict[str, float]:
+        if sample_rate_hz <= 0:
+            raise ValueError("sample_rate_hz must be > 0")
+
+        stream = self._tracks.get(track_id)
+        if stream is None or stream.sample_rate_hz != sample_rate_hz:
+            # A rate change invalidates the window: samples are no longer comparable.
+            stream = _TrackStream(self.window_samples, float(sample_rate_hz))
+            self._tracks[track_id] = stream
+        self._tracks.move_to_end(track_id)
+        while len(self._tracks) > self.max_tracks:
+            evicted, _ = self._tracks.popitem(last=False)
+            if self.filters is not None:
+                self.filters.drop(evicted)
+
+        chunk = np.asarray(as_sample_array(samples, dtype).reshape(-1), dtype=np.float64)
+        if self.filters is not None:
+            chunk = self.filters.process(track_id, chunk, sample_rate_hz)
+        stream.push(chunk)
+        stream.last_seen = time.monotonic()
+        if timestamp_ms is not None:
+            stream.last_timestamp_ms = int(timestamp_ms)
+        return stream.features()
+
+    def push_frame(self, frame: dict[str, Any] | BinaryTrackFrame | bytes | bytearray | memoryview) -> dict[str, float]:
+        """Feed one ``track-frame.schema.json`` frame, or a binary (``AEF1``) frame."""
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            frame, _ = decode_frame(frame)
+        if isinstance(frame, BinaryTrackFrame):
+            return self.push(frame.track_id, frame.samples, frame.sample_rate_hz, timestamp_ms=frame.timestamp_ms)
+        return self.push(
+            str(frame["trackId"]),
+            frame["samples"],
+            float(frame["sampleRateHz"]),
+            timestamp_ms=frame.get("timestampMs"),
+        )
+
+    def features(self, track_id: str) -> dict[str, float] | None:
+        stream = self._tracks.get(track_id)
+        return stream.features() if stream is not None else None
+
+    def drop(self, track_id: str) -> None:
+        self._tracks.pop(track_id, None)
+        if self.filters is not None:
+            self.filters.drop(track_id)
+
+    def evict_idle(self, now: float | None = None) -> list[str]:
+        cutoff = (time.monotonic() if now is None else now) - self.idle_timeout_sec
+        evicted = [track_id for track_id, stream in self._tracks.items() if stream.last_seen < cutoff]
+        for track_id in evicted:
+            self.drop(track_id)
+        return evicted
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from .framing import decode_frame, encode_frame
+from .pipeline import ArgusEyeProcessor, SampleInput
+from .spectral import SpectralFeatureEngine
+
+# Per-worker counters live in the shared segment, one int64 row per worker; each worker only
+# writes its own row, so no locking is needed.
+_STAT_FIELDS = ("processed", "errors", "outputDropped", "busyUs")
+_SLOT_HEADER = struct.Struct("<II")  # frame length, reserved (keeps frames 8-byte aligned)
+
+
+def _align(value: int, boundary: int = 8) -> int:
+    return (value + boundary - 1) // boundary * boundary
+
+
+class _SharedLayout:
+    def __init__(self, workers: int, slots: int, slot_bytes: int) -> None:
+        self.workers = workers
+        self.slots = slots
+        self.slot_bytes = _align(slot_bytes)
+        self.stats_bytes = _align(workers * len(_STAT_FIELDS) * 8)
+        self.total_bytes = self.stats_bytes + self.slots * self.slot_bytes
+
+    def stats(self, buffer: memoryview) -> np.ndarray:
+        return np.ndarray((self.workers, len(_STAT_FIELDS)), dtype=np.int64, buffer=buffer[: self.stats_bytes])
+
+    def slot_offset(self, slot: int) -> int:
+        return self.stats_bytes + slot * self.slot_bytes
+
+
+def _worker_main(
+    worker_id: int,
+    shm_name: str,
+    layout_args: tuple[int, int, int],
+    ready_queue: Any,
+    free_queue: Any,
+    output_queue: Any,
+    output_timeout_sec: float,
+    spectral_frame_size: int,
+) -> None:
+    layout = _SharedLayout(*layout_args)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffer = shm.buf
+    stats = layout.stats(buffer)[worker_id]
+    processor = ArgusEyeProcessor()
+    spectral = SpectralFeatureEngine(frame_size=spectral_frame_size) if spectral_frame_size > 0 else None
+    frame = None
+
+    try:
+        while True:
+            slot = ready_queue.get()
+            if slot is None:
+                break
+            started = time.perf_counter_ns()
+            offset = layout.slot_offset(slot)
+            length, _ = _SLOT_HEADER.unpack_from(buffer, offset)
+            result: dict[str, Any] | None = None
+            try:
+                frame, _ = decode_frame(buffer[offset : offset + _SLOT_HEADER.size + length], _SLOT_HEADER.size)
+                features = processor.extract_track_features(frame.samples, frame.sample_rate_hz)
+                if spectral is not None and frame.samples.size >= spectral.frame_size:
+                    features.update(spectral.extract_track_features(frame.samples, frame.sample_rate_hz))
+                result = {
+                    "trackId": frame.track_id,
+                    "timestampMs": frame.timestamp_ms,
+                    "workerId": worker_id,
+                    "features": features,
+                }
+            except Exception:
+                # A bad frame or an extractor failure only costs this frame, never the worker.
+                stats[1] += 1
+            # The slot is only reusable once nothing references its memory.
+            frame = None
+            free_queue.put(slot)
+            if result is not None:
+                try:
+                    if output_timeout_sec > 0:
+                        output_queue.put(result, timeout=output_timeout_sec)
+                    else:
+                        output_queue.put_nowait(result)
+                    stats[0] += 1
+                except queue.Full:
+                    stats[2] += 1
+            stats[3] += (time.perf_counter_ns() - started) // 1000
+    except KeyboardInterrupt:
+        pass
+    finally:
+        frame = None
+        del stats
+        buffer.release()
+        shm.close()
+
+
+class EyeWorkerPool:
+    """Process pool that extracts features from frames staged in a shared-memory ring.
+
+    The producer copies each binary (``AEF1``) frame into a free fixed-size slot of one
+    ``multiprocessing.shared_memory`` segment and enqueues only the slot index; workers
+    decode the frame in place (zero copy), run the extractor, return the slot and publish a
+    small feature dict on a bounded output queue.
+
+    Backpressure: ``submit`` waits up to ``timeout`` for a free slot, then drops the frame
+    (``inputDropped``). Workers wait up to ``output_timeout_sec`` for room on the output
+    queue, then drop the result (``outputDropped``); a slow consumer therefore fills the
+    ring and surfaces as input drops rather than unbounded memory.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        slots: int = 256,
+        slot_bytes: int = 128 * 1024,
+        output_capacity: int = 4096,
+        output_timeout_sec: float = 0.0,
+        spectral_frame_size: int = 0,
+    ) -> None:
+        self.worker_count = workers or max(1, (multiprocessing.cpu_count() or 2) - 1)
+        if slots <= 0 or slot_bytes <= _SLOT_HEADER.size:
+            raise ValueError("slots and slot_bytes must be > 0")
+        self.layout = _SharedLayout(self.worker_count, slots, slot_bytes)
+        self.output_capacity = output_capacity
+        self.output_timeout_sec = output_timeout_sec
+        self.spectral_frame_size = spectral_frame_size
+        self.submitted = 0
+        self.input_dropped = 0
+        self.oversized = 0
+        self.blocked_sec = 0.0
+        self._shm: shared_memory.SharedMemory | None = None
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._started_at = 0.0
+
+    @property
+    def max_frame_bytes(self) -> int:
+        return self.layout.slot_bytes - _SLOT_HEADER.size
+
+    def start(self) -> None:
+        if self._shm is not None:
+            return
+        context = multiprocessing.get_context("spawn")
+        self._shm = shared_memory.SharedMemory(create=True, size=self.layout.total_bytes)
+        self._buffer = self._shm.buf
+        self._stats = self.layout.stats(self._buffer)
+        self._stats.fill(0)
+        self._ready: Any = context.Queue()
+        self._free: Any = context.Queue()
+        self.output: Any = context.Queue(maxsize=self.output_capacity)
+        for slot in range(self.layout.slots):
+            self._free.put(slot)
+        layout_args = (self.layout.workers, self.layout.slots, self.layout.slot_bytes)
+        for worker_id in range(self.worker_count):
+            process = context.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    self._shm.name,
+                    layout_args,
+                    self._ready,
+                    self._free,
+                    self.output,
+                    self.output_timeout_sec,
+                    self.spectral_frame_size,
+                ),
+                name=f"argus-eye-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        self._started_at = time.monotonic()
+
+    def submit_frame(self, payload: bytes | bytearray | memoryview, timeout: float = 0.0) -> bool:
+        """Stage one encoded binary frame; returns False when it was dropped."""
+        if self._shm is None:
+            raise RuntimeError("pool is not started")
+        length = memoryview(payload).nbytes
+        if length > self.max_frame_bytes:
+            self.oversized += 1
+            self.input_dropped += 1
+            return False
+        started = time.monotonic()
+        try:
+            slot = self._free.get(timeout=timeout) if timeout > 0 else self._free.get_nowait()
+        except queue.Empty:
+            self.input_dropped += 1
+            return False
+        finally:
+            self.blocked_sec += time.monotonic() - started
+        offset = self.layout.slot_offset(slot)
+        _SLOT_HEADER.pack_into(self._buffer, offset, length, 0)
+        start = offset + _SLOT_HEADER.size
+        self._buffer[start : start + length] = payload
+        self._ready.put(slot)
+        self.submitted += 1
+        return True
+
+    def submit(
+        self,
+        track_id: str,
+        timestamp_ms: int,
+        sample_rate_hz: float,
+        samples: SampleInput,
+        dtype: Any = "<f4",
+        timeout: float = 0.0,
+    ) -> bool:
+        return self.submit_frame(encode_frame(track_id, timestamp_ms, sample_rate_hz, samples, dtype), timeout)
+
+    def get_result(self, timeout: float | None = None) -> dict[str, Any] | None:
+        try:
+            return self.output.get(timeout=timeout) if timeout != 0 else self.output.get_nowait()
+        except queue.Empty:
+            return None
+
+    def drain(self, max_items: int = 1024) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        while len(results) < max_items:
+            result = self.get_result(timeout=0)
+            if result is None:
+                break
+            results.append(result)
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        totals = self._stats.sum(axis=0) if self._shm is not None else np.zeros(len(_STAT_FIELDS), dtype=np.int64)
+        per_worker = self._stats.tolist() if self._shm is not None else []
+        completed = int(totals[0] + totals[1] + totals[2])
+        uptime = max(time.monotonic() - self._started_at, 1e-9) if self._started_at else 0.0
+        return {
+            "workers": self.worker_count,
+            "workersAlive": sum(1 for process in self._processes if process.is_alive()),
+            "slots": self.layout.slots,
+            "slotBytes": self.layout.slot_bytes,
+            "submitted": self.submitted,
+            "inFlight": max(0, self.submitted - completed),
+            "processed": int(totals[0]),
+            "errors": int(totals[1]),
+            "inputDropped": self.input_dropped,
+            "oversized": self.oversized,
+            "outputDropped": int(totals[2]),
+            "submitBlockedMs": round(self.blocked_sec * 1000.0, 3),
+            "framesPerSec": round(int(totals[0]) / uptime, 1) if uptime else 0.0,
+            "perWorker": [
+                {"workerId": index, **{field: int(value) for field, value in zip(_STAT_FIELDS, row)}}
+                for index, row in enumerate(per_worker)
+            ],
+        }
+
+    def close(self, timeout_sec: float = 2.0) -> None:
+        if self._shm is None:
+            return
+        for _ in self._processes:
+            self._ready.put(None)
+        deadline = time.monotonic() + timeout_sec
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(0.5)
+        self._processes.clear()
+        for channel in (self._ready, self._free, self.output):
+            channel.cancel_join_thread()
+            channel.close()
+        del self._stats
+        self._buffer.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "EyeWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,94 @@
+"""Time-domain feature extraction benchmark.
+
+Run from the ARGUS-Eye directory:
+
+    python -m benchmarks.bench_features
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from math import sqrt
+from typing import Callable, Sequence
+
+import numpy as np
+
+from app.pipeline import ArgusEyeProcessor
+
+
+def reference_features(samples: Sequence[float], sample_rate_hz: float) -> dict[str, float]:
+    """The original pure-Python implementation, kept as the correctness/speed baseline."""
+    values = [float(sample) for sample in samples]
+    count = len(values)
+    mean = sum(values) / count
+    rms = sqrt(sum(value * value for value in values) / count)
+    peak_to_peak = max(values) - min(values)
+    crossings = 0
+    for index in range(1, count):
+        prev = values[index - 1]
+        curr = values[index]
+        if (prev < 0 <= curr) or (prev > 0 >= curr):
+            crossings += 1
+    return {
+        "sample_count": float(count),
+        "sample_rate_hz": float(sample_rate_hz),
+        "mean": mean,
+        "rms": rms,
+        "peak_to_peak": peak_to_peak,
+        "zero_crossing_rate": crossings / (count / sample_rate_hz),
+    }
+
+
+def _time_per_call(func: Callable[[], object], min_seconds: float) -> float:
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=64)
+    parser.add_argument("--sample-counts", type=int, nargs="+", default=[256, 1024, 4096, 16384])
+    parser.add_argument("--sample-rate", type=float, default=2000.0)
+    parser.add_argument("--min-seconds", type=float, default=0.3)
+    args = parser.parse_args()
+
+    processor = ArgusEyeProcessor()
+    rng = np.random.default_rng(7)
+    print(f"{'samples':>8} {'dtype':>7} {'python/track':>14} {'numpy/track':>13} {'batch/track':>13} {'speedup':>8}")
+
+    for count in args.sample_counts:
+        for dtype in ("float32", "int16"):
+            block = (rng.standard_normal((args.tracks, count)) * 1000.0).astype(dtype)
+            rows_as_lists = block.tolist()
+            for row, values in zip(block, rows_as_lists):
+                if processor.extract_track_features(row, args.sample_rate) != reference_features(
+                    values, args.sample_rate
+                ):
+                    raise SystemExit(f"mismatch against reference at {count} samples ({dtype})")
+
+            python_sec = _time_per_call(
+                lambda: [reference_features(values, args.sample_rate) for values in rows_as_lists],
+                args.min_seconds,
+            ) / args.tracks
+            numpy_sec = _time_per_call(
+                lambda: [processor.extract_track_features(row, args.sample_rate) for row in block],
+                args.min_seconds,
+            ) / args.tracks
+            batch_sec = _time_per_call(
+                lambda: processor.extract_batch_features(block, args.sample_rate),
+                args.min_seconds,
+            ) / args.tracks
+            print(
+                f"{count:>8} {dtype:>7} {python_sec * 1e6:>12.1f}us {numpy_sec * 1e6:>11.1f}us "
+                f"{batch_sec * 1e6:>11.1f}us {python_sec / batch_sec:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
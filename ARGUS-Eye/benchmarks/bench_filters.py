@@ -0,0 +1,46 @@
+"""Streaming filter bank throughput benchmark.
+
+Run from the ARGUS-Eye directory:
+
+    python -m benchmarks.bench_filters
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from app.filters import FilterSpec, StreamingFilterBank
+from benchmarks.bench_features import _time_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=64)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[128, 512, 2048])
+    parser.add_argument("--sample-rate", type=float, default=8000.0)
+    parser.add_argument("--min-seconds", type=float, default=0.3)
+    args = parser.parse_args()
+
+    specs = {
+        "dc": FilterSpec(),
+        "dc+notch+bp-iir4": FilterSpec(bandpass_hz=(50.0, 2000.0), notch_hz=(60.0,)),
+        "bp-iir8": FilterSpec(bandpass_hz=(50.0, 2000.0), order=8, dc_block=False),
+        "bp-fir101": FilterSpec(bandpass_hz=(50.0, 2000.0), bandpass_kind="fir", dc_block=False),
+    }
+    rng = np.random.default_rng(7)
+    track_ids = [f"T-{index:04d}" for index in range(args.tracks)]
+    print(f"{'spec':>18} {'chunk':>6} {'batch':>10} {'per track':>10} {'Msamples/s':>11}")
+    for name, spec in specs.items():
+        for chunk in args.chunk_sizes:
+            block = rng.standard_normal((args.tracks, chunk))
+            bank = StreamingFilterBank(spec)
+            call_sec = _time_per_call(lambda: bank.process_batch(track_ids, block, args.sample_rate), args.min_seconds)
+            print(
+                f"{name:>18} {chunk:>6} {call_sec * 1e3:>8.2f}ms {call_sec / args.tracks * 1e6:>8.1f}us "
+                f"{args.tracks * chunk / call_sec / 1e6:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
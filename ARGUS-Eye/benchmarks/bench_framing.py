@@ -0,0 +1,65 @@
+"""JSON vs. binary (AEF1) track frame size and decode-time comparison.
+
+Run from the ARGUS-Eye directory:
+
+    python -m benchmarks.bench_framing
+"""
+from __future__ import annotations
+
+import argparse
+import json
+
+import numpy as np
+
+from app.framing import decode_frame, encode_frame, frame_from_json
+from app.pipeline import ArgusEyeProcessor
+from benchmarks.bench_features import _time_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample-counts", type=int, nargs="+", default=[256, 1024, 4096, 16384])
+    parser.add_argument("--sample-rate", type=float, default=2000.0)
+    parser.add_argument("--min-seconds", type=float, default=0.3)
+    args = parser.parse_args()
+
+    processor = ArgusEyeProcessor()
+    rng = np.random.default_rng(7)
+    print(
+        f"{'samples':>8} {'dtype':>7} {'json B':>9} {'binary B':>9} {'ratio':>6} "
+        f"{'json decode':>12} {'bin decode':>11} {'json+feat':>11} {'bin+feat':>10} {'speedup':>8}"
+    )
+    for count in args.sample_counts:
+        for dtype in ("<f4", "<i2"):
+            raw = rng.standard_normal(count) * 1000.0
+            samples = raw.astype(np.float32) if dtype == "<f4" else np.rint(raw).astype(np.int16)
+            json_payload = json.dumps(
+                {"trackId": "T-0001", "timestampMs": 1_700_000_000_000, "sampleRateHz": args.sample_rate,
+                 "samples": samples.tolist()}
+            ).encode("utf-8")
+            binary_payload = encode_frame("T-0001", 1_700_000_000_000, args.sample_rate, samples, dtype=dtype)
+
+            json_frame = frame_from_json(json_payload)
+            binary_frame, _ = decode_frame(binary_payload)
+            if processor.extract_track_features(json_frame["samples"], args.sample_rate) != (
+                processor.extract_frame_features(binary_frame)
+            ):
+                raise SystemExit(f"feature mismatch at {count} samples ({dtype})")
+
+            json_decode = _time_per_call(lambda: frame_from_json(json_payload), args.min_seconds)
+            binary_decode = _time_per_call(lambda: decode_frame(binary_payload), args.min_seconds)
+            json_total = _time_per_call(
+                lambda: processor.extract_track_features(frame_from_json(json_payload)["samples"], args.sample_rate),
+                args.min_seconds,
+            )
+            binary_total = _time_per_call(lambda: processor.extract_frame_features(binary_payload), args.min_seconds)
+            print(
+                f"{count:>8} {np.dtype(dtype).name:>7} {len(json_payload):>9} {len(binary_payload):>9} "
+                f"{len(json_payload) / len(binary_payload):>5.1f}x {json_decode * 1e6:>10.1f}us "
+                f"{binary_decode * 1e6:>9.1f}us {json_total * 1e6:>9.1f}us {binary_total * 1e6:>8.1f}us "
+                f"{json_total / binary_total:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Worker pool throughput scaling and backpressure benchmark.
+
+Run from the ARGUS-Eye directory:
+
+    python -m benchmarks.bench_pool
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from app.framing import encode_frame
+from app.workers import EyeWorkerPool
+
+
+def _run(workers: int, frames: list[bytes], spectral_frame_size: int, submit_timeout: float) -> dict:
+    with EyeWorkerPool(workers=workers, spectral_frame_size=spectral_frame_size) as pool:
+        # Let spawned workers finish importing before timing.
+        pool.submit_frame(frames[0], timeout=5.0)
+        if pool.get_result(timeout=30.0) is None:
+            raise SystemExit("workers did not start")
+        received = 0
+        started = time.perf_counter()
+        for payload in frames:
+            pool.submit_frame(payload, timeout=submit_timeout)
+            received += len(pool.drain())
+        accepted = pool.submitted - 1
+        while received < accepted - pool.stats()["outputDropped"]:
+            if pool.get_result(timeout=5.0) is None:
+                break
+            received += 1
+        elapsed = time.perf_counter() - started
+        stats = pool.stats()
+    return {"elapsed": elapsed, "received": received, "stats": stats}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--frames", type=int, default=4000)
+    parser.add_argument("--samples", type=int, default=4096)
+    parser.add_argument("--sample-rate", type=float, default=8000.0)
+    parser.add_argument("--spectral-frame-size", type=int, default=256)
+    parser.add_argument("--submit-timeout", type=float, default=1.0, help="0 = never wait (measure drops)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    blocks = rng.standard_normal((64, args.samples)).astype(np.float32)
+    frames = [
+        encode_frame(f"T-{index % 64:04d}", index, args.sample_rate, blocks[index % 64])
+        for index in range(args.frames)
+    ]
+    print(f"{'workers':>7} {'frames/s':>10} {'received':>9} {'in drop':>8} {'out drop':>9} {'blocked':>10}")
+    for workers in args.workers:
+        run = _run(workers, frames, args.spectral_frame_size, args.submit_timeout)
+        stats = run["stats"]
+        print(
+            f"{workers:>7} {run['received'] / run['elapsed']:>10.0f} {run['received']:>9} "
+            f"{stats['inputDropped']:>8} {stats['outputDropped']:>9} {stats['submitBlockedMs']:>8.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
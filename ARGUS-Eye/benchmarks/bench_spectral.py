@@ -0,0 +1,59 @@
+"""STFT micro-Doppler feature throughput benchmark.
+
+Run from the ARGUS-Eye directory:
+
+    python -m benchmarks.bench_spectral
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from app.spectral import SpectralFeatureEngine
+from benchmarks.bench_features import _time_per_call
+
+
+def _synthetic_block(rng: np.random.Generator, tracks: int, count: int, sample_rate: float) -> np.ndarray:
+    """Rotor-like returns: carrier with blade-flash amplitude modulation plus noise."""
+    t = np.arange(count) / sample_rate
+    carriers = rng.uniform(0.05, 0.4, size=(tracks, 1)) * sample_rate
+    flash = rng.uniform(5.0, 60.0, size=(tracks, 1))
+    signal = (1.0 + 0.6 * np.sin(2 * np.pi * flash * t)) * np.sin(2 * np.pi * carriers * t)
+    return (signal + 0.1 * rng.standard_normal((tracks, count))).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=64)
+    parser.add_argument("--sample-rates", type=float, nargs="+", default=[2000.0, 8000.0, 20000.0])
+    parser.add_argument("--frame-sizes", type=int, nargs="+", default=[128, 256, 512, 1024])
+    parser.add_argument("--window-sec", type=float, default=0.5, help="signal length analysed per track")
+    parser.add_argument("--target-fps", type=float, default=10.0)
+    parser.add_argument("--min-seconds", type=float, default=0.3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    print(
+        f"{'rate':>8} {'frame':>6} {'samples':>8} {'stfts':>6} {'per call':>10} "
+        f"{'per track':>10} {'tracks/s':>10} {'frame budget':>13}"
+    )
+    for sample_rate in args.sample_rates:
+        count = int(sample_rate * args.window_sec)
+        block = _synthetic_block(rng, args.tracks, count, sample_rate)
+        for frame_size in args.frame_sizes:
+            if frame_size > count:
+                continue
+            engine = SpectralFeatureEngine(frame_size=frame_size)
+            engine.compute_block(block, sample_rate)  # warm caches and buffers
+            stfts = (count - frame_size) // engine.hop + 1
+            call_sec = _time_per_call(lambda: engine.compute_block(block, sample_rate), args.min_seconds)
+            budget_pct = call_sec * args.target_fps * 100.0
+            print(
+                f"{sample_rate:>8.0f} {frame_size:>6} {count:>8} {stfts:>6} {call_sec * 1e3:>8.2f}ms "
+                f"{call_sec / args.tracks * 1e6:>8.1f}us {args.tracks / call_sec:>10.0f} {budget_pct:>12.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
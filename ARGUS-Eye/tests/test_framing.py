@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.framing import HEADER_SIZE, FrameError, decode_frame, encode_frame, frame_length, iter_frames
+
+
+def test_float32_round_trip_with_meta():
+    samples = np.linspace(-1.0, 1.0, 257, dtype=np.float32)
+    payload = encode_frame("트랙-7", 1_700_000_000_000, 8000.0, samples, meta={"sensor": "n"})
+    frame, end = decode_frame(payload)
+    assert end == len(payload) == frame_length(payload[:HEADER_SIZE])
+    assert frame.track_id == "트랙-7"
+    assert frame.timestamp_ms == 1_700_000_000_000
+    assert frame.sample_rate_hz == 8000.0
+    assert frame.meta == {"sensor": "n"}
+    np.testing.assert_array_equal(frame.samples, samples)
+
+
+def test_int16_rounds_and_clips_float_input():
+    payload = encode_frame("T-1", 0, 1000.0, [0.4, 1.6, -40000.0, 40000.0], dtype="<i2")
+    frame, _ = decode_frame(payload)
+    assert frame.samples.dtype == np.dtype("<i2")
+    assert frame.samples.tolist() == [0, 2, -32768, 32767]
+    assert frame.meta is None
+
+
+def test_samples_are_aligned_and_zero_copy():
+    payload = bytearray(encode_frame("odd", 1, 100.0, [1.0, 2.0, 3.0]))
+    frame, _ = decode_frame(payload)
+    offset = frame.samples.ctypes.data - np.frombuffer(payload, dtype=np.uint8).ctypes.data
+    assert offset % 4 == 0
+    payload[offset : offset + 4] = np.float32(9.0).tobytes()
+    assert frame.samples[0] == 9.0
+
+
+def test_iter_frames_reads_back_to_back_frames():
+    stream = b"".join(encode_frame(f"T-{index}", index, 100.0, [float(index)] * index) for index in range(1, 5))
+    frames = list(iter_frames(stream))
+    assert [frame.track_id for frame in frames] == ["T-1", "T-2", "T-3", "T-4"]
+    assert [frame.samples.size for frame in frames] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"track_id": ""},
+        {"track_id": "x" * 0x10000},
+        {"timestamp_ms": -1},
+        {"sample_rate_hz": 0.0},
+        {"sample_rate_hz": float("nan")},
+        {"dtype": "<f8"},
+    ],
+)
+def test_encode_rejects_contract_violations(kwargs):
+    arguments = {"track_id": "T-1", "timestamp_ms": 0, "sample_rate_hz": 100.0, "samples": [0.0]}
+    arguments.update(kwargs)
+    with pytest.raises(FrameError):
+        encode_frame(**arguments)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda payload: payload[: HEADER_SIZE - 1],
+        lambda payload: payload[:-1],
+        lambda payload: b"AEF2" + payload[4:],
+        lambda payload: payload[:5] + b"\x09" + payload[6:],
+    ],
+)
+def test_decode_rejects_corrupt_frames(corrupt):
+    with pytest.raises(FrameError):
+        decode_frame(corrupt(encode_frame("T-1", 0, 100.0, [0.0, 1.0])))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from app.framing import HEADER_SIZE, encode_frame, frame_length
+from app.service import _handle_connection
+from app.workers import EyeWorkerPool
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def get_extra_info(self, name: str) -> str:
+        return "test-peer"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _run_connection(pool: EyeWorkerPool, payload: bytes) -> _Writer:
+    async def run() -> _Writer:
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        reader.feed_eof()
+        writer = _Writer()
+        await asyncio.wait_for(_handle_connection(pool, 0.0, reader, writer), timeout=2.0)
+        return writer
+
+    return asyncio.run(run())
+
+
+def test_frame_length_comes_from_the_header_alone():
+    payload = encode_frame("T-1", 0, 8000.0, np.zeros(1000, dtype=np.float32))
+    assert frame_length(payload[:HEADER_SIZE]) == len(payload)
+
+
+def test_oversized_frame_is_rejected_before_its_body_is_read():
+    pool = EyeWorkerPool(workers=1, slots=2, slot_bytes=1024)
+    header = encode_frame("T-1", 0, 8000.0, np.zeros(4096, dtype=np.float32))[:HEADER_SIZE]
+    # Only the header is sent: the connection must close without waiting for the body.
+    writer = _run_connection(pool, header)
+    assert writer.closed
+    assert pool.oversized == 1
+    assert pool.input_dropped == 1
+
+
+def test_oversized_submit_is_dropped_and_pool_keeps_working():
+    with EyeWorkerPool(workers=1, slots=2, slot_bytes=4096) as pool:
+        big = encode_frame("T-big", 0, 8000.0, np.zeros(4096, dtype=np.float32))
+        assert not pool.submit_frame(big)
+        assert pool.oversized == 1
+
+        small = encode_frame("T-small", 0, 8000.0, np.sin(np.arange(256, dtype=np.float32)))
+        assert pool.submit_frame(small, timeout=1.0)
+        result = pool.get_result(timeout=30.0)
+        assert result is not None
+        assert result["trackId"] == "T-small"
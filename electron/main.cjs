@@ -754,6 +754,8 @@ const startInferenceService = () => {
     RADAR_TRACK_RESET_GAP_MS: String(runtimeConfig.trackResetGapMs || 10000),
     RADAR_MODEL_PATH: String(runtimeConfig.modelPath || ''),
     RADAR_ACTIVE_MODEL_ID: String(runtimeConfig.activeModelId || 'heuristic-default'),
+    RADAR_SNAPSHOT_PATH: path.join(app.getPath('userData'), 'brain-track-snapshot.bin'),
+    RADAR_SPAWNED_AT_MS: String(Date.now()),
     RADAR_TOD_ENABLED: runtimeConfig.todEnabled ? '1' : '0',
     RADAR_TOD_MODEL_PATH: String(runtimeConfig.todModelPath || ''),
     RADAR_TOD_ACTIVE_MODEL_ID: String(runtimeConfig.todActiveModelId || 'tod-unset'),
@@ -800,6 +802,7 @@ const startInferenceService = () => {
   runtimeState.infer.pid = typeof child.pid === 'number' ? child.pid : null;
   runtimeState.infer.restarts += 1;
   broadcastRuntimeStatus();
+  probeStartupHealth(child);
 
   child.stdout.on('data', (chunk) => {
     pushLog('info', chunk.toString().trim());
@@ -834,29 +837,46 @@ const startInferenceService = () => {
   });
 };
 
+const checkInferenceHealth = async () => {
+  try {
+    const response = await fetch(inferHealthUrl(), { method: 'GET' });
+    const payload = await response.json();
+    // A failed startup answers 503 with status "failed"; never report it as healthy.
+    const healthy = response.ok && payload?.status !== 'failed';
+    runtimeState.health.ok = healthy;
+    runtimeState.health.lastCheckedAt = new Date().toISOString();
+    runtimeState.health.lastResponseAt = new Date().toISOString();
+    runtimeState.health.error = healthy ? null : payload?.lastError || `HTTP ${response.status}`;
+    runtimeState.health.payload = payload;
+    if (healthy) {
+      restartAttempts = 0;
+    }
+  } catch (error) {
+    runtimeState.health.ok = false;
+    runtimeState.health.lastCheckedAt = new Date().toISOString();
+    runtimeState.health.error = error.message;
+  }
+  broadcastRuntimeStatus();
+  return runtimeState.health.ok;
+};
+
+// Probe quickly right after spawn so the console connects as soon as /healthz answers
+// (the service reports "warming" while it finishes loading) instead of on the next 2s tick.
+const probeStartupHealth = async (child) => {
+  const deadline = Date.now() + 15000;
+  while (inferProc === child && Date.now() < deadline) {
+    if (await checkInferenceHealth()) {
+      return;
+    }
+    await new Promise((resolve) => setTimeout(resolve, 100));
+  }
+};
+
 const startHealthMonitor = () => {
   if (healthInterval) {
     clearInterval(healthInterval);
   }
-  healthInterval = setInterval(async () => {
-    try {
-      const response = await fetch(inferHealthUrl(), { method: 'GET' });
-      const payload = await response.json();
-      runtimeState.health.ok = response.ok;
-      runtimeState.health.lastCheckedAt = new Date().toISOString();
-      runtimeState.health.lastResponseAt = new Date().toISOString();
-      runtimeState.health.error = response.ok ? null : `HTTP ${response.status}`;
-      runtimeState.health.payload = payload;
-      if (response.ok) {
-        restartAttempts = 0;
-      }
-    } catch (error) {
-      runtimeState.health.ok = false;
-      runtimeState.health.lastCheckedAt = new Date().toISOString();
-      runtimeState.health.error = error.message;
-    }
-    broadcastRuntimeStatus();
-  }, 2000);
+  healthInterval = setInterval(checkInferenceHealth, 2000);
 };
 
 const stopResourceMonitor = () => {